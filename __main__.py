@@ -1,26 +1,30 @@
-import os
-import sys
-import pygame
+import time
+
+START_TIME = time.perf_counter()  # 시작 시간 측정 기준임(다른 import보다 먼저 기록함)
+
+import argparse
 
 from core.game import Game
-from scenes.overworld import Overworld
-from scenes.battle import Battle
-from scenes.character import Character
-from scenes.battle import Combatant, Item
-from scenes.title import TitleScreen
 
 
-def main():
-    # 화면 크기 기본값으로 설정함
-    game = Game(640, 480, "네모의 꿈")
+def parse_args(argv=None):
+    # 실행 옵션 해석함(헤드리스/렌더링 생략/틱 수 제한)
+    parser = argparse.ArgumentParser(description="네모의 꿈")
+    parser.add_argument("--headless", action="store_true", help="창 없이 최대 속도로 실행")
+    parser.add_argument("--no-render", action="store_true", help="헤드리스에서 렌더링 생략")
+    parser.add_argument("--ticks", type=int, default=None, help="지정한 틱 수만큼 진행 후 종료")
+    parser.add_argument("--profile-csv", default=None, help="종료 시 씬별 프레임 시간 통계 저장할 CSV 경로")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="첫 프레임까지 걸린 시간 출력하고 종료(시작 벤치마크용)")
+    parser.add_argument("--record", default=None, help="입력(이벤트/키 상태/시드)을 기록할 파일 경로")
+    parser.add_argument("--replay", default=None, help="기록 파일을 헤드리스 최대 속도로 재생")
+    return parser.parse_args(argv)
 
-    # 타이틀 화면부터 시작함
-    from scenes.title import TitleScreen
-    game.push_state(TitleScreen(game))
 
-    # 오버월드 입력 처리는 각 씬에서 담당함
+def init_default_data(game):
+    # 파티/인벤토리 없으면 기본값 초기화함. 전투 모듈 불러오므로 첫 프레임 뒤에 실행함
+    from scenes.battle import Combatant, Item
 
-    # 파티/인벤토리 없으면 기본값 초기화함
     if not getattr(game, "party", None):
         cecil = Combatant("겨울이", max_hp=60, atk=10, speed=140, is_enemy=False)
         rydia = Combatant("가을이", max_hp=40, atk=7, speed=120, is_enemy=False)
@@ -32,11 +36,56 @@ def main():
             Item("목검", "weapon", 0, "공격력 +3", atk_bonus=3),        # 초기 무기로 사용함
         ]
 
+
+def main(argv=None):
+    imported_at = time.perf_counter()
+    args = parse_args(argv)
+    # 재생은 항상 헤드리스로 실제 시간 기다리지 않고 진행함
+    headless = args.headless or args.replay is not None
+    # 화면 크기 기본값으로 설정함
+    game = Game(640, 480, "네모의 꿈", headless=headless, render=not args.no_render,
+                profile_csv=args.profile_csv)
+    game.exit_after_first_frame = args.startup_report
+    if args.replay:
+        from core.replay import InputReplayer
+        game.replayer = InputReplayer(args.replay)
+    elif args.record:
+        from core.replay import InputRecorder
+        game.recorder = InputRecorder(args.record)
+    initialized_at = time.perf_counter()
+
+    # 타이틀 화면부터 시작함. 다른 씬 모듈은 처음 전환할 때 불러옴
+    game.push_scene("title")
+
+    # 오버월드 입력 처리는 각 씬에서 담당함
+    game.defer(lambda: init_default_data(game))
+    if not args.no_render:
+        # HUD 숫자/한글 글리프는 첫 프레임 뒤에 미리 아틀라스에 넣어 둠
+        from ui.ui import prewarm_glyphs
+        game.defer(prewarm_glyphs)
+
     # 게임 루프 시작함
-    game.run()
+    run_started_at = time.perf_counter()
+    game.run(max_ticks=args.ticks)
+    run_ms = (time.perf_counter() - run_started_at) * 1000.0
 
+    if game.replayer is not None:
+        # 빌드 간 같은 세션 소요 시간 비교용 요약임
+        ticks_per_sec = game.tick_count / (run_ms / 1000.0) if run_ms > 0 else 0.0
+        print(f"replay frames={game.replayer.total_frames} ticks={game.tick_count} "
+              f"run_ms={run_ms:.2f} ticks_per_sec={ticks_per_sec:.1f}")
 
-if __name__ == "__main__":
-    main()
+    if args.startup_report and game.first_frame_at is not None:
+        from ui.ui import font_discovery_stats
 
+        # 벤치마크 스크립트가 읽는 한 줄 형식임
+        fonts_ms, fonts_source = font_discovery_stats()
+        print(f"startup imports_ms={(imported_at - START_TIME) * 1000.0:.2f} "
+              f"init_ms={(initialized_at - imported_at) * 1000.0:.2f} "
+              f"fonts_ms={fonts_ms:.2f} "
+              f"first_frame_ms={(game.first_frame_at - START_TIME) * 1000.0:.2f} "
+              f"fonts={fonts_source}")
 
+
+if __name__ == "__main__":
+    main()
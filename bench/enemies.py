@@ -0,0 +1,77 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame  # noqa: E402
+
+from world import entities, world  # noqa: E402  (ROOT 추가한 뒤 불러옴)
+
+DEFAULT_COUNTS = "8,1000,10000"
+FRAME_MS = 1000.0 / 60.0  # 60 FPS 한 프레임 예산임
+ENEMY_SPEED = 60.0  # 오버월드 적 이동 속도와 같음
+VIEW = (800, 600)  # 가시 적 질의에 쓰는 화면 크기임
+
+
+def build(count, width, seed):
+    # 오버월드와 같은 스트리밍 맵 위에 count마리 적을 width 픽셀 폭에 흩어 놓음
+    tilemap = world.StreamingTileMap(lambda index: world.generate_horizontal_chunk(index, 20, 10, seed),
+                                     chunk_cols=20, rows=10, tile_size=32)
+    rng = random.Random(seed)
+    registry = entities.EnemyRegistry()
+    for index in range(count):
+        rect = (rng.randint(40, width), rng.randint(40, tilemap.rows * tilemap.tile_size - 60), 16, 16)
+        direction = (rng.choice((-1, 1)), rng.choice((-1, 0, 1)))
+        registry.add(rect, direction, index % 8)
+    return tilemap, registry
+
+
+def measure(step, registry, tilemap, ticks, runs):
+    # 틱 하나(이동 + 플레이어 접촉 질의 + 화면 안 적 Rect 만들기)의 가장 빠른 평균 시간(밀리초) 반환함
+    player = pygame.Rect(64, 64, 16, 24)
+    view = pygame.Rect((0, 0), VIEW)
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        for _ in range(ticks):
+            step(1.0 / 60.0, ENEMY_SPEED, tilemap)
+            registry.query_rect(player)
+            registry.visible(view)
+        best = min(best, (time.perf_counter() - start) / ticks)
+    return best * 1000.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="오버월드 적 이동 파이썬/numpy 경로 틱 시간 비교")
+    parser.add_argument("--counts", default=DEFAULT_COUNTS, help="적 수 목록(쉼표 구분)")
+    parser.add_argument("--width", type=int, default=4800, help="적을 흩어 놓을 월드 폭(픽셀)")
+    parser.add_argument("--ticks", type=int, default=30, help="한 번 잴 때 돌릴 틱 수")
+    parser.add_argument("--runs", type=int, default=3, help="반복 횟수(가장 빠른 값 사용)")
+    parser.add_argument("--seed", type=int, default=1234, help="배치/맵 시드")
+    args = parser.parse_args(argv)
+
+    if entities.np is None:
+        print("numpy가 없어 비교할 수 없음")
+        return 1
+    print(f"{'enemies':>8}{'backend':>9}{'ms/tick':>10}{'frame %':>9}{'speedup':>9}")
+    for count in (int(part) for part in args.counts.split(",")):
+        base_time = None
+        for backend in ("python", "numpy"):
+            tilemap, registry = build(count, args.width, args.seed)
+            # python은 numpy가 없을 때 쓰는 이동 경로임(질의는 두 경우 모두 격자 색인 사용)
+            step = registry._step_py if backend == "python" else registry.step
+            step(1.0 / 60.0, ENEMY_SPEED, tilemap)  # 청크 생성은 재지 않음
+            elapsed = measure(step, registry, tilemap, args.ticks, args.runs)
+            base_time = base_time or elapsed
+            print(f"{count:>8}{backend:>9}{elapsed:>10.3f}{elapsed / FRAME_MS * 100.0:>8.1f}%{base_time / elapsed:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIELDS = ("imports_ms", "init_ms", "fonts_ms", "first_frame_ms")
+FONT_CACHE_PATH = os.path.join(ROOT, "saves", "font_cache.json")
+
+
+def parse_report(output):
+    # "startup imports_ms=.. init_ms=.. fonts_ms=.. first_frame_ms=.. fonts=.." 줄을 사전으로 바꿈
+    for line in output.splitlines():
+        if line.startswith("startup "):
+            report = {}
+            for key, value in (part.split("=") for part in line.split()[1:]):
+                try:
+                    report[key] = float(value)
+                except ValueError:
+                    report[key] = value  # fonts=cache/scan 같은 문자열 값임
+            return report
+    return None
+
+
+def run_once(headless, cold_fonts=False):
+    # 새 프로세스로 게임 띄워 첫 프레임까지 시간 잼(콜드 스타트 재현용)
+    if cold_fonts and os.path.exists(FONT_CACHE_PATH):
+        # 폰트 경로 캐시 지워서 글꼴 탐색 비용까지 측정함
+        os.remove(FONT_CACHE_PATH)
+    cmd = [sys.executable, os.path.join(ROOT, "__main__.py"), "--startup-report"]
+    if headless:
+        cmd.append("--headless")
+    start = time.perf_counter()
+    result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000.0
+    report = parse_report(result.stdout)
+    if result.returncode != 0 or report is None:
+        raise RuntimeError(f"시작 측정 실패: {result.stderr.strip() or result.stdout.strip()}")
+    report["wall_ms"] = wall_ms  # 인터프리터 시작과 종료까지 포함한 전체 시간임
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="첫 프레임까지 걸리는 시작 시간 측정")
+    parser.add_argument("--runs", type=int, default=10, help="측정 횟수")
+    parser.add_argument("--budget-ms", type=float, default=None, help="first_frame_ms 중앙값 허용 상한")
+    parser.add_argument("--window", action="store_true", help="헤드리스 대신 실제 창으로 측정")
+    parser.add_argument("--cold-fonts", action="store_true", help="매 실행 전 폰트 경로 캐시 삭제")
+    args = parser.parse_args(argv)
+
+    reports = [run_once(headless=not args.window, cold_fonts=args.cold_fonts) for _ in range(args.runs)]
+    print(f"{'':<16}{'min':>10}{'median':>10}{'max':>10}")
+    for field in FIELDS + ("wall_ms",):
+        values = [r[field] for r in reports]
+        print(f"{field:<16}{min(values):>10.2f}{statistics.median(values):>10.2f}{max(values):>10.2f}")
+    scans = sum(1 for r in reports if r.get("fonts") == "scan")
+    print(f"폰트 탐색: 캐시 {len(reports) - scans}회, 전체 탐색 {scans}회")
+
+    median = statistics.median(r["first_frame_ms"] for r in reports)
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"예산 초과: first_frame_ms 중앙값 {median:.2f} > {args.budget_ms:.2f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from world import world  # noqa: E402  (ROOT 추가한 뒤 불러옴)
+
+DEFAULT_SIZES = "120x10,500x100,2000x500"
+CHUNK_WIDTH = 20  # 수평 월드 청크 한 개의 열 수임(오버월드와 같음)
+
+
+def _horizontal_py(width, height, seed):
+    # 기존 방식(청크마다 칸 단위 난수)으로 수평 월드 전체를 만듦
+    chunks = max(1, width // CHUNK_WIDTH)
+    parts = [world._generate_horizontal_chunk_py(chunk, CHUNK_WIDTH, height, seed) for chunk in range(chunks)]
+    return [[value for part in parts for value in part[row]] for row in range(height)]
+
+
+def _horizontal_np(width, height, seed):
+    return world.generate_horizontal_world(max(1, width // CHUNK_WIDTH), CHUNK_WIDTH, height, seed)
+
+
+# (이름, 파이썬 생성기, numpy 생성기)임. 모두 (width, height, seed)로 호출함
+GENERATORS = (
+    ("horizontal", _horizontal_py, _horizontal_np),
+    ("forest", world._generate_forest_world_py, world.generate_forest_world),
+    ("dungeon", world._generate_dungeon_world_py, world.generate_dungeon_world),
+)
+
+
+def parse_sizes(text):
+    # "120x10,2000x500" 형식을 [(120, 10), (2000, 500)]으로 바꿈
+    sizes = []
+    for part in text.split(","):
+        width, height = part.lower().split("x")
+        sizes.append((int(width), int(height)))
+    return sizes
+
+
+def measure(generate, width, height, seed, runs):
+    # 가장 빠른 실행 시간(초)과 생성 중 최대 할당 메모리(바이트) 반환함
+    # tracemalloc은 파이썬 경로를 크게 느리게 해서 시간 측정과 따로 한 번 더 돌림
+    best = float("inf")
+    for _ in range(runs):
+        gc.collect()
+        start = time.perf_counter()
+        generate(width, height, seed)
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    result = generate(width, height, seed)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="월드 생성기 파이썬/numpy 경로 속도와 최대 메모리 비교")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="폭x높이 목록(쉼표 구분)")
+    parser.add_argument("--runs", type=int, default=3, help="크기별 반복 횟수(가장 빠른 값 사용)")
+    parser.add_argument("--seed", type=int, default=1234, help="생성 시드")
+    args = parser.parse_args(argv)
+
+    if world.np is None:
+        print("numpy가 없어 비교할 수 없음")
+        return 1
+    print(f"{'generator':<12}{'size':>11}{'backend':>9}{'ms':>11}{'Mcells/s':>10}{'peak MB':>10}{'speedup':>9}")
+    for name, generate_py, generate_np in GENERATORS:
+        for width, height in parse_sizes(args.sizes):
+            cells = width * height
+            base_time = None
+            for backend, generate in (("python", generate_py), ("numpy", generate_np)):
+                elapsed, peak = measure(generate, width, height, args.seed, args.runs)
+                base_time = base_time or elapsed
+                print(f"{name:<12}{f'{width}x{height}':>11}{backend:>9}{elapsed * 1000.0:>11.2f}"
+                      f"{cells / elapsed / 1e6:>10.2f}{peak / (1024 * 1024):>10.2f}{base_time / elapsed:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
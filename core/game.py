@@ -1,24 +1,75 @@
+import os
+import time
+
 import pygame
 
+from .input import InputState
+from .profiler import FrameProfiler
+from .save_writer import SaveWriter
+from .scenes import create_scene
 from .state import State
 
 
 class Game:
     # 게임 핵심 클래스임. 창 생성, 시간 관리, 상태 전환 담당함
 
-    def __init__(self, width=640, height=480, title="RPG"):
-        # Pygame 초기화함(초기화 안 하면 오류 날 수 있음)
-        pygame.init()
+    def __init__(self, width=640, height=480, title="RPG", tick_rate=60, max_fps=120, max_catch_up=5,
+                 headless=False, render=True, profile_csv=None, idle_timeout_ms=250):
+        # 헤드리스 모드: 창 없이 더미 비디오 드라이버로 실행함(CI/시뮬레이션용)
+        self.headless = headless
+        # 렌더링 여부임. 헤드리스에서 False면 render 호출 자체를 건너뜀
+        self.render_enabled = render or not headless
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+        # 쓰는 서브시스템(화면, 폰트)만 초기화함. pygame.init()은 믹서 등 안 쓰는 모듈까지 열어 시작이 느려짐
+        pygame.display.init()
         pygame.font.init()
 
         self.width = width
         self.height = height
-        self.screen = pygame.display.set_mode((width, height))  # 화면 생성함
-        pygame.display.set_caption(title)  # 창 제목 설정함
+        if headless:
+            self.screen = pygame.Surface((width, height))  # 창 대신 화면 밖 서피스에 그림
+        else:
+            self.screen = pygame.display.set_mode((width, height))  # 화면 생성함
+            pygame.display.set_caption(title)  # 창 제목 설정함
 
         self.clock = pygame.time.Clock()  # FPS 동기화용 시계임
         self.is_running = True  # 종료 전까지 실행함
         self.state_stack = []  # 씬 스택(타이틀, 전투 등)임
+
+        # 고정 간격 시뮬레이션 설정임. 업데이트는 항상 fixed_dt 단위로 진행함
+        self.tick_rate = tick_rate
+        self.fixed_dt = 1.0 / tick_rate
+        self.max_fps = max_fps  # 렌더링 프레임 상한(0이면 제한 없음)
+        self.max_catch_up = max_catch_up  # 한 프레임에 따라잡을 최대 업데이트 횟수임
+        self.tick_count = 0  # 지금까지 수행한 고정 업데이트 횟수임
+        self.sim_time = 0.0  # 누적 시뮬레이션 시간(초)임
+        self.interpolation = 0.0  # 직전 업데이트와 다음 업데이트 사이 렌더링 보간 비율(0~1)임
+        # 대기 중인 씬에서 이벤트 기다릴 최대 시간(ms)임. 시간 지나면 한 번 깨어나 백그라운드 작업 확인함
+        self.idle_timeout_ms = idle_timeout_ms
+        self.underlay_dim = 140  # 오버레이 아래 깔리는 화면 어둡게 할 정도(0~255)임
+
+        # 씬별 프레임 시간 프로파일러임. show_fps 켜면 오버레이 표시함
+        # 예전 메뉴의 "FPS 표시"는 켜짐이 기본이었지만 화면에 그리는 것이 없었음
+        # 지금은 켜면 프로파일러 오버레이가 늘 떠 있으므로 꺼짐을 기본으로 둠(메뉴 설정에서 켬)
+        self.profiler = FrameProfiler()
+        self.show_fps = False
+        self.fps_was_shown = False  # 직전 렌더링 때 show_fps 값임(끈 순간 오버레이 자리 지우는 데 씀)
+        self.profile_csv = profile_csv  # 지정 시 종료할 때 통계를 CSV로 저장함
+
+        # 시작 시간 측정용임. 첫 프레임 화면에 반영한 시점(perf_counter) 기록함
+        self.first_frame_at = None
+        self.exit_after_first_frame = False  # 시작 벤치마크용. 첫 프레임 뒤 바로 종료함
+        self.deferred = []  # 첫 프레임 뒤로 미룬 초기화 작업 목록임
+
+        # 입력 기록/재생용임(core.replay). 재생 중이면 실제 입력과 시간 대신 기록 파일 따름
+        self.recorder = None
+        self.replayer = None
+        # 키 바인딩과 프레임별 입력 스냅샷임. 씬은 키 대신 액션 이름으로 입력 받음
+        self.input = InputState(self)
+        # 저장 파일 쓰기는 백그라운드 스레드가 맡음
+        self.save_writer = SaveWriter()
         
         # 저장 데이터 호환용 스키마 버전임
         self.schema_version = 1
@@ -34,8 +85,44 @@ class Game:
     def push_state(self, state):
         # 새 씬 스택에 추가하고 on_enter 호출함
         self.state_stack.append(state)
+        state.mark_dirty()
         state.on_enter()
 
+    def get_pressed(self):
+        # 현재 키보드 상태 반환함. 씬은 pygame.key.get_pressed 대신 이걸 써야 기록/재생됨
+        if self.replayer is not None:
+            return self.replayer.next_keys()
+        keys = pygame.key.get_pressed()
+        if self.recorder is not None:
+            self.recorder.record_keys(keys)
+        return keys
+
+    def create_scene(self, name, *args, **kwargs):
+        # 등록된 이름으로 씬 만듦. 씬 모듈은 처음 쓸 때 import됨
+        return create_scene(self, name, *args, **kwargs)
+
+    def push_scene(self, name, *args, **kwargs):
+        # 이름으로 씬 만들어 스택에 추가하고 반환함
+        scene = self.create_scene(name, *args, **kwargs)
+        self.push_state(scene)
+        return scene
+
+    def defer(self, callback):
+        # 첫 프레임 그린 뒤 실행할 작업 등록함. 이미 그렸으면 바로 실행함
+        if self.first_frame_at is None:
+            self.deferred.append(callback)
+        else:
+            callback()
+
+    def _on_first_frame(self):
+        self.first_frame_at = time.perf_counter()
+        if self.exit_after_first_frame:
+            self.is_running = False
+            return
+        deferred, self.deferred = self.deferred, []
+        for callback in deferred:
+            callback()
+
     def pop_state(self):
         # 스택 비어 있으면 None 반환함
         if not self.state_stack:
@@ -43,36 +130,190 @@ class Game:
         # 맨 위 씬 제거하고 on_exit 호출함
         top = self.state_stack.pop()
         top.on_exit()
+        # 드러난 아래 씬은 화면 전체 다시 그려야 함
+        if self.state_stack:
+            self.state_stack[-1].mark_dirty()
         return top
 
+    def draw_underlay(self, state, surface):
+        # 오버레이 씬 아래 깔린 씬들을 캐시한 스냅샷 한 장으로 그림. 아래 씬 없으면 False 반환함
+        if state.underlay is None:
+            state.underlay = self._compose_underlay(state)
+        if state.underlay is None:
+            return False
+        surface.blit(state.underlay, (0, 0))
+        return True
+
+    def invalidate_underlay(self):
+        # 아래 씬에 보이는 데이터(골드, HP 등)가 바뀌면 스냅샷 다시 만들도록 표시함
+        for state in self.state_stack:
+            state.underlay = None
+        if self.state_stack:
+            self.state_stack[-1].mark_dirty()
+
+    def _compose_underlay(self, state):
+        # 바로 아래 씬을 화면 밖 서피스에 한 번 그리고 어둡게 덮어 스냅샷 만듦
+        # 아래 씬도 오버레이면 자기 스냅샷을 쓰므로 스택 전체를 다시 그리지 않음
+        if state not in self.state_stack:
+            return None
+        index = self.state_stack.index(state)
+        if index == 0:
+            return None
+        below = self.state_stack[index - 1]
+        snapshot = self.screen.copy()  # 화면과 같은 픽셀 형식이라 블릿이 빠름
+        snapshot.set_clip(None)
+        snapshot.fill((0, 0, 0))
+        below.render(snapshot)
+        dim = pygame.Surface(snapshot.get_size(), pygame.SRCALPHA)
+        dim.fill((0, 0, 0, self.underlay_dim))
+        snapshot.blit(dim, (0, 0))
+        return snapshot
+
     def current_state(self):
         # 현재 활성화된 씬 반환함
         if not self.state_stack:
             return None
         return self.state_stack[-1]
 
-    def run(self):
-        # 메인 루프: 입력 처리, 업데이트, 렌더링 반복함
+    def run(self, max_ticks=None):
+        # 메인 루프: 입력 처리, 고정 간격 업데이트, 보간 렌더링 반복함
+        # max_ticks 지정 시 그만큼 업데이트한 뒤 종료함(시뮬레이션용)
+        recorder = self.recorder
+        replayer = self.replayer
+        if replayer is not None:
+            replayer.apply(self)  # 기록 당시 틱 속도/시드/난수 상태로 되돌림
+        if recorder is not None:
+            recorder.start(self)
+        accumulator = 0.0
+        # 느린 프레임 뒤 업데이트가 계속 밀리지 않도록 한 프레임에 반영할 시간 제한함
+        max_frame_time = self.fixed_dt * self.max_catch_up
+        self.clock.tick()
         while self.is_running:
-            delta_time = self.clock.tick(60) / 1000.0  # 60 FPS 기준 경과 시간 계산함
+            if max_ticks is not None and self.tick_count >= max_ticks:
+                break
+            events = []
+            replay_ticks = None
+            current = self.current_state()
+            if replayer is not None:
+                # 기록된 이벤트와 틱 수를 실제 시간과 무관하게 그대로 진행함
+                frame = replayer.next_frame()
+                if frame is None:
+                    break
+                events, replay_ticks = frame
+            elif not self.headless and current is not None and current.is_idle() and not current.has_damage():
+                # 정적인 화면은 폴링/다시 그리기 대신 이벤트 올 때까지 잠듦
+                event = pygame.event.wait(self.idle_timeout_ms)
+                if event.type != pygame.NOEVENT:
+                    events.append(event)
+                # 잠든 시간은 시뮬레이션 시간에 반영하지 않음
+                self.clock.tick()
+                accumulator = 0.0
+            if replay_ticks is not None:
+                # 재생은 기록된 틱 수만큼만 진행함
+                accumulator = replay_ticks * self.fixed_dt
+            elif self.headless:
+                # 헤드리스는 실제 시간 기다리지 않고 루프마다 한 틱씩 최대 속도로 진행함
+                accumulator += self.fixed_dt
+            else:
+                frame_time = self.clock.tick(self.max_fps) / 1000.0  # 직전 프레임 이후 경과 시간임
+                accumulator += min(frame_time, max_frame_time)
             if not self.state_stack:
                 self.is_running = False  # 씬 없으면 종료함
                 break
-            for event in pygame.event.get():
+            profiler = self.profiler
+            if replayer is None:
+                events.extend(pygame.event.get())
+                if recorder is not None:
+                    recorder.record_events(events)
+            self.save_writer.poll()  # 끝난 저장 결과 알림
+            inputs = self.input
+            inputs.begin_frame()  # 키보드 상태는 프레임마다 한 번만 읽음
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.is_running = False  # 창 닫기 이벤트 발생 시 종료함
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    # 창이 가려졌다 드러나면 화면 전체 다시 그림
+                    current = self.current_state()
+                    if current is not None:
+                        current.mark_dirty()
                 else:
+                    action = inputs.process(event)
                     current = self.current_state()
                     if current is not None:
-                        current.handle_event(event)  # 입력 처리함
+                        start = time.perf_counter()
+                        # 바인딩된 키는 액션 표로, 나머지는 handle_event로 처리함
+                        if action is None:
+                            current.handle_event(event)
+                        else:
+                            current.handle_action(action, event)
+                        profiler.add(type(current).__name__, "event", (time.perf_counter() - start) * 1000.0)
+            steps = 0
+            max_steps = self.max_catch_up if replay_ticks is None else replay_ticks
+            while steps < max_steps and (replay_ticks is not None or accumulator >= self.fixed_dt):
+                current = self.current_state()
+                if current is None:
+                    break
+                start = time.perf_counter()
+                current.update(self.fixed_dt)  # 게임 로직 업데이트함(항상 같은 간격)
+                profiler.add(type(current).__name__, "update", (time.perf_counter() - start) * 1000.0)
+                if recorder is not None:
+                    recorder.record_tick()
+                self.tick_count += 1
+                self.sim_time += self.fixed_dt
+                accumulator -= self.fixed_dt
+                steps += 1
+            if recorder is not None:
+                recorder.end_frame()
+            if replay_ticks is not None:
+                accumulator = 0.0
+            elif accumulator >= self.fixed_dt:
+                # 상한까지 따라잡고도 남은 시간은 버림(느려진 만큼 게임이 느려짐)
+                accumulator = accumulator % self.fixed_dt
+            self.interpolation = accumulator / self.fixed_dt
+            if not self.render_enabled:
+                profiler.end_frame()
+                if self.first_frame_at is None:
+                    self._on_first_frame()
+                continue
             current = self.current_state()
             if current is not None:
-                current.update(delta_time)  # 게임 로직 업데이트함
-            self.screen.fill((0, 0, 0))  # 배경 먼저 그림
-            current = self.current_state()
-            if current is not None:
-                current.render(self.screen)  # 현재 씬 렌더링함
-            pygame.display.flip()  # 화면에 반영함
+                self._render_frame(current)
+            profiler.end_frame()
+            if self.first_frame_at is None:
+                self._on_first_frame()
+        if recorder is not None:
+            recorder.close()
+        self.save_writer.close()  # 쓰는 중인 저장 마무리함
+        if self.profile_csv:
+            profiler.dump_csv(self.profile_csv)
         pygame.quit()  # Pygame 종료함
 
-
+    def _render_frame(self, current):
+        # 씬이 알린 손상 영역만 다시 그려 화면에 반영함. 손상 없으면 렌더링 생략함
+        profiler = self.profiler
+        if self.show_fps != self.fps_was_shown and profiler.overlay_rect is not None:
+            # 켜거나 끈 순간 오버레이 자리를 한 번 다시 그림(끈 뒤에 마지막 글자가 남지 않게 함)
+            current.mark_dirty(profiler.overlay_rect)
+        elif self.show_fps and profiler.overlay_due():
+            current.mark_dirty(profiler.overlay_rect)
+        self.fps_was_shown = self.show_fps
+        screen_rect = self.screen.get_rect()
+        rects = current.take_dirty(screen_rect)
+        if not rects:
+            return
+        full = len(rects) == 1 and rects[0] == screen_rect
+        # 손상 영역 밖은 그리지 않도록 클립 설정함
+        self.screen.set_clip(None if full else rects[0].unionall(rects[1:]))
+        self.screen.fill((0, 0, 0))  # 배경 먼저 그림
+        start = time.perf_counter()
+        current.render(self.screen)  # 현재 씬 렌더링함
+        profiler.add(type(current).__name__, "render", (time.perf_counter() - start) * 1000.0)
+        if self.show_fps:
+            profiler.draw_overlay(self.screen, type(current).__name__, self.clock.get_fps())
+        self.screen.set_clip(None)
+        if self.headless:
+            return
+        if full:
+            pygame.display.flip()  # 화면 전체 반영함
+        else:
+            pygame.display.update(rects)  # 바뀐 영역만 반영함
@@ -0,0 +1,98 @@
+import pygame
+
+
+# 액션 이름 → 기본 키 목록임. 씬은 키 대신 액션 이름으로 입력 처리함
+DEFAULT_BINDINGS = {
+    "up": (pygame.K_UP, pygame.K_w),
+    "down": (pygame.K_DOWN, pygame.K_s),
+    "left": (pygame.K_LEFT, pygame.K_a),
+    "right": (pygame.K_RIGHT, pygame.K_d),
+    "confirm": (pygame.K_RETURN, pygame.K_SPACE),
+    "cancel": (pygame.K_ESCAPE,),
+    "switch": (pygame.K_TAB,),
+    "menu": (pygame.K_m,),
+    "inventory": (pygame.K_i,),
+    "shop": (pygame.K_b,),
+    "talk": (pygame.K_e,),
+    "leave_town": (pygame.K_g,),
+}
+
+# 이동 방향 계산에 쓰는 액션별 (x, y) 성분임
+DIRECTIONS = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
+
+
+class InputState:
+    # 키 → 액션 표와 프레임마다 한 번 찍는 입력 스냅샷 관리함
+
+    def __init__(self, game, bindings=None):
+        self.game = game
+        self.key_actions = {}  # 키 → 액션 이름(키 하나는 액션 하나에만 묶임)
+        self.action_keys = {}  # 액션 이름 → 키 집합(재지정용 역방향 표)
+        for action, keys in (bindings or DEFAULT_BINDINGS).items():
+            self.bind(action, *keys)
+
+        # 이번 프레임 스냅샷임
+        self.held = frozenset()  # 누르고 있는 액션들
+        self.pressed = []  # 이번 프레임에 새로 눌린 액션들(순서 유지)
+        self.direction = pygame.Vector2(0, 0)  # 이동 액션 합성한 단위 벡터임
+        self.mouse_pos = (0, 0)
+        self.clicks = []  # 이번 프레임 왼쪽 클릭 위치들
+
+    def bind(self, action, *keys):
+        # 액션에 키 추가함. 다른 액션에 묶여 있던 키는 옮겨 옴
+        bound = self.action_keys.setdefault(action, set())
+        for key in keys:
+            previous = self.key_actions.get(key)
+            if previous is not None:
+                self.action_keys[previous].discard(key)
+            self.key_actions[key] = action
+            bound.add(key)
+
+    def rebind(self, action, *keys):
+        # 액션의 키를 통째로 바꿈
+        for key in self.action_keys.get(action, ()):
+            del self.key_actions[key]
+        self.action_keys[action] = set()
+        self.bind(action, *keys)
+
+    def action_for(self, key):
+        return self.key_actions.get(key)
+
+    def begin_frame(self):
+        # 키보드 상태를 한 번만 읽어 누른 액션과 이동 방향 계산함
+        self.pressed = []
+        self.clicks = []
+        keys = self.game.get_pressed()
+        held = set()
+        for key, action in self.key_actions.items():
+            if keys[key]:
+                held.add(action)
+        self.held = frozenset(held)
+        x = y = 0
+        for action in self.held:
+            offset = DIRECTIONS.get(action)
+            if offset is not None:
+                x += offset[0]
+                y += offset[1]
+        direction = pygame.Vector2(x, y)
+        if x or y:
+            direction.normalize_ip()
+        self.direction = direction
+
+    def process(self, event):
+        # 이벤트를 스냅샷에 반영하고 키 입력이면 해당 액션 이름 반환함
+        if event.type == pygame.KEYDOWN:
+            action = self.key_actions.get(event.key)
+            if action is not None:
+                self.pressed.append(action)
+            return action
+        if event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.mouse_pos = event.pos
+            if event.button == 1:
+                self.clicks.append(event.pos)
+        return None
+
+    def is_held(self, action):
+        return action in self.held
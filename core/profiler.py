@@ -0,0 +1,130 @@
+import csv
+import math
+import time
+from collections import deque
+
+import pygame
+
+from ui.ui import get_font, text_cache_stats
+
+
+PHASES = ("event", "update", "render", "frame")  # 기록하는 구간 목록임(frame은 세 구간 합계)
+FRAME_BUDGET_MS = 1000.0 / 60.0  # 60 FPS 기준 한 프레임 예산(ms)임
+
+
+def percentile(sorted_values, pct):
+    # 정렬된 값 목록에서 nearest-rank 방식 백분위 값 계산함
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class FrameProfiler:
+    # 씬 클래스별로 이벤트/업데이트/렌더링 시간을 따로 기록하고 백분위 계산함
+
+    def __init__(self, window=600, refresh_interval=0.5):
+        self.window = window  # 백분위 계산에 쓰는 최근 프레임 수임
+        self.refresh_interval = refresh_interval  # 오버레이 갱신 간격(초)임
+        self.samples = {}  # (씬 이름, 구간) → 최근 ms 기록(deque)
+        self.totals = {}  # (씬 이름, 구간) → [횟수, 합계, 최대]
+        self._frame = {}  # 이번 프레임의 (씬 이름, 구간) → 누적 ms
+        self._overlay = None  # 미리 그려 둔 오버레이 서피스임
+        self._overlay_at = 0.0
+        self.overlay_rect = None  # 마지막으로 오버레이 그린 화면 영역임
+
+    def add(self, scene, phase, ms):
+        # 이번 프레임에 구간 시간 누적함(한 프레임에 여러 번 호출될 수 있음)
+        key = (scene, phase)
+        self._frame[key] = self._frame.get(key, 0.0) + ms
+
+    def end_frame(self):
+        # 누적한 구간 시간을 프레임 단위 표본으로 기록함
+        frame_totals = {}
+        for (scene, phase), ms in self._frame.items():
+            self._record(scene, phase, ms)
+            frame_totals[scene] = frame_totals.get(scene, 0.0) + ms
+        for scene, ms in frame_totals.items():
+            self._record(scene, "frame", ms)
+        self._frame.clear()
+
+    def _record(self, scene, phase, ms):
+        key = (scene, phase)
+        window = self.samples.get(key)
+        if window is None:
+            window = self.samples[key] = deque(maxlen=self.window)
+            self.totals[key] = [0, 0.0, 0.0]
+        window.append(ms)
+        total = self.totals[key]
+        total[0] += 1
+        total[1] += ms
+        if ms > total[2]:
+            total[2] = ms
+
+    def stats(self, scene, phase):
+        # (p50, p95, p99) 반환함. 기록 없으면 0 반환함
+        window = self.samples.get((scene, phase))
+        if not window:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(window)
+        return percentile(ordered, 50), percentile(ordered, 95), percentile(ordered, 99)
+
+    def scenes(self):
+        # 기록된 씬 이름 목록 반환함
+        return sorted({scene for scene, _ in self.samples})
+
+    def overlay_due(self):
+        # 오버레이 내용을 새로 만들 때가 되었는지 여부임
+        return self._overlay is None or time.perf_counter() - self._overlay_at >= self.refresh_interval
+
+    def draw_overlay(self, surface, scene, fps):
+        # 현재 씬의 구간별 백분위를 좌측 상단에 표시함(갱신 간격마다 다시 그림)
+        if self.overlay_due():
+            self._overlay = self._build_overlay(scene, fps)
+            self._overlay_at = time.perf_counter()
+        surface.blit(self._overlay, (4, 4))
+        self.overlay_rect = pygame.Rect(4, 4, *self._overlay.get_size())
+        return self.overlay_rect
+
+    def _build_overlay(self, scene, fps):
+        font = get_font(12)
+        lines = [(f"{scene}  FPS {fps:.0f}", (255, 255, 255))]
+        for phase in PHASES:
+            p50, p95, p99 = self.stats(scene, phase)
+            # 99 백분위가 프레임 예산 넘으면 붉게 표시함
+            color = (255, 120, 120) if p99 > FRAME_BUDGET_MS else (200, 230, 200)
+            lines.append((f"{phase:<6} p50 {p50:5.2f}  p95 {p95:5.2f}  p99 {p99:5.2f} ms", color))
+        # 글자 서피스 캐시 적중률과 메모리 사용량임
+        text = text_cache_stats()
+        lines.append((f"text   hit {text['hit_rate'] * 100:5.1f}%  {text['entries']} entries  "
+                      f"{text['bytes'] / 1048576:.1f}/{text['max_bytes'] / 1048576:.0f} MB", (200, 200, 230)))
+        # render_text 캐시는 일부러 거치지 않음. 줄마다 숫자가 갱신 때마다 바뀌어 다시 쓰이지 않는 항목만 쌓이고
+        # 씬 글자를 밀어내며, 이 오버레이가 보여 주는 캐시 적중률도 자기 글자 때문에 틀어짐
+        surfs = [font.render(text, True, color) for text, color in lines]
+        width = max(s.get_width() for s in surfs) + 12
+        if self.overlay_rect is not None:
+            # 숫자 폭 변화로 오버레이가 줄어들면 이전 글자가 남으므로 폭 유지함
+            width = max(width, self.overlay_rect.width)
+        height = sum(s.get_height() for s in surfs) + 8
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        y = 4
+        for s in surfs:
+            overlay.blit(s, (6, y))
+            y += s.get_height()
+        return overlay
+
+    def dump_csv(self, path):
+        # 씬/구간별 누적 통계를 CSV로 저장함
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["scene", "phase", "frames", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+            for scene in self.scenes():
+                for phase in PHASES:
+                    total = self.totals.get((scene, phase))
+                    if total is None:
+                        continue
+                    count, total_ms, max_ms = total
+                    p50, p95, p99 = self.stats(scene, phase)
+                    writer.writerow([scene, phase, count, f"{total_ms / count:.3f}",
+                                     f"{p50:.3f}", f"{p95:.3f}", f"{p99:.3f}", f"{max_ms:.3f}"])
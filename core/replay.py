@@ -0,0 +1,208 @@
+import random
+import struct
+from collections import deque
+
+import pygame
+
+
+# 입력 기록 파일 형식임
+#   헤더: MAGIC, 버전, 틱 속도, 월드 시드, random 모듈 상태
+#   본문: 레코드 나열. 태그 1바이트 뒤에 내용 옴
+#     E: 이벤트(type, dict)  K: 키 상태(눌린 스캔코드 목록)  T: 고정 업데이트 1회  F: 프레임 끝
+MAGIC = b"RPGREC"
+VERSION = 1
+
+_HEADER = struct.Struct("<6sBH")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+
+def _encode_value(out, value):
+    # 이벤트 속성 값을 태그 붙여 기록함. 기록 못 하는 타입이면 False 반환함
+    if value is None:
+        out += b"N"
+    elif isinstance(value, bool):
+        out += b"B" + _U8.pack(value)
+    elif isinstance(value, int):
+        out += b"I" + _I64.pack(value)
+    elif isinstance(value, float):
+        out += b"D" + _F64.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        out += b"S" + _U16.pack(len(data)) + data
+    elif isinstance(value, (tuple, list)) and len(value) < 256:
+        mark = len(out)
+        out += b"T" + _U8.pack(len(value))
+        for item in value:
+            if not _encode_value(out, item):
+                del out[mark:]
+                return False
+    else:
+        return False
+    return True
+
+
+class _Reader:
+    # 바이트 버퍼를 앞에서부터 읽음
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def take(self, fmt):
+        values = fmt.unpack_from(self.data, self.pos)
+        self.pos += fmt.size
+        return values[0] if len(values) == 1 else values
+
+    def raw(self, size):
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return chunk
+
+    def value(self):
+        tag = self.raw(1)
+        if tag == b"N":
+            return None
+        if tag == b"B":
+            return bool(self.take(_U8))
+        if tag == b"I":
+            return self.take(_I64)
+        if tag == b"D":
+            return self.take(_F64)
+        if tag == b"S":
+            return self.raw(self.take(_U16)).decode("utf-8")
+        if tag == b"T":
+            return tuple(self.value() for _ in range(self.take(_U8)))
+        raise ValueError(f"알 수 없는 값 태그: {tag!r}")
+
+
+class InputRecorder:
+    # Game.run이 소비한 이벤트와 키 상태를 틱 단위로 파일에 기록함
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+        self.frames = 0
+        self.ticks = 0
+        self._buffer = bytearray()
+
+    def start(self, game):
+        # 재생에 필요한 시작 조건(틱 속도, 시드, 난수 상태) 기록함
+        self.file = open(self.path, "wb")
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, game.tick_rate))
+        seed = getattr(game, "world_seed", None)
+        out += _U8.pack(seed is not None) + _I64.pack(seed or 0)
+        version, internal, gauss = random.getstate()
+        out += _U8.pack(version) + _U16.pack(len(internal))
+        out += struct.pack(f"<{len(internal)}I", *internal)
+        out += _U8.pack(gauss is not None) + _F64.pack(gauss or 0.0)
+        self.file.write(out)
+
+    def record_events(self, events):
+        out = self._buffer
+        for event in events:
+            mark = len(out)
+            out += b"E" + _U32.pack(event.type) + b"\0"
+            count = 0
+            for key, value in event.dict.items():
+                key_mark = len(out)
+                name = key.encode("utf-8")
+                out += _U8.pack(len(name)) + name
+                if _encode_value(out, value):
+                    count += 1
+                else:
+                    del out[key_mark:]  # 창 객체 등 재현에 필요 없는 값은 뺌
+            out[mark + 5] = count
+
+    def record_keys(self, keys):
+        pressed = [code for code, down in enumerate(keys) if down]
+        self._buffer += b"K" + _U8.pack(len(pressed)) + struct.pack(f"<{len(pressed)}H", *pressed)
+
+    def record_tick(self):
+        self._buffer += b"T"
+        self.ticks += 1
+
+    def end_frame(self):
+        self._buffer += b"F"
+        self.frames += 1
+        if len(self._buffer) >= 64 * 1024:
+            self.flush()
+
+    def flush(self):
+        if self.file is not None and self._buffer:
+            self.file.write(self._buffer)
+            self._buffer.clear()
+
+    def close(self):
+        if self.file is not None:
+            self.flush()
+            self.file.close()
+            self.file = None
+
+
+class InputReplayer:
+    # 기록 파일을 미리 해석해 두고 프레임 단위로 이벤트, 틱 수, 키 상태 돌려줌
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            reader = _Reader(f.read())
+        magic, version, self.tick_rate = reader.take(_HEADER)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"입력 기록 파일 아님: {path}")
+        has_seed, seed = reader.take(_U8), reader.take(_I64)
+        self.world_seed = seed if has_seed else None
+        rng_version, count = reader.take(_U8), reader.take(_U16)
+        internal = struct.unpack_from(f"<{count}I", reader.data, reader.pos)
+        reader.pos += 4 * count
+        has_gauss, gauss = reader.take(_U8), reader.take(_F64)
+        self.rng_state = (rng_version, internal, gauss if has_gauss else None)
+
+        self.frames = deque()  # (이벤트 목록, 틱 수) 목록임
+        self.keys = deque()  # get_pressed 호출 순서대로 쌓인 키 상태임
+        self._key_count = None
+        events, ticks = [], 0
+        data = reader.data
+        while reader.pos < len(data):
+            tag = reader.raw(1)
+            if tag == b"E":
+                event_type, count = reader.take(_U32), reader.take(_U8)
+                attrs = {}
+                for _ in range(count):
+                    name = reader.raw(reader.take(_U8)).decode("utf-8")
+                    attrs[name] = reader.value()
+                events.append(pygame.event.Event(event_type, attrs))
+            elif tag == b"K":
+                count = reader.take(_U8)
+                self.keys.append(struct.unpack_from(f"<{count}H", data, reader.pos))
+                reader.pos += 2 * count
+            elif tag == b"T":
+                ticks += 1
+            elif tag == b"F":
+                self.frames.append((events, ticks))
+                events, ticks = [], 0
+            else:
+                raise ValueError(f"알 수 없는 레코드 태그: {tag!r}")
+        self.total_frames = len(self.frames)
+        self.total_ticks = sum(t for _, t in self.frames)
+
+    def apply(self, game):
+        # 기록 시작 시점의 틱 속도, 시드, 난수 상태 되돌림
+        game.tick_rate = self.tick_rate
+        game.fixed_dt = 1.0 / self.tick_rate
+        game.world_seed = self.world_seed
+        random.setstate(self.rng_state)
+
+    def next_frame(self):
+        # 다음 프레임의 (이벤트 목록, 틱 수) 반환함. 끝나면 None 반환함
+        return self.frames.popleft() if self.frames else None
+
+    def next_keys(self):
+        if self._key_count is None:
+            self._key_count = len(pygame.key.get_pressed())
+        state = [False] * self._key_count
+        if self.keys:
+            for code in self.keys.popleft():
+                state[code] = True
+        return pygame.key.ScancodeWrapper(state)
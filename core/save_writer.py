@@ -0,0 +1,80 @@
+import json
+import os
+import queue
+import threading
+from collections import deque
+
+
+class SaveJob:
+    # 저장 요청 하나의 진행 상태임. progress/done/error는 쓰기 스레드가 갱신함
+    def __init__(self, path, snapshot, on_done=None):
+        self.path = path
+        self.snapshot = snapshot  # 넘긴 뒤로 게임 쪽에서는 건드리지 않는 원시값 사본임
+        self.on_done = on_done  # 완료 후 메인 스레드에서 호출할 콜백임
+        self.progress = 0.0  # 0~1
+        self.done = False
+        self.error = None
+
+
+class SaveWriter:
+    # 저장 파일 직렬화와 디스크 쓰기를 전용 스레드에서 처리함. 화면은 그동안 계속 그림
+
+    CHUNK_SIZE = 16 * 1024  # 진행률 갱신 단위(바이트)임
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._finished = deque()  # 끝난 작업(스레드가 넣고 메인 스레드가 꺼냄)
+        self._thread = None
+        self.pending = 0  # 아직 끝나지 않은 작업 수임
+
+    def submit(self, path, snapshot, on_done=None):
+        # 저장 작업 등록하고 바로 반환함. 스레드는 처음 저장할 때 시작함
+        job = SaveJob(path, snapshot, on_done)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+            self._thread.start()
+        self.pending += 1
+        self._jobs.put(job)
+        return job
+
+    def poll(self):
+        # 메인 스레드에서 매 프레임 호출함. 끝난 작업의 콜백 실행함
+        while self._finished:
+            job = self._finished.popleft()
+            self.pending -= 1
+            if job.on_done is not None:
+                job.on_done(job)
+
+    def close(self):
+        # 남은 저장 끝날 때까지 기다린 뒤 스레드 종료함
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread.join()
+            self._thread = None
+        self.poll()
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            try:
+                self._write(job)
+            except Exception as e:
+                job.error = e
+            job.done = True
+            self._finished.append(job)
+
+    def _write(self, job):
+        data = json.dumps(job.snapshot, ensure_ascii=False, indent=2).encode("utf-8")
+        # 임시 파일에 다 쓴 뒤 교체함. 도중에 꺼져도 기존 저장 파일은 남음
+        temp_path = job.path + ".tmp"
+        total = len(data) or 1
+        with open(temp_path, "wb") as f:
+            for start in range(0, len(data), self.CHUNK_SIZE):
+                f.write(data[start:start + self.CHUNK_SIZE])
+                job.progress = min(1.0, (start + self.CHUNK_SIZE) / total)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, job.path)
+        job.progress = 1.0
@@ -0,0 +1,35 @@
+import importlib
+
+
+# 씬 이름 → (모듈 경로, 클래스 이름)임. 모듈은 처음 만들 때 import함
+SCENES = {
+    "title": ("scenes.title", "TitleScreen"),
+    "intro": ("scenes.intro", "Intro"),
+    "overworld": ("scenes.overworld", "Overworld"),
+    "battle": ("scenes.battle", "Battle"),
+    "character": ("scenes.character", "Character"),
+    "menu": ("scenes.menu", "Menu"),
+    "shop": ("scenes.shop", "Shop"),
+    "quest_log": ("scenes.quests", "QuestLog"),
+    "save_load": ("scenes.quests", "SaveLoad"),
+    "ending": ("scenes.ending", "Ending"),
+}
+
+_scene_classes = {}  # 이미 불러온 씬 클래스 캐시임
+
+
+def get_scene_class(name):
+    # 씬 이름으로 클래스 찾음. 처음 호출될 때만 모듈 import함
+    cls = _scene_classes.get(name)
+    if cls is None:
+        if name not in SCENES:
+            raise KeyError(f"등록되지 않은 씬: {name}")
+        module_name, class_name = SCENES[name]
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _scene_classes[name] = cls
+    return cls
+
+
+def create_scene(game, name, *args, **kwargs):
+    # 씬 인스턴스 생성함(스택에는 넣지 않음)
+    return get_scene_class(name)(game, *args, **kwargs)
@@ -0,0 +1,46 @@
+import heapq
+
+
+class Scheduler:
+    # 예약 시각이 빠른 순서로 꺼내는 최소 힙 예약표임. 예약 시각은 clock 기준 절대 시각임
+    # clock은 advance로만 흐르므로 소유한 씬이 멈춰 있으면(전투, 마을 등) 예약도 같이 멈춤
+    # 같은 시각이면 먼저 예약한 항목이 먼저 나옴
+
+    def __init__(self):
+        self.clock = 0.0
+        self._heap = []  # (예약 시각, 예약 순번, 항목)임
+        self._next_seq = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule(self, delay, item):
+        # 지금부터 delay초 뒤에 나올 항목 예약함
+        heapq.heappush(self._heap, (self.clock + delay, self._next_seq, item))
+        self._next_seq += 1
+
+    def advance(self, delta_time):
+        # clock을 진행하고 예약 시각이 된 항목만 시각 순서대로 꺼내 반환함
+        self.clock += delta_time
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= self.clock:
+            due.append(heapq.heappop(heap)[2])
+        return due
+
+    def upcoming(self, count):
+        # 곧 나올 count개를 (남은 시간, 항목) 목록으로 반환함. 힙은 그대로 둠
+        return [(at - self.clock, item) for at, _, item in heapq.nsmallest(count, self._heap)]
+
+    def to_data(self):
+        # 저장용 원시값 사본임. 남은 시간으로 적어 두므로 불러온 뒤 clock이 0부터 다시 흘러도 이어짐
+        # 항목은 JSON에 쓸 수 있는 사전이어야 함
+        return tuple((at - self.clock, dict(item)) for at, _, item in sorted(self._heap))
+
+    @classmethod
+    def from_data(cls, data):
+        # to_data 결과(또는 JSON으로 읽은 목록)로 예약표 다시 만듦
+        scheduler = cls()
+        for remaining, item in data or ():
+            scheduler.schedule(remaining, item)
+        return scheduler
@@ -1,7 +1,20 @@
+import pygame
+
+
 class State:
     # 모든 화면(씬)의 기본 틀 제공하는 베이스 클래스임
+
+    # 매 프레임 전체 다시 그리는 씬이면 True임. False면 mark_dirty로 알린 영역만 다시 그림
+    redraw_every_frame = True
+    # 아래 씬 위에 반투명하게 겹쳐 그리는 씬이면 True임(메뉴/상점 등)
+    is_overlay = False
+
     def __init__(self, game):
         self.game = game  # 게임 본체에 접근하기 위한 참조임
+        self.underlay = None  # 오버레이일 때 아래 씬들 그려 둔 캐시 서피스임
+        self.dirty_rects = []  # 다음 프레임에 다시 그릴 화면 영역 목록임
+        self.full_dirty = True  # 화면 전체 다시 그려야 하면 True임(처음 한 번은 항상 그림)
+        self.actions = {}  # 액션 이름 → 처리 메서드 표임(키 바인딩은 core.input 참고)
 
     def on_enter(self):
         # 씬 진입 시 한 번 호출됨. 필요 없으면 구현 안 해도 됨
@@ -12,15 +25,48 @@ class State:
         pass
 
     def handle_event(self, event):
-        # 키보드/마우스 입력 처리함
+        # 액션에 묶이지 않은 입력(마우스, 미지정 키 등) 처리함
         pass
 
+    def handle_action(self, action, event):
+        # 키 입력이 액션 이름으로 바뀌어 들어옴. 현재 액션 표에서 처리 메서드 찾아 호출함
+        handler = self.current_actions().get(action)
+        if handler is not None:
+            handler()
+
+    def current_actions(self):
+        # 지금 쓰는 액션 표 반환함. 모드마다 표가 다른 씬은 재정의함
+        return self.actions
+
     def update(self, delta_time):
-        # 매 프레임 로직 업데이트함. delta_time은 경과 시간(초)임
+        # 고정 간격 로직 업데이트함. delta_time은 항상 game.fixed_dt(초)임
         pass
 
     def render(self, surface):
-        # 화면 그리기 처리 수행함
+        # 화면 그리기 처리 수행함. 움직이는 대상은 game.interpolation으로 보간 가능함
         pass
 
+    def is_idle(self):
+        # 입력 기다리는 것 말고 할 일 없으면 True 반환함. True면 루프가 이벤트 올 때까지 잠듦
+        return False
+
+    def mark_dirty(self, rect=None):
+        # 다시 그릴 영역 알림. rect 없으면 화면 전체 다시 그림
+        if rect is None:
+            self.full_dirty = True
+        elif not self.full_dirty:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def take_dirty(self, screen_rect):
+        # 이번 프레임에 다시 그릴 영역 꺼냄. 빈 목록이면 렌더링 생략해도 됨
+        if self.redraw_every_frame or self.full_dirty:
+            self.full_dirty = False
+            self.dirty_rects = []
+            return [screen_rect]
+        rects = [r.clip(screen_rect) for r in self.dirty_rects]
+        self.dirty_rects = []
+        return [r for r in rects if r.width > 0 and r.height > 0]
 
+    def has_damage(self):
+        # 아직 그리지 않은 손상 영역 있는지 여부임
+        return self.redraw_every_frame or self.full_dirty or bool(self.dirty_rects)
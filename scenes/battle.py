@@ -1,7 +1,8 @@
 import pygame
 
 from core.state import State
-from ui.ui import get_font, THEME, draw_panel, draw_gauge
+from ui.ui import get_font, THEME, HUD_COLORS, draw_panel, draw_gauge, render_text
+from ui.widgets import Gauge, Label, Panel
 
 ATB_RATE_DIVISOR = 150.0  # ATB 게이지 충전 속도임(값 클수록 느림)
 
@@ -158,7 +159,7 @@ class Skill:
 
 
 class Battle(State):
-    def __init__(self, game, enemy_index=None):
+    def __init__(self, game, enemy_id=None):
         super().__init__(game)
         self.font = get_font(16)
         self.menu_items = ["공격", "스킬", "아이템", "도망"]
@@ -171,17 +172,19 @@ class Battle(State):
         self.party = getattr(self.game, "party", default_party)
         setattr(self.game, "party", self.party)
         
-        # 오버월드에서 전투 시작 시 전달받은 적 인덱스 저장
-        self.enemy_index = enemy_index
+        # 오버월드에서 전투 시작 시 전달받은 적 ID와 그 적의 타입 저장(타입은 보상/퀘스트에도 씀)
+        self.enemy_id = enemy_id
+        self.enemy_type = None
+        overworld_enemies = getattr(self.game, "overworld_enemies", None)
+        if enemy_id is not None and overworld_enemies is not None and enemy_id in overworld_enemies:
+            self.enemy_type = overworld_enemies.type_of(enemy_id)
         
-        # 적 생성 (오버월드에서 전달받은 인덱스가 있으면 해당 적만, 없으면 기본 적들)
-        if enemy_index is not None:
+        # 적 생성 (오버월드에서 전달받은 적이 있으면 해당 적만, 없으면 기본 적들)
+        if enemy_id is not None:
             # 오버월드의 적 정보를 가져와서 전투용 적 생성
-            overworld_enemies = getattr(self.game, "overworld_enemies", [])
-            if 0 <= enemy_index < len(overworld_enemies):
-                enemy_rect = overworld_enemies[enemy_index]
-                # 적의 위치에 따라 다른 타입 결정 (난이도별 레벨과 보상)
-                enemy_type = enemy_index % 8  # 8가지 적 타입으로 확장
+            if self.enemy_type is not None:
+                # 적 타입에 따라 난이도별 레벨과 보상 결정 (8가지 적 타입)
+                enemy_type = self.enemy_type
                 if enemy_type == 0:
                     # 난이도 1: Imp (초급)
                     self.enemies = [Combatant("Imp Lv.1", max_hp=25, atk=5, speed=90, is_enemy=True, gold=10, level=1)]
@@ -242,65 +245,110 @@ class Battle(State):
         self.result_message = ""
         self.result_timer = 0.0
         
+        # 선택 단계별 액션 표(ESC 키 제거 - 나가기 버튼으로 대체)
+        self.stage_actions = {
+            "actor": {
+                "up": lambda: self._move_actor_choice(-1),
+                "down": lambda: self._move_actor_choice(1),
+                "confirm": self._confirm_actor,
+            },
+            "command": {
+                "up": lambda: self._move_command(-1),
+                "down": lambda: self._move_command(1),
+                "confirm": self._confirm_command,
+            },
+            "target": {
+                "left": lambda: self._move_target(-1),
+                "right": lambda: self._move_target(1),
+                "confirm": self._confirm_target,
+            },
+        }
+
         # 전투 시작 시 파티원 상태 초기화
         self._initialize_party_for_battle()
+        # 상단 정보 패널 위젯 트리임. 수치가 바뀐 줄만 다시 그림
+        self.top_panel = self._build_top_panel()
+
+    def _build_top_panel(self):
+        top_h = 96
+        padding = 12
+        panel = Panel((20, 12, self.game.width - 40, top_h), shadow=True)
+        # 매 턴 바뀌는 수치 줄은 글리프 아틀라스로 조립함
+        # HP 정보 (빨간색)
+        panel.add(Label((padding, padding), self.font, color=HUD_COLORS["hp"], glyphs=True,
+                        bind=lambda: "  ".join(f"{p.name}:{p.hp}/{p.max_hp}" for p in self.party)))
+        # 에너지 정보 (파란색)
+        panel.add(Label((padding, padding + 20), self.font, color=HUD_COLORS["ep"], glyphs=True,
+                        bind=lambda: "  ".join(f"{p.name}: EP {p.energy}/{p.max_energy}" for p in self.party)))
+        # 적 정보
+        panel.add(Label((padding, padding + 40), self.font, color=HUD_COLORS["enemy_hp"], glyphs=True,
+                        bind=lambda: "  ".join(f"{e.name}:{e.hp}/{e.max_hp}" for e in self.enemies)))
+        # 현재 보유한 돈 표시 (노란색)
+        panel.add(Label((padding, padding + 60), self.font, color=HUD_COLORS["gold"], glyphs=True,
+                        bind=lambda: f"보유 금액: {getattr(self.game, 'gold', 0)} 골드"))
+        # 현재 보유한 보석 표시 (파란색)
+        panel.add(Label((padding, padding + 80), self.font, color=HUD_COLORS["gems"], glyphs=True,
+                        bind=lambda: f"보유 보석: {getattr(self.game, 'gems', 0)} 개"))
+        # 파티원별 ATB 게이지(전투 중 파티는 줄어들기만 함)
+        for i in range(len(self.party)):
+            panel.add(Gauge((padding + i * 160, top_h - 24, 120, 8), lambda i=i: self.party[i].atb,
+                            show=lambda i=i: i < len(self.party)))
+        return panel
+
+    def current_actions(self):
+        return self.stage_actions.get(self.selection_stage, {})
+
+    def handle_action(self, action, event):
+        # 공격 연출 중에는 입력 무시
+        if self.is_animating:
+            return
+        super().handle_action(action, event)
+
+    def _move_actor_choice(self, step):
+        self.refresh_ready_list()
+        if self.ready_actor_indices:
+            self.actor_choice_idx = (self.actor_choice_idx + step) % len(self.ready_actor_indices)
+
+    def _confirm_actor(self):
+        self.refresh_ready_list()
+        if self.ready_actor_indices:
+            self.selection_stage = "command"
+            self.selected_index = 0
+
+    def _move_command(self, step):
+        self.selected_index = (self.selected_index + step) % len(self.menu_items)
+
+    def _confirm_command(self):
+        actor = self.get_selected_actor()
+        if actor is None or not actor.ready:
+            return
+        choice = self.menu_items[self.selected_index]
+        if choice in ("공격", "스킬"):
+            self.pending_action = choice
+            self.in_targeting = True
+            self.target_index = 0
+            self.selection_stage = "target"
+        elif choice == "아이템":
+            actor.heal(10)
+            # 아이템 사용 시 에너지도 회복 (회복량 증가)
+            actor.energy = min(actor.max_energy, actor.energy + 50)
+            actor.consume_turn()
+            self.message = f"{actor.name}이(가) 포션을 사용했다 (+10 HP, +50 에너지)"
+            self.selection_stage = "actor"
+        elif choice == "도망":
+            self.message = "도망쳤다!"
+            self.game.pop_state()
+
+    def _move_target(self, step):
+        if self.in_targeting:
+            self.target_index = (self.target_index + step) % len(self.enemies)
+
+    def _confirm_target(self):
+        if self.in_targeting:
+            self.execute_action()
 
     def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if self.is_animating:
-                return
-            # ESC 키 제거 - 나가기 버튼으로 대체
-            elif self.selection_stage == "actor":
-                if event.key in (pygame.K_UP, pygame.K_w):
-                    self.refresh_ready_list()
-                    if self.ready_actor_indices:
-                        self.actor_choice_idx = (self.actor_choice_idx - 1) % len(self.ready_actor_indices)
-                elif event.key in (pygame.K_DOWN, pygame.K_s):
-                    self.refresh_ready_list()
-                    if self.ready_actor_indices:
-                        self.actor_choice_idx = (self.actor_choice_idx + 1) % len(self.ready_actor_indices)
-                elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    self.refresh_ready_list()
-                    if self.ready_actor_indices:
-                        self.selection_stage = "command"
-                        self.selected_index = 0
-            elif self.selection_stage == "command":
-                if event.key in (pygame.K_UP, pygame.K_w):
-                    self.selected_index = (self.selected_index - 1) % len(self.menu_items)
-                elif event.key in (pygame.K_DOWN, pygame.K_s):
-                    self.selected_index = (self.selected_index + 1) % len(self.menu_items)
-                elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    actor = self.get_selected_actor()
-                    if actor is None or not actor.ready:
-                        return
-                    choice = self.menu_items[self.selected_index]
-                    if choice in ("공격", "스킬"):
-                        self.pending_action = choice
-                        self.in_targeting = True
-                        self.target_index = 0
-                        self.selection_stage = "target"
-                    elif choice == "아이템":
-                        actor.heal(10)
-                        # 아이템 사용 시 에너지도 회복 (회복량 증가)
-                        actor.energy = min(actor.max_energy, actor.energy + 50)
-                        actor.consume_turn()
-                        self.message = f"{actor.name}이(가) 포션을 사용했다 (+10 HP, +50 에너지)"
-                        self.selection_stage = "actor"
-                    elif choice == "도망":
-                        self.message = "도망쳤다!"
-                        self.game.pop_state()
-            elif self.selection_stage == "target":
-                if event.key in (pygame.K_LEFT,):
-                    if self.in_targeting:
-                        self.target_index = (self.target_index - 1) % len(self.enemies)
-                elif event.key in (pygame.K_RIGHT,):
-                    if self.in_targeting:
-                        self.target_index = (self.target_index + 1) % len(self.enemies)
-                elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    if self.in_targeting:
-                        self.execute_action()
-                        return
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # 나가기 버튼 클릭
             exit_button_rect = pygame.Rect(self.game.width - 100, 10, 80, 30)
             if exit_button_rect.collidepoint(event.pos):
@@ -431,11 +479,10 @@ class Battle(State):
         if not self.enemies:
             # 전투 승리 시 적의 레벨에 따라 다른 보상 제공
             defeated_enemy = None
-            if hasattr(self, 'enemy_index') and self.enemy_index is not None:
+            if self.enemy_id is not None:
                 # 오버월드에서 전투를 시작한 경우, 해당 적의 정보를 가져옴
-                overworld_enemies = getattr(self.game, "overworld_enemies", [])
-                if 0 <= self.enemy_index < len(overworld_enemies):
-                    enemy_type = self.enemy_index % 8
+                if self.enemy_type is not None:
+                    enemy_type = self.enemy_type
                     # 적 타입에 따른 보상 계산
                     if enemy_type == 0:  # Imp Lv.1
                         exp_reward = 15
@@ -518,9 +565,9 @@ class Battle(State):
             self._update_quest_progress()
             
             # 오버월드에서 전투를 시작한 경우, 해당 적을 제거
-            if self.enemy_index is not None:
+            if self.enemy_id is not None:
                 # 게임에 오버월드 적 제거 정보 저장
-                self.game.defeated_enemy_index = self.enemy_index
+                self.game.defeated_enemy_id = self.enemy_id
             
             self.game.pop_state()
         elif not self.party:
@@ -529,9 +576,8 @@ class Battle(State):
             self._restore_party_after_battle()
             
             # 게임오버 상태로 전환
-            from .title import TitleScreen
             self.game.pop_state()  # 현재 전투 상태 제거
-            title_screen = TitleScreen(self.game)
+            title_screen = self.game.create_scene("title")
             title_screen.set_game_over_mode()
             self.game.push_state(title_screen)
 
@@ -601,16 +647,14 @@ class Battle(State):
                         print(f"퀘스트 진행도 업데이트: {quest.title} - {quest.progress}/{quest.target_count} (처치한 적: {defeated_enemy_name})")
                 
                 # 강한 적 처치 퀘스트 (레벨 3 이상)
-                elif '강한 적' in quest.title and hasattr(self, 'enemy_index') and self.enemy_index is not None:
-                    enemy_type = self.enemy_index % 8
-                    if enemy_type >= 2:  # Wolf Lv.3 이상
+                elif '강한 적' in quest.title and self.enemy_type is not None:
+                    if self.enemy_type >= 2:  # Wolf Lv.3 이상
                         quest.progress = min(quest.target_count, quest.progress + 1)
                         print(f"퀘스트 진행도 업데이트: {quest.title} - {quest.progress}/{quest.target_count}")
                 
                 # 보스 처치 퀘스트 (Demon Lord)
-                elif '보스' in quest.title and hasattr(self, 'enemy_index') and self.enemy_index is not None:
-                    enemy_type = self.enemy_index % 8
-                    if enemy_type == 7:  # Demon Lord Lv.8
+                elif '보스' in quest.title and self.enemy_type is not None:
+                    if self.enemy_type == 7:  # Demon Lord Lv.8
                         quest.progress = min(quest.target_count, quest.progress + 1)
                         print(f"퀘스트 진행도 업데이트: {quest.title} - {quest.progress}/{quest.target_count}")
                 
@@ -718,40 +762,8 @@ class Battle(State):
 
     def render(self, surface):
         surface.fill(THEME["bg"])
-        top_h = 96
-        top_rect = pygame.Rect(20, 12, self.game.width - 40, top_h)
-        draw_panel(surface, top_rect)
+        self.top_panel.draw(surface)
         padding = 12
-        # HP 정보 (빨간색)
-        hp_text = "  ".join(f"{p.name}:{p.hp}/{p.max_hp}" for p in self.party)
-        hp_surface = self.font.render(hp_text, True, (255, 100, 100))  # 빨간색
-        surface.blit(hp_surface, (top_rect.x + padding, top_rect.y + padding))
-        
-        # 에너지 정보 (파란색)
-        energy_text = "  ".join(f"{p.name}: EP {p.energy}/{p.max_energy}" for p in self.party)
-        energy_surface = self.font.render(energy_text, True, (100, 150, 255))  # 파란색
-        surface.blit(energy_surface, (top_rect.x + padding, top_rect.y + padding + 20))
-        
-        # 적 정보 (기존과 동일)
-        enemy_hp = "  ".join(f"{e.name}:{e.hp}/{e.max_hp}" for e in self.enemies)
-        enemy_text = self.font.render(enemy_hp, True, (220, 180, 180))
-        surface.blit(enemy_text, (top_rect.x + padding, top_rect.y + padding + 40))
-        
-        # 현재 보유한 돈 표시 (노란색)
-        current_gold = getattr(self.game, "gold", 0)
-        gold_text = f"보유 금액: {current_gold} 골드"
-        gold_surface = self.font.render(gold_text, True, (255, 215, 0))  # 노란색
-        surface.blit(gold_surface, (top_rect.x + padding, top_rect.y + padding + 60))
-        
-        # 현재 보유한 보석 표시 (파란색)
-        current_gems = getattr(self.game, "gems", 0)
-        gems_text = f"보유 보석: {current_gems} 개"
-        gems_surface = self.font.render(gems_text, True, (100, 200, 255))  # 파란색
-        surface.blit(gems_surface, (top_rect.x + padding, top_rect.y + padding + 80))
-        for i, p in enumerate(self.party):
-            gx = top_rect.x + padding + i * 160
-            gy = top_rect.y + top_h - 24
-            draw_gauge(surface, gx, gy, 120, 8, p.atb)
         base_y = self.game.height // 2
         for i, e in enumerate(self.enemies):
             x = self.game.width // 2 + i * 60
@@ -778,7 +790,7 @@ class Battle(State):
             # 모든 적을 동그라미로 표시
             pygame.draw.circle(surface, color, (x, base_y), 20)
             # 적의 이름을 위에 표시
-            name_text = self.font.render(e.name, True, color)
+            name_text = render_text(self.font, e.name, color)
             name_x = x - name_text.get_width() // 2
             surface.blit(name_text, (name_x, base_y - 40))
             # ATB 게이지 표시
@@ -791,30 +803,20 @@ class Battle(State):
             draw_gauge(surface, x - 16, base_y + 96, 32, 6, p.atb, fill_color=(255, 255, 100))
             # HP 게이지 (빨간색), ATB 아래 표시
             hp_ratio = p.hp / max(1, p.max_hp)
-            hp_gauge_rect = pygame.Rect(x - 16, base_y + 106, 32, 6)
-            pygame.draw.rect(surface, (60, 60, 60), hp_gauge_rect, border_radius=3)
-            if hp_ratio > 0:
-                hp_fill_width = int(32 * hp_ratio)
-                hp_fill_rect = pygame.Rect(x - 16, base_y + 106, hp_fill_width, 6)
-                pygame.draw.rect(surface, (255, 100, 100), hp_fill_rect, border_radius=3)
-            pygame.draw.rect(surface, (200, 200, 200), hp_gauge_rect, 1, border_radius=3)
+            draw_gauge(surface, x - 16, base_y + 106, 32, 6, hp_ratio,
+                       fill_color=HUD_COLORS["hp"], border_color=(200, 200, 200))
             
             # HP 레이블 (빨간색)
-            hp_label = self.font.render("HP", True, (255, 100, 100))
+            hp_label = render_text(self.font, "HP", (255, 100, 100))
             surface.blit(hp_label, (x - 16, base_y + 114))
             
             # 에너지 게이지 (파란색), HP 아래 표시
             energy_ratio = p.energy / max(1, p.max_energy)
-            energy_gauge_rect = pygame.Rect(x - 16, base_y + 116, 32, 6)
-            pygame.draw.rect(surface, (60, 60, 60), energy_gauge_rect, border_radius=3)
-            if energy_ratio > 0:
-                energy_fill_width = int(32 * energy_ratio)
-                energy_fill_rect = pygame.Rect(x - 16, base_y + 116, energy_fill_width, 6)
-                pygame.draw.rect(surface, (100, 150, 255), energy_fill_rect, border_radius=3)
-            pygame.draw.rect(surface, (200, 200, 200), energy_gauge_rect, 1, border_radius=3)
+            draw_gauge(surface, x - 16, base_y + 116, 32, 6, energy_ratio,
+                       fill_color=HUD_COLORS["ep"], border_color=(200, 200, 200))
             
             # EP 레이블 (파란색)
-            ep_label = self.font.render("EP", True, (100, 150, 255))
+            ep_label = render_text(self.font, "EP", (100, 150, 255))
             surface.blit(ep_label, (x - 16, base_y + 124))
         menu_width = self.game.width - 40
         menu_height = 100
@@ -826,14 +828,14 @@ class Battle(State):
         left_y = menu_rect.y + padding
         ready_idxs = [i for i, p in enumerate(self.party) if p.is_alive() and p.ready]
         if not ready_idxs:
-            surface.blit(self.font.render("행동자 없음", True, THEME["text"]), (left_x, left_y))
+            surface.blit(render_text(self.font, "행동자 없음", THEME["text"]), (left_x, left_y))
         else:
             for row, idx in enumerate(ready_idxs):
                 name = self.party[idx].name
                 selected = (self.selection_stage == "actor" and row == self.actor_choice_idx)
                 color = (255, 255, 0) if selected else THEME["text"]
                 label = ("▶ " if selected else "  ") + name
-                surface.blit(self.font.render(label, True, color), (left_x, left_y + row * 20))
+                surface.blit(render_text(self.font, label, color), (left_x, left_y + row * 20))
 
         # 우측: 커맨드 메뉴
         cmd_x = menu_rect.x + 180
@@ -841,14 +843,14 @@ class Battle(State):
         for i, label in enumerate(self.menu_items):
             selected = (self.selection_stage == "command" and i == self.selected_index)
             color = (255, 255, 0) if selected else (220, 220, 220)
-            text_surface = self.font.render(label, True, color)
+            text_surface = render_text(self.font, label, color)
             surface.blit(text_surface, (cmd_x + 10, cmd_y + i * 20))
 
         # 별도 결과 메시지 패널(메뉴 위)
         if self.result_timer > 0.0 and self.result_message:
             info_rect = pygame.Rect(menu_rect.x, menu_rect.y - 36, menu_rect.width, 28)
             draw_panel(surface, info_rect, shadow=False)
-            surface.blit(self.font.render(self.result_message, True, THEME["text"]), (info_rect.x + padding, info_rect.y + 6))
+            surface.blit(render_text(self.font, self.result_message, THEME["text"]), (info_rect.x + padding, info_rect.y + 6))
 
         # 타깃 선택 인디케이터
         if self.selection_stage == "target" and self.enemies:
@@ -862,21 +864,19 @@ class Battle(State):
         if player_ready:
             pause_rect = pygame.Rect(self.game.width - 120, 80, 100, 30)
             draw_panel(surface, pause_rect, shadow=False)
-            pause_text = self.font.render("시간 정지", True, (255, 255, 100))
+            pause_text = render_text(self.font, "시간 정지", (255, 255, 100))
             surface.blit(pause_text, (pause_rect.x + 10, pause_rect.y + 8))
         
         # 나가기 버튼
         exit_button_rect = pygame.Rect(self.game.width - 100, 10, 80, 30)
-        pygame.draw.rect(surface, (150, 50, 50), exit_button_rect, border_radius=4)
-        pygame.draw.rect(surface, (200, 200, 200), exit_button_rect, 1, border_radius=4)
-        exit_text = self.font.render("나가기", True, (255, 255, 255))
+        draw_panel(surface, exit_button_rect, (150, 50, 50), (200, 200, 200), 1, shadow=False, radius=4)
+        exit_text = render_text(self.font, "나가기", (255, 255, 255))
         exit_text_rect = exit_text.get_rect(center=exit_button_rect.center)
         surface.blit(exit_text, exit_text_rect)
 
     def _trigger_ending(self):
         # 최종보스 처치 시 엔딩으로 이동
-        from .ending import Ending
         self.game.state_stack.clear()  # 모든 상태 제거
-        self.game.push_state(Ending(self.game))
+        self.game.push_scene("ending")
 
 
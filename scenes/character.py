@@ -1,12 +1,16 @@
 import pygame
 
 from core.state import State
-from ui.ui import get_font, THEME, draw_panel
-from .battle import Combatant, Item
+from ui.ui import get_font, THEME, draw_panel, render_text
 
 
 class Character(State):
     # 캐릭터 상태 및 인벤토리 화면임
+
+    # 입력 있을 때만 다시 그림
+    redraw_every_frame = False
+    # 아래 화면 위에 겹쳐 그림
+    is_overlay = True
     
     def __init__(self, game):
         super().__init__(game)
@@ -27,6 +31,7 @@ class Character(State):
             self.game.inventory = []
         elif not isinstance(self.game, object) or not isinstance(self.game.inventory, list):
             # 딕셔너리 형태일 경우 가능한 정보 바탕으로 Item 리스트 재구성함
+            from .battle import Item
             upgraded = []
             inv = getattr(self.game, "inventory", {}) or {}
             for name in inv.get("equipment", []):
@@ -37,35 +42,31 @@ class Character(State):
                 upgraded.append(Item(name, "key", 0, ""))
             self.game.inventory = upgraded
 
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            # ESC 키 제거 - I 키로 나가기
-            if event.key == pygame.K_i:
-                self.game.pop_state()
-            elif event.key == pygame.K_TAB:
-                # 모드 전환함
-                self.mode = (self.mode + 1) % len(self.modes)
-                self.selected_index = 0
-            elif self.mode == 0:  # 상태 모드
-                self._handle_status_events(event)
-            else:  # 인벤토리 모드
-                self._handle_inventory_events(event)
-    
-    def _handle_status_events(self, event):
-        # 상태 모드 이벤트 처리
-        pass
-    
-    def _handle_inventory_events(self, event):
+        # 상태 모드는 I(나가기)/Tab(모드 전환)만 씀
+        self.status_actions = {"inventory": self.game.pop_state, "switch": self._switch_mode}
         # 인벤토리: ↑/↓로 선택하고 Enter로 사용/착용함
-        if event.key in (pygame.K_UP, pygame.K_w):
-            if self.game.inventory:
-                self.selected_index = (self.selected_index - 1) % len(self.game.inventory)
-        elif event.key in (pygame.K_DOWN, pygame.K_s):
-            if self.game.inventory:
-                self.selected_index = (self.selected_index + 1) % len(self.game.inventory)
-        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-            self._use_item()
-    
+        self.inventory_actions = dict(self.status_actions, **{
+            "up": lambda: self._move_selection(-1),
+            "down": lambda: self._move_selection(1),
+            "confirm": self._use_item,
+        })
+
+    def current_actions(self):
+        return self.status_actions if self.mode == 0 else self.inventory_actions
+
+    def handle_action(self, action, event):
+        self.mark_dirty()
+        super().handle_action(action, event)
+
+    def _switch_mode(self):
+        # 모드 전환함
+        self.mode = (self.mode + 1) % len(self.modes)
+        self.selected_index = 0
+
+    def _move_selection(self, step):
+        if self.game.inventory:
+            self.selected_index = (self.selected_index + step) % len(self.game.inventory)
+
     def _use_item(self):
         # 선택된 아이템 사용하거나 착용함
         if not self.game.inventory:
@@ -78,6 +79,9 @@ class Character(State):
             self.message = "파티가 없습니다"
             return
         
+        # HP/공격력 등 아래 화면에 보이는 값이 바뀌므로 스냅샷 다시 만듦
+        self.game.invalidate_underlay()
+        
         player = party[0]  # 첫 번째 파티원 대상으로 처리
         
         if selected_item.item_type == "weapon":
@@ -135,6 +139,10 @@ class Character(State):
             else:
                 self.selected_index = 0
 
+    def is_idle(self):
+        # 입력 기다리는 동안 할 일 없음
+        return True
+
     def update(self, delta_time):
         # 별도 업데이트 필요 없음
         pass
@@ -147,15 +155,16 @@ class Character(State):
     
     def _render_status(self, surface):
         # 상태 화면 렌더링함
-        surface.fill(THEME["bg"])
+        if not self.game.draw_underlay(self, surface):
+            surface.fill(THEME["bg"])
         
         # 제목과 모드 표시함
-        title = self.title_font.render("캐릭터 상태", True, THEME["text"])
+        title = render_text(self.title_font, "캐릭터 상태", THEME["text"])
         surface.blit(title, (20, 16))
         
         # 모드 전환 안내 표시함
         mode_text = f"Tab: {self.modes[1]} 보기"
-        mode_surface = self.font.render(mode_text, True, (150, 150, 150))
+        mode_surface = render_text(self.font, mode_text, (150, 150, 150))
         surface.blit(mode_surface, (20, 40))
         
         # 파티 정보 표시함
@@ -164,7 +173,7 @@ class Character(State):
         draw_panel(surface, panel_rect)
         
         if not party:
-            empty = self.text_font.render("파티가 없습니다.", True, THEME["text_dim"])
+            empty = render_text(self.text_font, "파티가 없습니다.", THEME["text_dim"])
             surface.blit(empty, (panel_rect.x + 16, panel_rect.y + 16))
             return
         
@@ -174,38 +183,38 @@ class Character(State):
         header = ["이름", "레벨", "HP", "공격", "경험치", "상태이상"]
         
         for i, h in enumerate(header):
-            surface.blit(self.text_font.render(h, True, THEME["text"]), (col_x[i], panel_rect.y + 12))
+            surface.blit(render_text(self.text_font, h, THEME["text"]), (col_x[i], panel_rect.y + 12))
         
         # 파티원 정보 출력함
         y = panel_rect.y + 40
         for c in party:
             # 이름
-            surface.blit(self.text_font.render(c.name, True, THEME["text"]), (col_x[0], y))
+            surface.blit(render_text(self.text_font, c.name, THEME["text"]), (col_x[0], y))
             
             # 레벨
             level_text = f"Lv.{getattr(c, 'level', 1)}"
-            surface.blit(self.text_font.render(level_text, True, THEME["text"]), (col_x[1], y))
+            surface.blit(render_text(self.text_font, level_text, THEME["text"]), (col_x[1], y))
             
             # HP
             hp_text = f"{c.hp}/{c.max_hp}"
-            surface.blit(self.text_font.render(hp_text, True, THEME["text"]), (col_x[2], y))
+            surface.blit(render_text(self.text_font, hp_text, THEME["text"]), (col_x[2], y))
             
             # 공격력
             atk_text = str(getattr(c, 'get_total_atk', lambda: c.atk)())
-            surface.blit(self.text_font.render(atk_text, True, THEME["text"]), (col_x[3], y))
+            surface.blit(render_text(self.text_font, atk_text, THEME["text"]), (col_x[3], y))
             
             # 경험치
             exp = getattr(c, 'exp', 0)
             max_exp = getattr(c, 'max_exp', 100)
             exp_text = f"{exp}/{max_exp}"
-            surface.blit(self.text_font.render(exp_text, True, THEME["text"]), (col_x[4], y))
+            surface.blit(render_text(self.text_font, exp_text, THEME["text"]), (col_x[4], y))
             
             # 상태이상
             if hasattr(c, 'statuses') and c.statuses:
                 st = ", ".join(s.name for s in c.statuses if hasattr(s, 'is_active') and s.is_active())
             else:
                 st = "없음"
-            surface.blit(self.text_font.render(st, True, THEME["text"]), (col_x[5], y))
+            surface.blit(render_text(self.text_font, st, THEME["text"]), (col_x[5], y))
             
             y += 28
         
@@ -217,12 +226,13 @@ class Character(State):
         
         control_y = self.game.height - 60
         for i, control in enumerate(controls):
-            control_text = self.font.render(control, True, (150, 150, 150))
+            control_text = render_text(self.font, control, (150, 150, 150))
             surface.blit(control_text, (20, control_y + i * 20))
     
     def _render_inventory(self, surface):
         # 인벤토리 화면 렌더링함
-        surface.fill(THEME["bg"])
+        if not self.game.draw_underlay(self, surface):
+            surface.fill(THEME["bg"])
         
         # 메인 패널 표시함
         panel_width = 500
@@ -232,11 +242,11 @@ class Character(State):
         
         # 제목과 모드 전환 안내 표시함
         title_text = "인벤토리"
-        title_surface = self.font.render(title_text, True, THEME["text"])
+        title_surface = render_text(self.font, title_text, THEME["text"])
         surface.blit(title_surface, (panel.x + 16, panel.y + 12))
         
         mode_text = f"Tab: {self.modes[0]} 보기"
-        mode_surface = self.font.render(mode_text, True, (150, 150, 150))
+        mode_surface = render_text(self.font, mode_text, (150, 150, 150))
         surface.blit(mode_surface, (panel.x + 16, panel.y + 30))
         
         # 플레이어 정보 표시함
@@ -255,13 +265,13 @@ class Character(State):
             else:
                 player_info += " (착용무기: 없음)"
             
-            player_surface = self.font.render(player_info, True, (255, 255, 100))
+            player_surface = render_text(self.font, player_info, (255, 255, 100))
             surface.blit(player_surface, (panel.x + 16, panel.y + 50))
         
         # 아이템 목록 표시함
         if not self.game.inventory:
             no_items_text = "인벤토리가 비어있습니다"
-            no_items_surface = self.font.render(no_items_text, True, (200, 200, 200))
+            no_items_surface = render_text(self.font, no_items_text, (200, 200, 200))
             surface.blit(no_items_surface, (panel.x + 16, panel.y + 90))
         else:
             for i, item in enumerate(self.game.inventory):
@@ -272,18 +282,18 @@ class Character(State):
                 
                 # 아이템 이름 표시함
                 name_text = item.name
-                name_surface = self.font.render(name_text, True, color)
+                name_surface = render_text(self.font, name_text, color)
                 surface.blit(name_surface, (panel.x + 16, y_pos))
                 
                 # 아이템 타입 표시함
                 type_text = f"[{getattr(item, 'item_type', '')}]"
                 type_color = (100, 255, 100) if item.item_type == "weapon" else (255, 100, 100)
-                type_surface = self.font.render(type_text, True, type_color)
+                type_surface = render_text(self.font, type_text, type_color)
                 surface.blit(type_surface, (panel.x + 120, y_pos))
                 
                 # 효과 설명 표시함
                 effect_text = getattr(item, 'effect', '')
-                effect_surface = self.font.render(effect_text, True, (100, 255, 100))
+                effect_surface = render_text(self.font, effect_text, (100, 255, 100))
                 surface.blit(effect_surface, (panel.x + 200, y_pos))
                 
                 # 착용 상태 표시함(무기인 경우)
@@ -291,14 +301,14 @@ class Character(State):
                     hasattr(party[0], 'equipped_weapon') and 
                     party[0].equipped_weapon == item):
                     equipped_text = "[착용중]"
-                    equipped_surface = self.font.render(equipped_text, True, (255, 215, 0))
+                    equipped_surface = render_text(self.font, equipped_text, (255, 215, 0))
                     surface.blit(equipped_surface, (panel.x + 350, y_pos))
         
         # 조작 안내 표시함
         help_text = "↑↓: 선택  Enter: 사용/착용  Tab: 상태 보기  I: 나가기"
-        help_surface = self.font.render(help_text, True, (200, 200, 200))
+        help_surface = render_text(self.font, help_text, (200, 200, 200))
         surface.blit(help_surface, (panel.x + 16, panel.y + panel.height - 50))
         
         # 메시지 표시함
-        message_surface = self.font.render(self.message, True, THEME["text"])
+        message_surface = render_text(self.font, self.message, THEME["text"])
         surface.blit(message_surface, (panel.x + 16, panel.y + panel.height - 26))
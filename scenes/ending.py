@@ -1,11 +1,14 @@
 import pygame
 
 from core.state import State
-from ui.ui import get_font, THEME, draw_panel
+from ui.ui import get_font, THEME, draw_panel, render_text
 
 
 class Ending(State):
     # 엔딩 화면: 최종보스 처치 후 스토리 마무리
+
+    # 페이지 넘김이나 페이드 중일 때만 다시 그림
+    redraw_every_frame = False
     
     def __init__(self, game):
         super().__init__(game)
@@ -42,14 +45,12 @@ class Ending(State):
         self.fade_timer = 0.0
         self.fade_duration = 1.0
         self.is_fading = False
+        # Enter/Space로 넘기고 ESC로 타이틀로 돌아감
+        self.actions = {"confirm": self._next_page, "cancel": self._go_to_title}
         
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                self._next_page()
-            elif event.key == pygame.K_ESCAPE:
-                # 타이틀로 돌아가기
-                self._go_to_title()
+    def handle_action(self, action, event):
+        self.mark_dirty()
+        super().handle_action(action, event)
     
     def _next_page(self):
         if self.page_index < len(self.pages) - 1:
@@ -60,13 +61,17 @@ class Ending(State):
     
     def _go_to_title(self):
         # 타이틀 화면으로 이동
-        from .title import TitleScreen
         self.game.state_stack.clear()
-        self.game.push_state(TitleScreen(self.game))
+        self.game.push_scene("title")
     
+    def is_idle(self):
+        # 페이드 중이 아니면 입력 기다리기만 함
+        return not self.is_fading
+
     def update(self, delta_time):
         # 페이드 효과 처리
         if self.is_fading:
+            self.mark_dirty()
             self.fade_timer += delta_time
             if self.fade_timer >= self.fade_duration:
                 self.is_fading = False
@@ -94,7 +99,7 @@ class Ending(State):
         draw_panel(surface, panel)
         
         # 제목
-        title = self.title_font.render("THE END", True, THEME["text"])
+        title = render_text(self.title_font, "THE END", THEME["text"])
         title_rect = title.get_rect(centerx=panel.centerx, y=panel.y + 20)
         surface.blit(title, title_rect)
         
@@ -103,7 +108,7 @@ class Ending(State):
         y = panel.y + 60
         for line in lines:
             if line:  # 빈 줄이 아닌 경우만
-                text_surface = self.font.render(line, True, THEME["text"])
+                text_surface = render_text(self.font, line, THEME["text"])
                 text_rect = text_surface.get_rect(centerx=panel.centerx, y=y)
                 surface.blit(text_surface, text_rect)
             y += 30
@@ -117,6 +122,6 @@ class Ending(State):
         else:
             hint_text = "Enter/Space: 타이틀로 돌아가기  ESC: 타이틀로"
         
-        hint_surface = self.small_font.render(hint_text, True, THEME["text"])
+        hint_surface = render_text(self.small_font, hint_text, THEME["text"])
         hint_rect_text = hint_surface.get_rect(centerx=hint_rect.centerx, centery=hint_rect.centery)
         surface.blit(hint_surface, hint_rect_text)
@@ -1,12 +1,15 @@
 import pygame
 
 from core.state import State
-from ui.ui import get_font, THEME, draw_panel, draw_text_panel
+from ui.ui import get_font, THEME, draw_panel, draw_text_panel, render_text
 
 
 class Intro(State):
     # 첫 시작 스토리 소개 화면임
 
+    # 페이지 넘길 때만 다시 그림
+    redraw_every_frame = False
+
     def __init__(self, game):
         super().__init__(game)
         self.font = get_font(18)
@@ -31,14 +34,12 @@ class Intro(State):
             ],
         ]
         self.page_index = 0
+        # Enter/Space로 넘기고 ESC로 스킵
+        self.actions = {"confirm": self._next_page, "cancel": self._finish}
 
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                self._next_page()
-            elif event.key == pygame.K_ESCAPE:
-                # 스킵
-                self._finish()
+    def handle_action(self, action, event):
+        self.mark_dirty()
+        super().handle_action(action, event)
 
     def _next_page(self):
         if self.page_index < len(self.pages) - 1:
@@ -48,9 +49,12 @@ class Intro(State):
 
     def _finish(self):
         # 오버월드로 전환
-        from .overworld import Overworld
         self.game.state_stack.clear()
-        self.game.push_state(Overworld(self.game))
+        self.game.push_scene("overworld")
+
+    def is_idle(self):
+        # 입력 기다리는 동안 할 일 없음
+        return True
 
     def update(self, delta_time):
         # 별도 업데이트 필요 없음
@@ -64,7 +68,7 @@ class Intro(State):
         lines = self.pages[self.page_index]
         y = panel.y + 22
         for line in lines:
-            surf = self.font.render(line, True, THEME["text"])
+            surf = render_text(self.font, line, THEME["text"])
             surface.blit(surf, (panel.x + 22, y))
             y += surf.get_height() + 6
 
@@ -72,7 +76,7 @@ class Intro(State):
         hint_rect = pygame.Rect(panel.x, panel.bottom + 10, panel.width, 26)
         draw_panel(surface, hint_rect, shadow=False)
         hint = "Enter/Space: 다음  ESC: 스킵"
-        hint_surf = self.small_font.render(hint, True, THEME["text"])
+        hint_surf = render_text(self.small_font, hint, THEME["text"])
         surface.blit(hint_surf, (hint_rect.x + 10, hint_rect.y + 5))
 
 
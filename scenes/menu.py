@@ -1,11 +1,16 @@
 import pygame
 
 from core.state import State
-from ui.ui import get_font, THEME, draw_panel
+from ui.ui import get_font, THEME, draw_panel, render_text
 
 
 class Menu(State):
     # 메뉴 및 설정 화면임(ESC로 닫을 수 있음)
+
+    # 입력 있을 때 패널 영역만 다시 그림
+    redraw_every_frame = False
+    # 오버월드 위에 겹쳐 그림
+    is_overlay = True
     
     def __init__(self, game):
         super().__init__(game)
@@ -15,7 +20,7 @@ class Menu(State):
         
         # 설정 관련 변수임
         self.volume = 100
-        self.show_fps = True
+        # FPS 표시는 게임 전체 설정이라 game.show_fps에 저장함
         self.fullscreen = False
         
         # 설정 모드 여부임
@@ -23,48 +28,49 @@ class Menu(State):
         self.settings_index = 0
         self.settings_items = ["볼륨", "FPS 표시", "전체화면", "돌아가기"]
 
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if self.is_settings_mode:
-                self._handle_settings_events(event)
-            else:
-                self._handle_menu_events(event)
-
-    def _handle_menu_events(self, event):
-        # 메뉴 동작: ↑/↓ 이동, Enter 선택, ESC 닫기
-        if event.key in (pygame.K_UP, pygame.K_w):
-            self.index = (self.index - 1) % len(self.items)
-        elif event.key in (pygame.K_DOWN, pygame.K_s):
-            self.index = (self.index + 1) % len(self.items)
-        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-            self._activate()
-        elif event.key == pygame.K_m:
-            # M 키로 메뉴 닫기
-            self.game.pop_state()
+        # 메뉴 동작: ↑/↓ 이동, Enter 선택, M 닫기
+        self.menu_actions = {
+            "up": lambda: self._move_menu(-1),
+            "down": lambda: self._move_menu(1),
+            "confirm": self._activate,
+            "menu": self.game.pop_state,
+        }
+        # 설정 동작: ↑/↓ 항목 선택, ←/→ 값 변경, Enter/M 돌아가기
+        self.settings_actions = {
+            "up": lambda: self._move_settings(-1),
+            "down": lambda: self._move_settings(1),
+            "left": self._decrease_setting,
+            "right": self._increase_setting,
+            "confirm": self._confirm_setting,
+            "menu": self._leave_settings,
+        }
+
+    def current_actions(self):
+        return self.settings_actions if self.is_settings_mode else self.menu_actions
+
+    def handle_action(self, action, event):
+        self.mark_dirty(self._panel_rect())
+        super().handle_action(action, event)
+
+    def _move_menu(self, step):
+        self.index = (self.index + step) % len(self.items)
 
-    def _handle_settings_events(self, event):
-        # 설정 동작: ↑/↓ 항목 선택, ←/→ 값 변경, Enter/ESC 돌아가기
-        if event.key in (pygame.K_UP, pygame.K_w):
-            self.settings_index = (self.settings_index - 1) % len(self.settings_items)
-        elif event.key in (pygame.K_DOWN, pygame.K_s):
-            self.settings_index = (self.settings_index + 1) % len(self.settings_items)
-        elif event.key == pygame.K_LEFT:
-            self._decrease_setting()
-        elif event.key == pygame.K_RIGHT:
-            self._increase_setting()
-        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-            if self.settings_index == 3:  # 돌아가기
-                self.is_settings_mode = False
-        elif event.key == pygame.K_m:
-            # M 키로 설정 모드 나가기
-            self.is_settings_mode = False
+    def _move_settings(self, step):
+        self.settings_index = (self.settings_index + step) % len(self.settings_items)
+
+    def _confirm_setting(self):
+        if self.settings_index == 3:  # 돌아가기
+            self._leave_settings()
+
+    def _leave_settings(self):
+        self.is_settings_mode = False
 
     def _decrease_setting(self):
         # 값 낮추거나 토글함
         if self.settings_index == 0:  # 볼륨
             self.volume = max(0, self.volume - 10)
         elif self.settings_index == 1:  # FPS 표시
-            self.show_fps = not self.show_fps
+            self.game.show_fps = not self.game.show_fps
         elif self.settings_index == 2:  # 전체화면
             self.fullscreen = not self.fullscreen
 
@@ -73,7 +79,7 @@ class Menu(State):
         if self.settings_index == 0:  # 볼륨
             self.volume = min(100, self.volume + 10)
         elif self.settings_index == 1:  # FPS 표시
-            self.show_fps = not self.show_fps
+            self.game.show_fps = not self.game.show_fps
         elif self.settings_index == 2:  # 전체화면
             self.fullscreen = not self.fullscreen
 
@@ -81,30 +87,33 @@ class Menu(State):
         # 선택된 메뉴 실행함
         choice = self.items[self.index]
         if choice == "캐릭터":
-            from .character import Character
-            self.game.push_state(Character(self.game))
+            self.game.push_scene("character")
         elif choice == "상점":
-            from .shop import Shop
-            self.game.push_state(Shop(self.game))
+            self.game.push_scene("shop")
         elif choice == "퀘스트":
-            from .quests import QuestLog
-            self.game.push_state(QuestLog(self.game))
+            self.game.push_scene("quest_log")
         elif choice == "설정":
             self.is_settings_mode = True
             self.settings_index = 0
         elif choice == "세이브":
-            from .quests import SaveLoad
-            self.game.push_state(SaveLoad(self.game, mode="save"))
+            self.game.push_scene("save_load", mode="save")
         elif choice == "로드":
-            from .quests import SaveLoad
-            self.game.push_state(SaveLoad(self.game, mode="load"))
+            self.game.push_scene("save_load", mode="load")
         elif choice == "닫기":
             self.game.pop_state()
 
+    def is_idle(self):
+        # 입력 기다리는 동안 할 일 없음
+        return True
+
     def update(self, delta_time):
         # 별도 업데이트 필요 없음
         pass
 
+    def _panel_rect(self):
+        # 메뉴/설정 공용 패널 영역임
+        return pygame.Rect(self.game.width//2 - 120, self.game.height//2 - 100, 240, 250)
+
     def render(self, surface):
         if self.is_settings_mode:
             self._render_settings(surface)
@@ -113,23 +122,25 @@ class Menu(State):
 
     def _render_menu(self, surface):
         # 메뉴 렌더링함(선택 항목은 노란색으로 표시됨)
-        surface.fill(THEME["bg"])
-        panel = pygame.Rect(self.game.width//2 - 120, self.game.height//2 - 100, 240, 250)
+        if not self.game.draw_underlay(self, surface):
+            surface.fill(THEME["bg"])
+        panel = self._panel_rect()
         draw_panel(surface, panel)
         
         # 메뉴 항목 표시함
         for i, it in enumerate(self.items):
             color = (255, 255, 0) if i == self.index else THEME["text"]
-            surface.blit(self.font.render(it, True, color), (panel.x + 16, panel.y + 20 + i * 28))
+            surface.blit(render_text(self.font, it, color), (panel.x + 16, panel.y + 20 + i * 28))
 
     def _render_settings(self, surface):
         # 설정 화면 렌더링함
-        surface.fill(THEME["bg"])
-        panel = pygame.Rect(self.game.width//2 - 120, self.game.height//2 - 100, 240, 250)
+        if not self.game.draw_underlay(self, surface):
+            surface.fill(THEME["bg"])
+        panel = self._panel_rect()
         draw_panel(surface, panel)
         
         # 제목 표시함
-        title = self.font.render("설정", True, THEME["text"])
+        title = render_text(self.font, "설정", THEME["text"])
         surface.blit(title, (panel.x + 16, panel.y + 12))
         
         # 설정 항목 표시함
@@ -139,13 +150,13 @@ class Menu(State):
             if item == "볼륨":
                 item_text = f"{item}: {self.volume}%"
             elif item == "FPS 표시":
-                item_text = f"{item}: {'켜짐' if self.show_fps else '꺼짐'}"
+                item_text = f"{item}: {'켜짐' if self.game.show_fps else '꺼짐'}"
             elif item == "전체화면":
                 item_text = f"{item}: {'켜짐' if self.fullscreen else '꺼짐'}"
             else:
                 item_text = item
             
-            surface.blit(self.font.render(item_text, True, color), (panel.x + 16, panel.y + 20 + i * 28))
+            surface.blit(render_text(self.font, item_text, color), (panel.x + 16, panel.y + 20 + i * 28))
         
         # 조작법 안내 표시함
         controls = [
@@ -157,7 +168,7 @@ class Menu(State):
         
         control_y = panel.y + panel.height - 80
         for i, control in enumerate(controls):
-            control_text = self.font.render(control, True, (150, 150, 150))
+            control_text = render_text(self.font, control, (150, 150, 150))
             surface.blit(control_text, (panel.x + 16, control_y + i * 20))
 
 
@@ -1,52 +1,85 @@
+import random
+
 import pygame
 
+from core.scheduler import Scheduler
 from core.state import State
-from world.world import Camera, TileMap
-from ui.ui import THEME, draw_panel, get_font, draw_text_panel, blit_text
-from .character import Character
-from .quests import Quest
+from world.entities import EnemyRegistry
+from world.world import Camera, ChunkLayer, StreamingTileMap, TileMap
+from ui.ui import THEME, HUD_COLORS, draw_panel, get_font, draw_text_panel, blit_text, render_text
+from ui.widgets import Gauge, Label, ListView, Panel, Widget
 # Town 기능은 Overworld에 통합됨
-from .battle import Battle
-from .menu import Menu
-from world.world import generate_horizontal_world
+# 다른 씬은 game.push_scene으로 이름만 지정해 처음 쓸 때 불러옴
+from world.world import generate_horizontal_chunk
+
+
+# 적 타입 번호별 이름임(리젠 정보 표시용)
+ENEMY_TYPE_NAMES = ["Imp Lv.1", "Goblin Lv.2", "Wolf Lv.3", "Orc Lv.4", "Troll Lv.5", "Dark Knight Lv.6", "Dragon Lv.7", "Demon Lord Lv.8"]
+# 적 타입 번호별 오버월드 표시 색임
+ENEMY_TYPE_COLORS = [
+    (220, 90, 90),  # Imp Lv.1 - 빨간색
+    (90, 220, 90),  # Goblin Lv.2 - 초록색
+    (180, 180, 220),  # Wolf Lv.3 - 파란색
+    (220, 180, 90),  # Orc Lv.4 - 주황색
+    (150, 100, 50),  # Troll Lv.5 - 갈색
+    (100, 50, 150),  # Dark Knight Lv.6 - 보라색
+    (255, 100, 0),  # Dragon Lv.7 - 주황빨강
+    (150, 0, 0),  # Demon Lord Lv.8 - 진한 빨강
+]
 
 
 class Overworld(State):
     # 오버월드: 이동/마을/적 조우/퀘스트 요약 패널 관리함
     def __init__(self, game):
         super().__init__(game)
-        # world_seed가 있으면 재현 가능한 맵 생성함
-        seed = getattr(self.game, "world_seed", None)
-        tiles = generate_horizontal_world(chunks=6, width=20, height=10, seed=seed)
-        self.tilemap = TileMap(tiles, tile_size=32)
-        world_w = self.tilemap.cols * self.tilemap.tile_size
+        # world_seed가 있으면 재현 가능한 맵 생성함. 없으면 시드를 뽑아 game에 남겨서
+        # 씬을 다시 만들거나 저장/로드해도 같은 월드를 씀. 새로 뽑은 월드에는 이전 변경분이 맞지 않아 버림
+        world_seed = getattr(self.game, "world_seed", None)
+        if world_seed is None:
+            world_seed = self.game.world_seed = random.getrandbits(32)
+            self.game.world_deltas = {}
+        elif not hasattr(self.game, "world_deltas"):
+            self.game.world_deltas = {}
+        # 가로로 끝없는 월드임. 20열 청크를 (시드, 청크 번호)로 필요할 때 생성하고 멀어지면 버림
+        # 바꾼 타일은 game.world_deltas에 청크별로 남아 청크를 다시 만들거나 저장/로드해도 유지됨
+        self.tilemap = StreamingTileMap(
+            lambda index: generate_horizontal_chunk(index, width=20, height=10, seed=world_seed),
+            chunk_cols=20, rows=10, tile_size=32, deltas=self.game.world_deltas)
         world_h = self.tilemap.rows * self.tilemap.tile_size
-        self.camera = Camera((self.game.width, self.game.height), (world_w, world_h))
+        self.camera = Camera((self.game.width, self.game.height), (float("inf"), world_h))
+        # 길/벽/마을 오버레이는 월드마다 청크 단위로 한 번만 그려 두고 매 프레임 보이는 청크만 blit함
+        self.map_overlay = ChunkLayer(self.tilemap, self._draw_overlay_tile, alpha=True,
+                                      decorate=self._draw_world_border)
 
         self.player_speed = 120.0
         self.player_size = (16, 24)
         start_x = 2 * self.tilemap.tile_size
         start_y = 2 * self.tilemap.tile_size
         self.player_rect = pygame.Rect(start_x, start_y, *self.player_size)
+        # 보간 렌더링용 직전 업데이트 위치임
+        self.prev_player_pos = self.player_rect.topleft
 
-        self.enemies = []
-        self.enemy_dirs = []
         self.enemy_speed = 60.0
         
-        # 적 리젠 시스템 위한 변수임
-        self.defeated_enemies = []  # 패배한 적들의 정보 저장
+        # 적 리젠 예약표임. 저장/로드와 씬 재생성에도 남도록 game에 두고, 시계는 오버월드 업데이트 때만 흐름
+        if not hasattr(self.game, "respawns"):
+            self.game.respawns = Scheduler()
+        self.respawns = self.game.respawns
         self.respawn_timer = 60.0  # 리젠 시간(초)
         
-        # 초기 적 생성함(8가지 타입)
-        for i in range(8):
-            ex = start_x + 100 + i * 70
-            ey = start_y + 40 + (i % 2) * 60
-            self.enemies.append(pygame.Rect(ex, ey, 16, 16))
-            # world_seed가 있으면 좌우 방향도 고정함
-            if seed is not None:
-                self.enemy_dirs.append(pygame.Vector2(1 if (i % 2 == 0) else -1, 0))
-            else:
-                self.enemy_dirs.append(pygame.Vector2(1 if i % 2 == 0 else -1, 0))
+        # 적은 ID로 가리키는 레지스트리에 둠. 불러온 저장에 적이 있으면 이어서 씀(리젠 대기 중인 적이 중복해서 생기지 않게 함)
+        saved_enemies = getattr(self.game, "overworld_enemies", None)
+        if saved_enemies is not None and (len(saved_enemies) or len(self.respawns)):
+            self.enemies = saved_enemies
+        else:
+            self.enemies = EnemyRegistry()
+            # 초기 적 생성함(8가지 타입)
+            for i in range(8):
+                ex = start_x + 100 + i * 70
+                ey = start_y + 40 + (i % 2) * 60
+                self.enemies.add((ex, ey, 16, 16), (1 if i % 2 == 0 else -1, 0), i)
+        # 전투/저장에서 ID로 적을 찾도록 game과 같은 레지스트리를 씀
+        self.game.overworld_enemies = self.enemies
 
         self.town_value = 2
         self.font = get_font(14)
@@ -59,8 +92,10 @@ class Overworld(State):
         
         # 퀘스트 패널 상태(아코디언 형식)
         self.expanded_quests = set()
-        self.quest_click_areas = []
         self.quest_panel_collapsed = False
+        # HUD 위젯 트리임. 퀘스트 패널은 마을보다 먼저, 나머지는 맨 위에 그림
+        self.quest_hud = self._build_quest_hud()
+        self.hud = self._build_hud()
         
         # 마을 모드 관련 변수들임
         self.is_in_town = False
@@ -83,34 +118,33 @@ class Overworld(State):
         ]
         self.town_tilemap = TileMap(self.town_tiles, tile_size=32)
 
+        # 키 입력 액션 표임(Enter 키는 더 이상 마을 입장에 사용하지 않음)
+        self.actions = {
+            "cancel": self._quit,
+            "inventory": lambda: self.game.push_scene("character"),
+            "shop": lambda: self.game.push_scene("shop"),  # B키로 상점 열기
+            "talk": self._talk,
+            "leave_town": self._leave_town,
+        }
+
+    def _quit(self):
+        self.game.is_running = False
+
+    def _talk(self):
+        # E 키는 오버월드에서만 대화용으로 사용
+        if self.is_in_town:
+            return
+        nearest = self.enemies.nearest(self.player_rect.center, 48)
+        if nearest is not None:
+            self.dialog_lines = ["안녕, 여행자!", "이 길은 위험하니 조심해."]
+            self.dialog_timer = 3.0
+
+    def _leave_town(self):
+        if self.is_in_town:
+            self._exit_town()
+
     def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                self.game.is_running = False
-            elif event.key == pygame.K_i:
-                self.game.push_state(Character(self.game))
-            elif event.key == pygame.K_b:  # B키로 상점 열기
-                from .shop import Shop
-                self.game.push_state(Shop(self.game))
-            elif event.key == pygame.K_RETURN:
-                # Enter 키는 더 이상 마을 입장에 사용하지 않음
-                pass
-            elif event.key == pygame.K_e:
-                # E 키는 오버월드에서만 대화용으로 사용
-                if not self.is_in_town:
-                    nearest = None
-                    nearest_dist = 999999
-                    for er in self.enemies:
-                        d = (er.centerx - self.player_rect.centerx) ** 2 + (er.centery - self.player_rect.centery) ** 2
-                        if d < nearest_dist and d <= (48 * 48):
-                            nearest = er
-                            nearest_dist = d
-                    if nearest is not None:
-                        self.dialog_lines = ["안녕, 여행자!", "이 길은 위험하니 조심해."]
-                        self.dialog_timer = 3.0
-            elif event.key == pygame.K_g and self.is_in_town:
-                self._exit_town()
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # 마을에서 나가기 버튼 클릭
             if self.is_in_town:
                 exit_button_rect = pygame.Rect(self.game.width - 120, 10, 100, 30)
@@ -118,36 +152,9 @@ class Overworld(State):
                     self._exit_town()
                     return
             
-            # 메뉴 버튼 클릭 (오른쪽 상단)
-            btn_w, btn_h = self.menu_btn_size
-            rect = pygame.Rect(self.game.width - btn_w - self.menu_btn_margin, self.menu_btn_margin, btn_w, btn_h)
-            if rect.collidepoint(event.pos):
-                self.game.push_state(Menu(self.game))
-            
-            # 퀘스트창 접기/펼치기 버튼 
-            if self.quest_panel_collapsed:
-                panel_width = 120
-            else:
-                panel_width = 280
-            panel_x = self.game.width - panel_width - 10
-            panel_y = 10
-            quest_collapse_btn = pygame.Rect(panel_x + 10, panel_y + 8, 40, 20)
-            if quest_collapse_btn.collidepoint(event.pos):
-                self.quest_panel_collapsed = not self.quest_panel_collapsed
-                # 접히면 펼쳐진 항목 초기화
-                if self.quest_panel_collapsed:
-                    self.expanded_quests.clear()
-            
-            # 퀘스트 아코디언 클릭 (펼치기/접기)
-            if not self.quest_panel_collapsed:
-                for i, quest_rect in enumerate(self.quest_click_areas):
-                    if quest_rect.collidepoint(event.pos):
-                        quest_id = i
-                        if quest_id in self.expanded_quests:
-                            self.expanded_quests.remove(quest_id)
-                        else:
-                            self.expanded_quests.add(quest_id)
-                        break
+            # 메뉴 버튼, 퀘스트창 접기/펼치기, 퀘스트 아코디언 클릭은 위젯 트리에서 찾음
+            if not self.hud.click(event.pos):
+                self.quest_hud.click(event.pos)
 
     def update(self, delta_time):
         # 마을 모드일 땐 마을 업데이트만 수행
@@ -157,21 +164,18 @@ class Overworld(State):
                 self.dialog_timer = max(0.0, self.dialog_timer - delta_time)
             return
 
+        # 이번 업데이트 전 위치 기억함(렌더링 보간 기준)
+        self.prev_player_pos = self.player_rect.topleft
+        # 플레이어 화면 범위 근처 청크만 메모리에 남김
+        half_w = self.game.width // 2
+        self.tilemap.focus(self.player_rect.centerx - half_w, self.player_rect.centerx + half_w)
+
         if self.encounter_cooldown > 0.0:
             self.encounter_cooldown = max(0.0, self.encounter_cooldown - delta_time)
-        keys = pygame.key.get_pressed()
-        direction = pygame.Vector2(0, 0)
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            direction.x -= 1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            direction.x += 1
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            direction.y -= 1
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            direction.y += 1
-
-        if direction.length_squared() > 0:
-            direction = direction.normalize()
+        # 이동 방향은 입력 스냅샷이 프레임마다 한 번 계산해 둠(이미 정규화됨)
+        direction = self.game.input.direction
+
+        if direction.x or direction.y:
             move = direction * self.player_speed * delta_time
             new_rect = self.player_rect.move(int(move.x), 0)
             if not self.tilemap.rect_collides(new_rect):
@@ -180,78 +184,51 @@ class Overworld(State):
             if not self.tilemap.rect_collides(new_rect):
                 self.player_rect = new_rect
 
-        for idx, enemy_rect in enumerate(self.enemies):
-            dir_vec = self.enemy_dirs[idx]
-            enemy_move = dir_vec * self.enemy_speed * delta_time
-            new_enemy = enemy_rect.move(int(enemy_move.x), 0)
-            if self.tilemap.rect_collides(new_enemy):
-                dir_vec.x *= -1
-            else:
-                self.enemies[idx] = new_enemy
-            new_enemy = self.enemies[idx].move(0, int(enemy_move.y))
-            if self.tilemap.rect_collides(new_enemy):
-                dir_vec.y *= -1
-            else:
-                self.enemies[idx] = new_enemy
+        # 모든 적 이동과 벽 반사는 레지스트리가 배열 연산으로 한 번에 처리함(이동 전 위치도 보간용으로 남김)
+        self.enemies.step(delta_time, self.enemy_speed, self.tilemap)
 
         # 마을 접촉 감지 (마을에 있지 않을 때만)
         if not self.is_in_town and self.tilemap.rect_on_tile_value(self.player_rect, self.town_value):
             self._enter_town()
         
         if self.encounter_cooldown <= 0.0:
-            for idx, er in enumerate(self.enemies):
-                if self.player_rect.colliderect(er):
-                    self.enemies[idx].x += 32
-                    self.encounter_cooldown = 2.0
-                    # 오버월드 적 목록을 전투로 전달하기 위해 저장
-                    self.game.overworld_enemies = self.enemies
-                    # 전투로 진입하면서 인덱스 전달
-                    self.game.push_state(Battle(self.game, enemy_index=idx))
-                    break
+            # 플레이어와 겹친 적 중 ID가 가장 작은 적과 전투함
+            touching = self.enemies.query_rect(self.player_rect)
+            if touching:
+                enemy_id = min(touching)
+                self.enemies.shift(enemy_id, 32, 0)
+                self.encounter_cooldown = 2.0
+                # 전투로 진입하면서 적 ID 전달(전투는 game.overworld_enemies에서 타입을 찾음)
+                self.game.push_scene("battle", enemy_id=enemy_id)
 
         if self.dialog_timer > 0:
             self.dialog_timer = max(0.0, self.dialog_timer - delta_time)
         
         # 전투 승리 후: 해당 적 제거 및 리젠 큐에 등록
-        defeated_enemy_index = getattr(self.game, "defeated_enemy_index", None)
-        if defeated_enemy_index is not None and 0 <= defeated_enemy_index < len(self.enemies):
-            # 리젠에 필요한 정보 저장
-            defeated_enemy = {
-                'rect': self.enemies[defeated_enemy_index].copy(),
-                'dir': self.enemy_dirs[defeated_enemy_index].copy(),
-                'type': defeated_enemy_index % 8,  # 적 타입 저장 
-                'respawn_time': self.respawn_timer  # 리젠 
-            }
-            self.defeated_enemies.append(defeated_enemy)
-            
-            # 해당 적 제거 및 방향 목록도 정리
-            self.enemies.pop(defeated_enemy_index)
-            # 적의 방향도 함께 제거
-            if defeated_enemy_index < len(self.enemy_dirs):
-                self.enemy_dirs.pop(defeated_enemy_index)
+        defeated_enemy_id = getattr(self.game, "defeated_enemy_id", None)
+        if defeated_enemy_id is not None and defeated_enemy_id in self.enemies:
+            # 해당 적 제거(다른 적의 ID와 타입은 그대로임)
+            enemy_rect, enemy_dir, enemy_type = self.enemies.remove(defeated_enemy_id)
+            # 리젠에 필요한 정보를 저장 가능한 원시값으로 예약함. 리젠되면 같은 ID로 돌아옴
+            self.respawns.schedule(self.respawn_timer, {
+                'id': defeated_enemy_id,
+                'rect': tuple(enemy_rect),
+                'dir': (enemy_dir.x, enemy_dir.y),
+                'type': enemy_type,
+            })
             # 제거 정보 초기화
-            self.game.defeated_enemy_index = None
-        
-        # 적 리젠 타이머 갱신 및 스폰
-        defeated_enemies_to_remove = []
-        for defeated_enemy in self.defeated_enemies:
-            defeated_enemy['respawn_time'] -= delta_time
+            self.game.defeated_enemy_id = None
+        
+        # 적 리젠 시계 진행하고 리젠 시간이 된 적만 꺼내 재생성함
+        for defeated_enemy in self.respawns.advance(delta_time):
+            enemy_id = defeated_enemy.get('id')
+            if enemy_id in self.enemies:
+                enemy_id = None  # 예전 저장처럼 ID가 겹치면 새 ID를 받음
+            self.enemies.add(defeated_enemy['rect'], defeated_enemy['dir'], defeated_enemy['type'], enemy_id)
             
-            if defeated_enemy['respawn_time'] <= 0:
-                # 리젠 시간 도달: 적 재생성
-                self.enemies.append(defeated_enemy['rect'].copy())
-                self.enemy_dirs.append(defeated_enemy['dir'].copy())
-                
-                # 제거 대상 목록에 추가 (반복 중 제거 방지)
-                defeated_enemies_to_remove.append(defeated_enemy)
-                
-                # 알림 메시지 표시
-                self.dialog_lines = [f"새로운 적이 나타났다!"]
-                self.dialog_timer = 2.0
-        
-        # 리젠된 적들을 defeated_enemies에서 제거
-        for defeated_enemy in defeated_enemies_to_remove:
-            self.defeated_enemies.remove(defeated_enemy)
+            # 알림 메시지 표시
+            self.dialog_lines = [f"새로운 적이 나타났다!"]
+            self.dialog_timer = 2.0
     
     def _enter_town(self):
         # 마을 진입
@@ -265,19 +242,9 @@ class Overworld(State):
     
     def _update_town(self, delta_time):
         # 마을 모드 업데이트
-        keys = pygame.key.get_pressed()
-        direction = pygame.Vector2(0, 0)
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            direction.x -= 1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            direction.x += 1
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            direction.y -= 1
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            direction.y += 1
+        direction = self.game.input.direction
         
-        if direction.length_squared() > 0:
-            direction = direction.normalize()
+        if direction.x or direction.y:
             move = direction * self.town_player_speed * delta_time
             nr = self.town_player_rect.move(int(move.x), 0)
             if not self.town_tilemap.rect_collides(nr):
@@ -293,8 +260,7 @@ class Overworld(State):
         # 마을에서 접촉식 상호작용 감지
         # 상점 접촉 감지
         if self.town_player_rect.colliderect(self.town_shop_rect.inflate(10, 10)):
-            from .shop import Shop
-            self.game.push_state(Shop(self.game))
+            self.game.push_scene("shop")
             return
         
         # 퀘스트 접촉 감지
@@ -305,8 +271,7 @@ class Overworld(State):
     def _handle_town_interaction(self):
         # 마을 상호작용 처리
         if self.town_player_rect.colliderect(self.town_shop_rect.inflate(10, 10)):
-            from .shop import Shop
-            self.game.push_state(Shop(self.game))
+            self.game.push_scene("shop")
         elif self.town_player_rect.colliderect(self.town_quest_rect.inflate(10, 10)):
             self._handle_quest_interaction()
     
@@ -364,9 +329,6 @@ class Overworld(State):
             else:
                 self.dialog_lines = ["수락한 퀘스트가 없어요.", "NPC에게 퀘스트를 받아보세요!"]
                 self.dialog_timer = 3.0
-        
-        # 퀘스트 클릭 영역 초기화
-        self.quest_click_areas.clear()
     
     def _render_town(self, surface):
         # 마을 렌더링
@@ -382,8 +344,8 @@ class Overworld(State):
         pygame.draw.circle(surface, (100, 255, 100), quest_center, quest_radius)  # 퀘스트 (초록색)
         
         # 상점과 퀘스트 라벨
-        shop_label = self.font.render("상점", True, (255, 255, 255))
-        quest_label = self.font.render("퀘스트", True, (255, 255, 255))
+        shop_label = render_text(self.font, "상점", (255, 255, 255))
+        quest_label = render_text(self.font, "퀘스트", (255, 255, 255))
         
         surface.blit(shop_label, (self.town_shop_rect.x + 2, self.town_shop_rect.y + 8))
         surface.blit(quest_label, (self.town_quest_rect.x + 2, self.town_quest_rect.y + 8))
@@ -393,17 +355,15 @@ class Overworld(State):
         
         # 마을 모드 안내 텍스트
         hint_text = "접촉시 자동 상호작용"
-        hint_surface = self.font.render(hint_text, True, (230, 230, 230))
+        hint_surface = render_text(self.font, hint_text, (230, 230, 230))
         hint_rect = pygame.Rect(10, 10, 300, 30)
-        pygame.draw.rect(surface, (32, 32, 48), hint_rect, border_radius=4)
-        pygame.draw.rect(surface, (200, 200, 200), hint_rect, 1, border_radius=4)
+        draw_panel(surface, hint_rect, (32, 32, 48), (200, 200, 200), 1, shadow=False, radius=4)
         surface.blit(hint_surface, (hint_rect.x + 10, hint_rect.y + 8))
         
         # 나가기 버튼
         exit_button_rect = pygame.Rect(self.game.width - 120, 10, 100, 30)
-        pygame.draw.rect(surface, (150, 50, 50), exit_button_rect, border_radius=4)
-        pygame.draw.rect(surface, (200, 200, 200), exit_button_rect, 1, border_radius=4)
-        exit_text = self.font.render("나가기", True, (255, 255, 255))
+        draw_panel(surface, exit_button_rect, (150, 50, 50), (200, 200, 200), 1, shadow=False, radius=4)
+        exit_text = render_text(self.font, "나가기", (255, 255, 255))
         exit_text_rect = exit_text.get_rect(center=exit_button_rect.center)
         surface.blit(exit_text, exit_text_rect)
         
@@ -472,185 +432,215 @@ class Overworld(State):
             all_dead = all(not member.is_alive() for member in party)
             if all_dead:
                 # 게임오버 상태로 전환
-                from .title import TitleScreen
-                title_screen = TitleScreen(self.game)
+                title_screen = self.game.create_scene("title")
                 title_screen.set_game_over_mode()
                 self.game.push_state(title_screen)
      
-    def _render_quest_panel(self, surface):
-        # 우측 퀘스트 패널(아코디언)
-        # 퀘스트는 시작 시 비어 있을 수 있음
+    def _active_quests(self):
+        # 활성 퀘스트만 필터링 (수락되었지만 완료되지 않은 퀘스트). 시작 시 비어 있을 수 있음
         quests = getattr(self.game, "quests", []) or []
-        
-        # 활성 퀘스트만 필터링 (수락되었지만 완료되지 않은 퀘스트)
-        active_quests = [q for q in quests if hasattr(q, 'accepted') and q.accepted and not q.completed]
-        
-        # 활성 퀘스트가 없으면 패널은 빈 상태로 안내만 표시
-        
-        # 접힌 상태일 때는 작은 패널만 표시
+        return [q for q in quests if hasattr(q, 'accepted') and q.accepted and not q.completed]
+
+    def _toggle_quest_panel(self):
+        self.quest_panel_collapsed = not self.quest_panel_collapsed
+        # 접히면 펼쳐진 항목 초기화
         if self.quest_panel_collapsed:
-            panel_width = 120
-            panel_height = 35
-            panel_x = self.game.width - panel_width - 10
-            panel_y = 10
-            
-            # 접힌 퀘스트 패널 그리기
-            quest_panel = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-            draw_panel(surface, quest_panel, shadow=False)
-            
-            # 제목(버튼과 겹치지 않게 오른쪽으로)
-            title_text = "퀘스트"
-            title_surface = self.font.render(title_text, True, (255, 255, 100))
-            surface.blit(title_surface, (panel_x + 60, panel_y + 10))
-            
-            # 펼치기 버튼(좌측)
-            expand_btn = pygame.Rect(panel_x + 10, panel_y + 8, 40, 20)
-            pygame.draw.rect(surface, (100, 150, 255), expand_btn, border_radius=3)
-            pygame.draw.rect(surface, (200, 200, 200), expand_btn, 1, border_radius=3)
-            expand_text = "▼"
-            expand_surface = self.font.render(expand_text, True, (255, 255, 255))
-            surface.blit(expand_surface, (panel_x + 22, panel_y + 8))
-            
-            return
-        
+            self.expanded_quests.clear()
+
+    def _toggle_quest(self, quest_id):
+        if quest_id in self.expanded_quests:
+            self.expanded_quests.remove(quest_id)
+        else:
+            self.expanded_quests.add(quest_id)
+
+    def _quest_rows(self):
+        # 퀘스트 목록 위젯 바인딩 값임. 이 값이 바뀔 때만 행을 다시 만듦
+        rows = []
+        for i, quest in enumerate(self._active_quests()[:3]):
+            reward_text = "보상: "
+            if getattr(quest, 'reward_exp', 0) > 0:
+                reward_text += f"EXP {quest.reward_exp} "
+            if getattr(quest, 'reward_gold', 0) > 0:
+                reward_text += f"골드 {quest.reward_gold}"
+            rows.append((
+                getattr(quest, 'title', '알 수 없는 퀘스트'),
+                getattr(quest, 'progress', 0),
+                getattr(quest, 'target_count', 1),
+                i in self.expanded_quests,
+                getattr(quest, 'description', '설명 없음'),
+                reward_text,
+            ))
+        return rows
+
+    def _quest_panel_height(self):
         # 패널 크기 계산 (내용 기반)
-        panel_width = 280
-        base_height = 35
-        row_collapsed = 30
         line_h = self.font.get_height()
+        rows = self._quest_rows()
+        if not rows:
+            # 안내 문구 높이(두 줄 가정)
+            return 35 + line_h * 2 + 10
         expanded_extra = line_h + 4 + line_h  # 설명 1줄 + 보상 1줄 가정
+        return 35 + sum(30 + (expanded_extra if row[3] else 0) for row in rows)
 
-        total_height = base_height
-        if active_quests:
-            for i, quest in enumerate(active_quests[:3]):
-                total_height += row_collapsed
-                if i in self.expanded_quests:
-                    total_height += expanded_extra
-        else:
-            # 안내 문구 높이(두 줄 가정)
-            total_height += line_h * 2 + 10
-        
-        panel_x = self.game.width - panel_width - 10
-        panel_y = 10
-        
-        # 퀘스트 패널 그리기
-        quest_panel = pygame.Rect(panel_x, panel_y, panel_width, total_height)
-        draw_panel(surface, quest_panel, shadow=False)
-        
-        # 제목과 접기 버튼(좌측)
-        title_text = "퀘스트"
-        title_surface = self.font.render(title_text, True, (255, 255, 100))
-        surface.blit(title_surface, (panel_x + 60, panel_y + 10))
-        
+    def _build_quest_row(self, index, row):
+        # 퀘스트 한 줄(제목과 진행도)과 펼쳤을 때 상세 정보임. 접힌 행 높이만 클릭 영역임
+        title, progress, target_count, expanded, description, reward_text = row
+        line_h = self.font.get_height()
+        height = 30 + (line_h + 4 + line_h if expanded else 0)
+        widget = Widget((0, 0, 260, height))
+        widget.add(Widget((0, 0, 260, 30), on_click=lambda: self._toggle_quest(index)))
+        quest_color = (100, 255, 100) if progress >= target_count else (255, 255, 255)
+        widget.add(Label((5, 3), self.font, f"{title} ({progress}/{target_count})", quest_color))
+        if expanded:
+            widget.add(Label((10, 33), self.font, description, (200, 200, 200)))
+            widget.add(Label((10, 37 + line_h), self.font, reward_text, (255, 215, 0)))
+        return widget
+
+    def _build_quest_hud(self):
+        # 우측 퀘스트 패널(아코디언)
+        root = Widget()
+        line_h = self.font.get_height()
+
+        # 접힌 상태일 때는 작은 패널만 표시
+        collapsed = root.add(Panel((self.game.width - 130, 10, 120, 35),
+                                   show=lambda: self.quest_panel_collapsed))
+        # 제목(버튼과 겹치지 않게 오른쪽으로)
+        collapsed.add(Label((60, 10), self.font, "퀘스트", (255, 255, 100)))
+        # 펼치기 버튼(좌측)
+        expand_btn = collapsed.add(Panel((10, 8, 40, 20), (100, 150, 255), (200, 200, 200), 1, radius=3,
+                                         on_click=self._toggle_quest_panel))
+        expand_btn.add(Label((12, 0), self.font, "▼", (255, 255, 255)))
+
+        expanded = root.add(Panel((self.game.width - 290, 10, 280, 35),
+                                  bind=lambda: (280, self._quest_panel_height()),
+                                  show=lambda: not self.quest_panel_collapsed))
+        expanded.add(Label((60, 10), self.font, "퀘스트", (255, 255, 100)))
         # 접기 버튼(좌측)
-        collapse_btn = pygame.Rect(panel_x + 10, panel_y + 8, 40, 20)
-        pygame.draw.rect(surface, (255, 150, 100), collapse_btn, border_radius=3)
-        pygame.draw.rect(surface, (200, 200, 200), collapse_btn, 1, border_radius=3)
-        collapse_text = "▲"
-        collapse_surface = self.font.render(collapse_text, True, (255, 255, 255))
-        surface.blit(collapse_surface, (panel_x + 22, panel_y + 8))
-        
+        collapse_btn = expanded.add(Panel((10, 8, 40, 20), (255, 150, 100), (200, 200, 200), 1, radius=3,
+                                          on_click=self._toggle_quest_panel))
+        collapse_btn.add(Label((12, 0), self.font, "▲", (255, 255, 255)))
+        # 활성 퀘스트가 없으면 안내만 표시
+        empty = expanded.add(Widget((15, 35, 0, 0), show=lambda: not self._active_quests()))
+        empty.add(Label((0, 0), self.font, "수락한 퀘스트 없음", (200, 200, 200)))
+        empty.add(Label((0, line_h + 2), self.font, "마을 NPC에게서 퀘스트 받기", (200, 200, 200)))
         # 퀘스트 목록 (아코디언 형식)
-        y_offset = base_height
-        self.quest_click_areas.clear()
-
-        if not active_quests:
-            empty_lines = ["수락한 퀘스트 없음", "마을 NPC에게서 퀘스트 받기"]
-            for idx, line in enumerate(empty_lines):
-                surf = self.font.render(line, True, (200, 200, 200))
-                surface.blit(surf, (panel_x + 15, panel_y + y_offset + idx * (line_h + 2)))
-        else:
-            for i, quest in enumerate(active_quests[:3]):
-                # 퀘스트 제목과 진행도
-                title_text = getattr(quest, 'title', '알 수 없는 퀘스트')
-                progress = getattr(quest, 'progress', 0)
-                target_count = getattr(quest, 'target_count', 1)
-
-                quest_text = f"{title_text} ({progress}/{target_count})"
-                quest_color = (100, 255, 100) if progress >= target_count else (255, 255, 255)
-                quest_surface = self.font.render(quest_text, True, quest_color)
-                surface.blit(quest_surface, (panel_x + 15, panel_y + y_offset))
-
-                # 클릭 영역 저장(접힌 행 높이)
-                quest_rect = pygame.Rect(panel_x + 10, panel_y + y_offset - 3, panel_width - 20, row_collapsed)
-                self.quest_click_areas.append(quest_rect)
-
-                # 펼쳐진 상태면 상세 정보
-                if i in self.expanded_quests:
-                    y_offset += row_collapsed
-                    description = getattr(quest, 'description', '설명 없음')
-                    desc_surface = self.font.render(description, True, (200, 200, 200))
-                    surface.blit(desc_surface, (panel_x + 20, panel_y + y_offset))
-                    y_offset += line_h + 4
-
-                    reward_text = "보상: "
-                    if getattr(quest, 'reward_exp', 0) > 0:
-                        reward_text += f"EXP {quest.reward_exp} "
-                    if getattr(quest, 'reward_gold', 0) > 0:
-                        reward_text += f"골드 {quest.reward_gold}"
-                    reward_surface = self.font.render(reward_text, True, (255, 215, 0))
-                    surface.blit(reward_surface, (panel_x + 20, panel_y + y_offset))
-                    y_offset += line_h
-                else:
-                    y_offset += row_collapsed
+        expanded.add(ListView((10, 32, 260, 0), self._quest_rows, self._build_quest_row))
+        return root
+
+    def _party_leader(self):
+        party = getattr(self.game, "party", [])
+        return party[0] if party else None
+
+    def _respawn_rows(self):
+        # 곧 리젠될 순서로 최대 3개까지만 표시. 남은 초가 바뀔 때만 행을 다시 만듦
+        return [(defeated_enemy['type'], max(0, int(remaining)))
+                for remaining, defeated_enemy in self.respawns.upcoming(3)]
+
+    def _build_respawn_row(self, index, row):
+        enemy_type, remaining_time = row
+        timer_color = HUD_COLORS["timer_soon"] if remaining_time <= 10 else HUD_COLORS["timer"]
+        widget = Widget((0, 0, 160, 20))
+        widget.add(Label((0, 0), self.font, f"{ENEMY_TYPE_NAMES[enemy_type]}: {remaining_time}초", timer_color,
+                         glyphs=True))
+        return widget
+
+    def _build_hud(self):
+        # 메뉴 버튼, 플레이어 정보, 리젠 정보 패널임. 바인딩한 값이 바뀐 위젯만 다시 그림
+        root = Widget()
+        leader = self._party_leader
+
+        # 플레이어 정보 패널 (좌측 하단)
+        info = root.add(Panel((12, self.game.height - 180, 320, 160)))
+        info.add(Label((10, 8), self.font, "플레이어 정보", (255, 255, 255)))
+        # 첫 번째 파티원 정보 표시. 수치 줄은 글리프 아틀라스로 조립함
+        stats = info.add(Widget(show=lambda: leader() is not None))
+        stats.add(Label((10, 28), self.font, color=HUD_COLORS["name"], glyphs=True,
+                        bind=lambda: f"{leader().name} Lv.{getattr(leader(), 'level', 1)}"))
+        stats.add(Label((10, 48), self.font, color=HUD_COLORS["hp"], glyphs=True,
+                        bind=lambda: f"HP: {leader().hp}/{leader().max_hp}"))
+        stats.add(Gauge((10, 68, 280, 8), lambda: leader().hp / max(1, leader().max_hp),
+                        fill_color=HUD_COLORS["hp"], border_color=(200, 200, 200), radius=4))
+        stats.add(Label((10, 82), self.font, color=HUD_COLORS["exp"], glyphs=True,
+                        bind=lambda: f"EXP: {getattr(leader(), 'exp', 0)}/{getattr(leader(), 'max_exp', 100)}"))
+        stats.add(Gauge((10, 102, 280, 6),
+                        lambda: getattr(leader(), 'exp', 0) / max(1, getattr(leader(), 'max_exp', 100)),
+                        fill_color=HUD_COLORS["exp"], border_color=(200, 200, 200)))
+        stats.add(Label((10, 114), self.font, color=HUD_COLORS["gold"], glyphs=True,
+                        bind=lambda: f"골드: {getattr(self.game, 'gold', 0)}"))
+        stats.add(Label((10, 130), self.font, color=HUD_COLORS["gems"], glyphs=True,
+                        bind=lambda: f"보석: {getattr(self.game, 'gems', 0)}"))
+        # 파티가 없을 때
+        info.add(Label((10, 45), self.font, "파티 없음", (200, 200, 200), show=lambda: leader() is None))
+
+        # 리젠 정보 표시 (우측 하단)
+        respawn = root.add(Panel((self.game.width - 200, self.game.height - 140, 180, 120),
+                                 show=lambda: bool(self.respawns)))
+        respawn.add(Label((10, 8), self.font, "적 리젠 정보", (255, 255, 255)))
+        respawn.add(ListView((10, 28, 160, 0), self._respawn_rows, self._build_respawn_row))
+
+        # 메뉴 버튼(햄버거) - 화면 오른쪽 상단, 세 줄 라인
+        btn_w, btn_h = self.menu_btn_size
+        menu_btn = root.add(Panel((self.game.width - btn_w - self.menu_btn_margin, self.menu_btn_margin, btn_w, btn_h),
+                                  (32, 32, 48), (200, 200, 200), 1, radius=4,
+                                  on_click=lambda: self.game.push_scene("menu")))
+        line_color = (230, 230, 230)
+        pad = 5
+        for line_y in (pad, btn_h // 2 - 1, btn_h - pad - 2):
+            menu_btn.add(Panel((pad, line_y, btn_w - pad * 2, 2), line_color, line_color, 0, radius=0))
+        return root
+
+    def _lerp_rect(self, prev_pos, rect):
+        # 직전 업데이트 위치와 현재 위치 사이를 보간한 사각형 반환함
+        dx = rect.x - prev_pos[0]
+        dy = rect.y - prev_pos[1]
+        # 순간 이동(조우 후 밀려남 등)은 보간하지 않음
+        if abs(dx) > self.tilemap.tile_size or abs(dy) > self.tilemap.tile_size:
+            return rect
+        alpha = self.game.interpolation
+        return pygame.Rect(round(prev_pos[0] + dx * alpha), round(prev_pos[1] + dy * alpha), rect.width, rect.height)
+
+    def _draw_overlay_tile(self, chunk, tile_value, tile_rect):
+        # 오버레이 청크에 타일 하나 그림. 마을은 불투명 원, 길/벽은 희미한 선/사각형임
+        ts = self.tilemap.tile_size
+        cx = tile_rect.x + ts // 2
+        cy = tile_rect.y + ts // 2
+        if tile_value == self.town_value:
+            pygame.draw.circle(chunk, (200, 180, 100), (cx, cy), max(3, ts // 3))
+        elif tile_value == 3:
+            # 길(3): 희미한 선
+            line_w = max(1, ts // 8)
+            pygame.draw.line(chunk, (200, 200, 200, 60), (cx - ts // 2, cy), (cx + ts // 2, cy), line_w)
+        elif tile_value == 1:
+            # 벽(1): 희미한 사각형
+            r = max(3, ts // 3)
+            wall_rect = pygame.Rect(cx - r, cy - r, r * 2, r * 2)
+            pygame.draw.rect(chunk, (180, 180, 180, 50), wall_rect, 1)
+
+    def _draw_world_border(self, chunk, chunk_rect):
+        # 월드 경계(희미한 사각 프레임) 중 이 청크에 걸친 변만 그림. 가로로 끝없어 오른쪽 변은 없음
+        world_h = self.tilemap.rows * self.tilemap.tile_size
+        color = (220, 220, 220, 40)
+        for edge in ((0, 0, chunk_rect.right, 1), (0, world_h - 1, chunk_rect.right, 1), (0, 0, 1, world_h)):
+            chunk.fill(color, pygame.Rect(edge).move(-chunk_rect.x, -chunk_rect.y))
 
     def render(self, surface):
-        self.camera.follow(self.player_rect)
+        player_draw_rect = self._lerp_rect(self.prev_player_pos, self.player_rect)
+        self.camera.follow(player_draw_rect)
         surface.fill(THEME["bg"])
         # 오버월드에서는 바닥 타일을 그리지 않음 (미니멀 연출)
-        # 대신 길/벽은 희미한 오버레이로 표시하여 맵 윤곽을 제공함
-        ts = self.tilemap.tile_size
-        offset = self.camera.offset
-        start_col = max(0, int(offset.x // ts))
-        end_col = min(self.tilemap.cols, int((offset.x + surface.get_width()) // ts) + 1)
-        start_row = max(0, int(offset.y // ts))
-        end_row = min(self.tilemap.rows, int((offset.y + surface.get_height()) // ts) + 1)
-        # 반투명 오버레이 레이어
-        map_overlay = pygame.Surface((self.game.width, self.game.height), pygame.SRCALPHA)
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                tile_value = self.tilemap.tiles[row][col]
-                cx = col * ts - int(offset.x) + ts // 2
-                cy = row * ts - int(offset.y) + ts // 2
-                if tile_value == self.town_value:
-                    pygame.draw.circle(surface, (200, 180, 100), (cx, cy), max(3, ts // 3))
-                elif tile_value == 3:
-                    # 길(3): 희미한 선
-                    line_w = max(1, ts // 8)
-                    pygame.draw.line(map_overlay, (200, 200, 200, 60), (cx - ts // 2, cy), (cx + ts // 2, cy), line_w)
-                elif tile_value == 1:
-                    # 벽(1): 희미한 사각형
-                    r = max(3, ts // 3)
-                    wall_rect = pygame.Rect(cx - r, cy - r, r * 2, r * 2)
-                    pygame.draw.rect(map_overlay, (180, 180, 180, 50), wall_rect, 1)
-        # 월드 경계(희미한 사각 프레임)
-        world_w = self.tilemap.cols * ts
-        world_h = self.tilemap.rows * ts
-        border_rect = pygame.Rect(-int(offset.x), -int(offset.y), world_w, world_h)
-        pygame.draw.rect(map_overlay, (220, 220, 220, 40), border_rect, 1)
-        surface.blit(map_overlay, (0, 0))
-        pr = self.player_rect.move(-int(self.camera.offset.x), -int(self.camera.offset.y))
+        # 대신 길/벽은 미리 그려 둔 희미한 오버레이 청크로 표시하여 맵 윤곽을 제공함
+        self.map_overlay.draw(surface, self.camera.offset)
+        pr = player_draw_rect.move(-int(self.camera.offset.x), -int(self.camera.offset.y))
         pygame.draw.rect(surface, (240, 224, 96), pr)
-        for er in self.enemies:
+        # 화면(보간 이동 여유 한 타일 포함) 안 적만 Rect로 만들어 ID 순서대로 그림
+        ts = self.tilemap.tile_size
+        view = pygame.Rect(int(self.camera.offset.x), int(self.camera.offset.y), surface.get_width(), surface.get_height())
+        for enemy_id, er, prev_pos, enemy_type in self.enemies.visible(view.inflate(2 * ts, 2 * ts)):
+            # 새로 나타난 적은 이동 전 위치가 현재 위치라 보간 없이 그려짐
+            er = self._lerp_rect(prev_pos, er)
             er_screen = er.move(-int(self.camera.offset.x), -int(self.camera.offset.y))
-            # 적의 인덱스에 따라 다른 색깔 사용 (8가지 타입)
-            enemy_index = self.enemies.index(er)
-            if enemy_index % 8 == 0:
-                color = (220, 90, 90)  # Imp Lv.1 - 빨간색
-            elif enemy_index % 8 == 1:
-                color = (90, 220, 90)  # Goblin Lv.2 - 초록색
-            elif enemy_index % 8 == 2:
-                color = (180, 180, 220)  # Wolf Lv.3 - 파란색
-            elif enemy_index % 8 == 3:
-                color = (220, 180, 90)  # Orc Lv.4 - 주황색
-            elif enemy_index % 8 == 4:
-                color = (150, 100, 50)  # Troll Lv.5 - 갈색
-            elif enemy_index % 8 == 5:
-                color = (100, 50, 150)  # Dark Knight Lv.6 - 보라색
-            elif enemy_index % 8 == 6:
-                color = (255, 100, 0)  # Dragon Lv.7 - 주황빨강
-            else:
-                color = (150, 0, 0)  # Demon Lord Lv.8 - 진한 빨강
+            # 적 타입에 따라 다른 색깔 사용 (8가지 타입)
+            color = ENEMY_TYPE_COLORS[enemy_type]
             # 적을 동그라미로 표시 (전투 화면과 동일한 모양)
             center_x = er_screen.x + er_screen.width // 2
             center_y = er_screen.y + er_screen.height // 2
@@ -663,7 +653,7 @@ class Overworld(State):
         blit_text(surface, hint_text, (hint_rect.x + 10, hint_rect.y + 10), self.font, (230, 230, 230))
         
         # 퀘스트 정보 패널 (화면 오른쪽)
-        self._render_quest_panel(surface)
+        self.quest_hud.draw(surface)
         
         # 마을 모드 렌더링(그리기만 담당)
         if self.is_in_town:
@@ -676,15 +666,14 @@ class Overworld(State):
             quest_radius = min(self.town_quest_rect.width, self.town_quest_rect.height) // 2
             pygame.draw.circle(surface, (255, 100, 100), shop_center, shop_radius)
             pygame.draw.circle(surface, (100, 255, 100), quest_center, quest_radius)
-            shop_label = self.font.render("상점", True, (255, 255, 255))
-            quest_label = self.font.render("퀘스트", True, (255, 255, 255))
+            shop_label = render_text(self.font, "상점", (255, 255, 255))
+            quest_label = render_text(self.font, "퀘스트", (255, 255, 255))
             surface.blit(shop_label, (self.town_shop_rect.x + 2, self.town_shop_rect.y + 8))
             surface.blit(quest_label, (self.town_quest_rect.x + 2, self.town_quest_rect.y + 8))
             pygame.draw.rect(surface, (100, 100, 255), self.town_player_rect)
             hint_text = "접촉시 자동 상호작용\nG: 마을 나가기"
             hint_rect = pygame.Rect(10, 10, 300, 48)
-            pygame.draw.rect(surface, (32, 32, 48), hint_rect, border_radius=4)
-            pygame.draw.rect(surface, (200, 200, 200), hint_rect, 1, border_radius=4)
+            draw_panel(surface, hint_rect, (32, 32, 48), (200, 200, 200), 1, shadow=False, radius=4)
             blit_text(surface, hint_text, (hint_rect.x + 10, hint_rect.y + 10), self.font, (230, 230, 230))
 
         if self.dialog_timer > 0 and self.dialog_lines:
@@ -693,109 +682,8 @@ class Overworld(State):
             dialog_y = 80
             draw_text_panel(surface, self.dialog_lines, (dialog_x, dialog_y), self.font)
 
-        # 메뉴 버튼(햄버거) 그리기 - 화면 오른쪽 상단
-        btn_w, btn_h = self.menu_btn_size
-        x = self.game.width - btn_w - self.menu_btn_margin
-        y = self.menu_btn_margin
-        btn_rect = pygame.Rect(x, y, btn_w, btn_h)
-        pygame.draw.rect(surface, (32, 32, 48), btn_rect, border_radius=4)
-        pygame.draw.rect(surface, (200, 200, 200), btn_rect, 1, border_radius=4)
-        # 세 줄 라인
-        line_color = (230, 230, 230)
-        pad = 5
-        l1 = (x + pad, y + pad, btn_w - pad * 2, 2)
-        l2 = (x + pad, y + btn_h // 2 - 1, btn_w - pad * 2, 2)
-        l3 = (x + pad, y + btn_h - pad - 2, btn_w - pad * 2, 2)
-        pygame.draw.rect(surface, line_color, pygame.Rect(*l1))
-        pygame.draw.rect(surface, line_color, pygame.Rect(*l2))
-        pygame.draw.rect(surface, line_color, pygame.Rect(*l3))
+        # 메뉴 버튼, 플레이어 정보, 리젠 정보 패널
+        self.hud.draw(surface)
 
-        # 플레이어 정보 패널 (좌측 하단)
-        player_info_rect = pygame.Rect(12, self.game.height - 180, 320, 160)
-        draw_panel(surface, player_info_rect, shadow=False)
-        
-        # 패널 제목
-        title_text = "플레이어 정보"
-        title_surface = self.font.render(title_text, True, (255, 255, 255))
-        surface.blit(title_surface, (player_info_rect.x + 10, player_info_rect.y + 8))
-        
-        # 파티 정보 표시
-        party = getattr(self.game, "party", [])
-        if party:
-            # 첫 번째 파티원 정보 표시
-            player = party[0]
-            # 이름과 레벨
-            name_level_text = f"{player.name} Lv.{getattr(player, 'level', 1)}"
-            name_surface = self.font.render(name_level_text, True, (255, 255, 100))
-            surface.blit(name_surface, (player_info_rect.x + 10, player_info_rect.y + 28))
-            
-            # HP 표시
-            hp_text = f"HP: {player.hp}/{player.max_hp}"
-            hp_surface = self.font.render(hp_text, True, (255, 100, 100))
-            surface.blit(hp_surface, (player_info_rect.x + 10, player_info_rect.y + 48))
-            
-            # HP 게이지
-            hp_ratio = player.hp / max(1, player.max_hp)
-            hp_gauge_rect = pygame.Rect(player_info_rect.x + 10, player_info_rect.y + 68, 280, 8)
-            pygame.draw.rect(surface, (60, 60, 60), hp_gauge_rect, border_radius=4)
-            hp_fill_width = int(280 * hp_ratio)
-            if hp_fill_width > 0:
-                hp_fill_rect = pygame.Rect(player_info_rect.x + 10, player_info_rect.y + 68, hp_fill_width, 8)
-                pygame.draw.rect(surface, (255, 100, 100), hp_fill_rect, border_radius=4)
-            pygame.draw.rect(surface, (200, 200, 200), hp_gauge_rect, 1, border_radius=4)
-            
-            # 경험치 표시
-            exp = getattr(player, 'exp', 0)
-            max_exp = getattr(player, 'max_exp', 100)
-            exp_text = f"EXP: {exp}/{max_exp}"
-            exp_surface = self.font.render(exp_text, True, (100, 255, 100))
-            surface.blit(exp_surface, (player_info_rect.x + 10, player_info_rect.y + 82))
-            
-            # 경험치 게이지
-            exp_ratio = exp / max(1, max_exp)
-            exp_gauge_rect = pygame.Rect(player_info_rect.x + 10, player_info_rect.y + 102, 280, 6)
-            pygame.draw.rect(surface, (60, 60, 60), exp_gauge_rect, border_radius=3)
-            exp_fill_width = int(280 * exp_ratio)
-            if exp_fill_width > 0:
-                exp_fill_rect = pygame.Rect(player_info_rect.x + 10, player_info_rect.y + 102, exp_fill_width, 6)
-                pygame.draw.rect(surface, (100, 255, 100), exp_fill_rect, border_radius=3)
-            pygame.draw.rect(surface, (200, 200, 200), exp_gauge_rect, 1, border_radius=3)
-            
-            # 골드 표시 (노란색)
-            current_gold = getattr(self.game, "gold", 0)
-            gold_text = f"골드: {current_gold}"
-            gold_surface = self.font.render(gold_text, True, (255, 215, 0))  # 노란색
-            surface.blit(gold_surface, (player_info_rect.x + 10, player_info_rect.y + 114))
-            
-            # 보석 표시 (파란색)
-            current_gems = getattr(self.game, "gems", 0)
-            gems_text = f"보석: {current_gems}"
-            gems_surface = self.font.render(gems_text, True, (100, 200, 255))  # 파란색
-            surface.blit(gems_surface, (player_info_rect.x + 10, player_info_rect.y + 130))
-        else:
-            # 파티가 없을 때
-            no_party_text = self.font.render("파티 없음", True, (200, 200, 200))
-            surface.blit(no_party_text, (player_info_rect.x + 10, player_info_rect.y + 45))
-        
-        # 리젠 정보 표시 (우측 하단)
-        if self.defeated_enemies:
-            respawn_info_rect = pygame.Rect(self.game.width - 200, self.game.height - 140, 180, 120)
-            draw_panel(surface, respawn_info_rect, shadow=False)
-            
-            # 제목
-            respawn_title = "적 리젠 정보"
-            respawn_title_surface = self.font.render(respawn_title, True, (255, 255, 255))
-            surface.blit(respawn_title_surface, (respawn_info_rect.x + 10, respawn_info_rect.y + 8))
-            
-            # 각 패배한 적의 리젠 타이머 표시
-            for i, defeated_enemy in enumerate(self.defeated_enemies[:3]):  # 최대 3개까지만 표시
-                remaining_time = max(0, int(defeated_enemy['respawn_time']))
-                enemy_type_names = ["Imp Lv.1", "Goblin Lv.2", "Wolf Lv.3", "Orc Lv.4", "Troll Lv.5", "Dark Knight Lv.6", "Dragon Lv.7", "Demon Lord Lv.8"]
-                enemy_name = enemy_type_names[defeated_enemy['type']]
-                
-                timer_text = f"{enemy_name}: {remaining_time}초"
-                timer_color = (255, 200, 100) if remaining_time <= 10 else (200, 200, 200)
-                timer_surface = self.font.render(timer_text, True, timer_color)
-                surface.blit(timer_surface, (respawn_info_rect.x + 10, respawn_info_rect.y + 28 + i * 20))
     
     
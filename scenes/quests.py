@@ -3,7 +3,7 @@ import os
 import pygame
 
 from core.state import State
-from ui.ui import get_font, THEME, draw_panel
+from ui.ui import get_font, THEME, draw_panel, render_text
 
 
 class Quest:
@@ -33,26 +33,33 @@ class Quest:
 
 class QuestLog(State):
     # 퀘스트 목록과 상세 정보를 표시합니다.
+
+    # 입력이 있을 때만 다시 그립니다.
+    redraw_every_frame = False
     
     def __init__(self, game):
         super().__init__(game)
         self.font = get_font(16)
         self.selected_index = 0
+        self.actions = {
+            "up": lambda: self._move_selection(-1),
+            "down": lambda: self._move_selection(1),
+            "confirm": self._accept_quest,
+            "cancel": self.game.pop_state,
+        }
+
+    def handle_action(self, action, event):
+        self.mark_dirty()
+        super().handle_action(action, event)
+
+    def _move_selection(self, step):
+        quests = getattr(self.game, "quests", [])
+        if quests:
+            self.selected_index = (self.selected_index + step) % len(quests)
 
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_UP, pygame.K_w):
-                quests = getattr(self.game, "quests", [])
-                if quests:
-                    self.selected_index = (self.selected_index - 1) % len(quests)
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
-                quests = getattr(self.game, "quests", [])
-                if quests:
-                    self.selected_index = (self.selected_index + 1) % len(quests)
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                self._accept_quest()
-            elif event.key in (pygame.K_ESCAPE,):
-                self.game.pop_state()
+    def is_idle(self):
+        # 입력을 기다리는 동안에는 할 일이 없습니다.
+        return True
 
     def _accept_quest(self):
         # 선택된 퀘스트를 수락합니다.
@@ -67,12 +74,12 @@ class QuestLog(State):
         panel = pygame.Rect(40, 40, self.game.width - 80, self.game.height - 80)
         draw_panel(surface, panel)
         
-        title = self.font.render("퀘스트 로그", True, THEME["text"])
+        title = render_text(self.font, "퀘스트 로그", THEME["text"])
         surface.blit(title, (panel.x + 16, panel.y + 12))
         
         quests = getattr(self.game, "quests", [])
         if not quests:
-            no_quests = self.font.render("퀘스트가 없습니다.", True, THEME["text_dim"])
+            no_quests = render_text(self.font, "퀘스트가 없습니다.", THEME["text_dim"])
             surface.blit(no_quests, (panel.x + 16, panel.y + 40))
             return
         
@@ -93,24 +100,27 @@ class QuestLog(State):
                 color = (200, 200, 200)
             
             quest_text = f"{quest.title}{status} ({quest.progress}/{quest.target_count})"
-            surface.blit(self.font.render(quest_text, True, color), (panel.x + 16, y_pos))
+            surface.blit(render_text(self.font, quest_text, color), (panel.x + 16, y_pos))
             
             # 선택된 퀘스트의 상세 정보 표시
             if i == self.selected_index:
                 detail_y = y_pos + 20
                 detail_text = f"설명: {quest.description}"
-                surface.blit(self.font.render(detail_text, True, (150, 150, 150)), (panel.x + 32, detail_y))
+                surface.blit(render_text(self.font, detail_text, (150, 150, 150)), (panel.x + 32, detail_y))
                 
                 reward_text = f"보상: EXP {quest.reward_exp}, 골드 {quest.reward_gold}"
-                surface.blit(self.font.render(reward_text, True, (255, 215, 0)), (panel.x + 32, detail_y + 20))
+                surface.blit(render_text(self.font, reward_text, (255, 215, 0)), (panel.x + 32, detail_y + 20))
                 
                 if not quest.accepted and not quest.completed:
                     accept_text = "Enter: 퀘스트 수락"
-                    surface.blit(self.font.render(accept_text, True, (100, 255, 100)), (panel.x + 32, detail_y + 40))
+                    surface.blit(render_text(self.font, accept_text, (100, 255, 100)), (panel.x + 32, detail_y + 40))
 
 
 class SaveLoad(State):
     # 저장/불러오기 화면
+
+    # 입력이 있을 때만 다시 그립니다.
+    redraw_every_frame = False
     
     def __init__(self, game, mode="save"):
         super().__init__(game)
@@ -124,50 +134,76 @@ class SaveLoad(State):
         if not os.path.exists(self.save_dir):
             os.makedirs(self.save_dir)
 
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_UP, pygame.K_w):
-                self.selected_slot = (self.selected_slot - 1) % len(self.slots)
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
-                self.selected_slot = (self.selected_slot + 1) % len(self.slots)
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                if self.mode == "save":
-                    self._save_game()
-                else:
-                    self._load_game()
-            elif event.key in (pygame.K_ESCAPE,):
-                self.game.pop_state()
+        # 슬롯별 요약 문구입니다. 파일은 화면을 열 때와 저장이 끝났을 때만 다시 읽습니다.
+        self.slot_summaries = self._read_slot_summaries()
+
+        # 진행 중인 저장 작업과 화면에 표시할 결과 메시지입니다.
+        self.save_job = None
+        self.save_slot = 0
+        self.status_message = ""
+        self.status_color = THEME["text"]
+
+        self.actions = {
+            "up": lambda: self._move_slot(-1),
+            "down": lambda: self._move_slot(1),
+            "confirm": self._save_game if self.mode == "save" else self._load_game,
+            "cancel": self.game.pop_state,
+        }
+
+    def handle_action(self, action, event):
+        self.mark_dirty()
+        super().handle_action(action, event)
+
+    def _move_slot(self, step):
+        self.selected_slot = (self.selected_slot + step) % len(self.slots)
 
     def _save_game(self):
-        # 게임 상태를 JSON으로 저장합니다.
+        # 게임 상태 스냅샷을 만들어 백그라운드 저장 스레드에 넘깁니다.
+        if self.save_job is not None:
+            return  # 이전 저장이 끝날 때까지 기다립니다.
         slot_name = f"slot{self.selected_slot + 1}.json"
         file_path = os.path.join(self.save_dir, slot_name)
         
         try:
-            # 게임 상태 데이터를 수집합니다.
-            save_data = {
-                "party": self._serialize_party(),
-                "gold": getattr(self.game, "gold", 0),
-                "gems": getattr(self.game, "gems", 0),
-                "inventory": self._serialize_inventory(),
-                "quests": self._serialize_quests(),
-                "overworld_enemies": self._serialize_overworld_enemies(),
-                "defeated_enemy_index": None,
-                "world_seed": getattr(self.game, "world_seed", None),
-                "schema_version": getattr(self.game, "schema_version", 1),
-                "saved_at": __import__("time").strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # JSON 파일로 저장합니다.
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
-            
-            # 저장 성공 메시지를 표시합니다.
-            self._show_message(f"슬롯 {self.selected_slot + 1}에 저장되었습니다!")
-            
+            save_data = self._snapshot_game()
         except Exception as e:
             # 저장 실패 메시지를 표시합니다.
-            self._show_message(f"저장 실패: {str(e)}")
+            self._show_message(f"저장 실패: {str(e)}", error=True)
+            return
+        
+        # JSON 직렬화와 파일 쓰기는 스레드에서 하고 화면은 계속 그립니다.
+        self.save_job = self.game.save_writer.submit(file_path, save_data, self._on_save_done)
+        self.save_slot = self.selected_slot
+        self.status_message = ""
+
+    def _snapshot_game(self):
+        # 게임 상태를 원시값으로 복사합니다. 넘긴 뒤 게임이 바뀌어도 저장 내용은 그대로입니다.
+        return {
+            "party": tuple(self._serialize_party()),
+            "gold": getattr(self.game, "gold", 0),
+            "gems": getattr(self.game, "gems", 0),
+            "inventory": tuple(self._serialize_inventory()),
+            "quests": tuple(self._serialize_quests()),
+            "overworld_enemies": self._serialize_overworld_enemies(),
+            "defeated_enemy_id": None,
+            "world_seed": getattr(self.game, "world_seed", None),
+            "world_deltas": self._serialize_world_deltas(),
+            "respawns": self._serialize_respawns(),
+            "schema_version": getattr(self.game, "schema_version", 1),
+            "saved_at": __import__("time").strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+    def _on_save_done(self, job):
+        # 쓰기가 끝나면 메인 스레드에서 호출됩니다.
+        self.save_job = None
+        self.slot_summaries = self._read_slot_summaries()
+        self.mark_dirty()
+        if job.error is not None:
+            # 저장 실패 메시지를 표시합니다.
+            self._show_message(f"저장 실패: {str(job.error)}", error=True)
+        else:
+            # 저장 성공 메시지를 표시합니다.
+            self._show_message(f"슬롯 {self.save_slot + 1}에 저장되었습니다!")
 
     def _load_game(self):
         # 게임 상태를 JSON에서 불러옵니다.
@@ -175,7 +211,7 @@ class SaveLoad(State):
         file_path = os.path.join(self.save_dir, slot_name)
         
         if not os.path.exists(file_path):
-            self._show_message("저장된 파일이 없습니다!")
+            self._show_message("저장된 파일이 없습니다!", error=True)
             return
         
         try:
@@ -190,20 +226,21 @@ class SaveLoad(State):
             self.game.inventory = self._deserialize_inventory(save_data.get("inventory", []))
             self._deserialize_quests(save_data.get("quests", []))
             self.game.overworld_enemies = self._deserialize_overworld_enemies(save_data.get("overworld_enemies", []))
-            self.game.defeated_enemy_index = None
+            self.game.defeated_enemy_id = None
             self.game.world_seed = save_data.get("world_seed", None)
+            self.game.world_deltas = self._deserialize_world_deltas(save_data.get("world_deltas"))
+            self.game.respawns = self._deserialize_respawns(save_data.get("respawns"))
             
             # 로드 성공 메시지를 표시합니다.
             self._show_message(f"슬롯 {self.selected_slot + 1}에서 불러왔습니다!")
             
             # 오버월드로 이동합니다.
-            from .overworld import Overworld
             self.game.pop_state()  # 현재 상태 제거
-            self.game.push_state(Overworld(self.game))
+            self.game.push_scene("overworld")
             
         except Exception as e:
             # 로드 실패 메시지를 표시합니다.
-            self._show_message(f"불러오기 실패: {str(e)}")
+            self._show_message(f"불러오기 실패: {str(e)}", error=True)
 
     def _serialize_party(self):
         # 파티 정보를 JSON 직렬화 형태로 변환합니다.
@@ -318,22 +355,29 @@ class SaveLoad(State):
         return serialized
 
     def _serialize_overworld_enemies(self):
-        # 오버월드 적(Rect)을 저장 가능한 형태로 변환합니다.
-        enemies = getattr(self.game, "overworld_enemies", [])
-        serialized = []
-        
-        for enemy in enemies:
-            if hasattr(enemy, 'x') and hasattr(enemy, 'y') and hasattr(enemy, 'width') and hasattr(enemy, 'height'):
-                # pygame.Rect 객체를 딕셔너리로 변환
-                enemy_data = {
-                    "x": enemy.x,
-                    "y": enemy.y,
-                    "width": enemy.width,
-                    "height": enemy.height
-                }
-                serialized.append(enemy_data)
-        
-        return serialized
+        # 오버월드 적(ID, 위치, 방향, 타입)을 저장 가능한 형태로 변환합니다.
+        enemies = getattr(self.game, "overworld_enemies", None)
+        return enemies.to_data() if enemies is not None else ()
+
+    def _serialize_world_deltas(self):
+        # 월드 타일 변경분을 청크별 목록으로 변환합니다.
+        from world.world import StreamingTileMap
+        return StreamingTileMap.export_deltas(getattr(self.game, "world_deltas", {}))
+
+    def _deserialize_world_deltas(self, deltas_data):
+        # 월드 타일 변경분을 청크 번호별 사전으로 복원합니다.
+        from world.world import StreamingTileMap
+        return StreamingTileMap.import_deltas(deltas_data)
+
+    def _serialize_respawns(self):
+        # 대기 중인 적 리젠을 남은 시간 목록으로 변환합니다.
+        respawns = getattr(self.game, "respawns", None)
+        return respawns.to_data() if respawns is not None else ()
+
+    def _deserialize_respawns(self, respawns_data):
+        # 적 리젠 예약표를 복원합니다.
+        from core.scheduler import Scheduler
+        return Scheduler.from_data(respawns_data)
 
     def _deserialize_inventory(self, inventory_data):
         # 인벤토리를 Item 리스트로 복원합니다.
@@ -356,21 +400,9 @@ class SaveLoad(State):
         return inventory
 
     def _deserialize_overworld_enemies(self, enemies_data):
-        # 적 Rect 리스트를 복원합니다.
-        import pygame
-        
-        enemies = []
-        for enemy_data in enemies_data:
-            if isinstance(enemy_data, dict) and 'x' in enemy_data:
-                enemy = pygame.Rect(
-                    enemy_data["x"],
-                    enemy_data["y"],
-                    enemy_data["width"],
-                    enemy_data["height"]
-                )
-                enemies.append(enemy)
-        
-        return enemies
+        # 적 레지스트리를 복원합니다(예전 저장의 Rect 목록도 읽습니다).
+        from world.entities import EnemyRegistry
+        return EnemyRegistry.from_data(enemies_data)
 
     def _deserialize_quests(self, quests_data):
         # 퀘스트 리스트를 복원합니다.
@@ -393,13 +425,50 @@ class SaveLoad(State):
         
         self.game.quests = quests
 
-    def _show_message(self, message):
-        # 간단한 메시지를 출력합니다.
+    def _read_slot_summaries(self):
+        # 슬롯 파일마다 목록에 표시할 요약 문구를 만듭니다.
+        summaries = []
+        for i in range(len(self.slots)):
+            slot_path = os.path.join(self.save_dir, f"slot{i + 1}.json")
+            if not os.path.exists(slot_path):
+                summaries.append(" - 빈 슬롯")
+                continue
+            # 저장된 파일이 있으면 정보 표시
+            try:
+                with open(slot_path, 'r', encoding='utf-8') as f:
+                    save_data = json.load(f)
+
+                # 저장 시간이나 파티 정보 표시
+                party = save_data.get("party", [])
+                if party:
+                    summaries.append(f" - {party[0]['name']} Lv.{party[0].get('level', 1)}")
+                else:
+                    summaries.append(" - 빈 슬롯")
+
+            except:
+                summaries.append(" - 손상된 파일")
+        return summaries
+
+    def _show_message(self, message, error=False):
+        # 간단한 메시지를 출력하고 패널에도 표시합니다.
         print(f"저장/로드: {message}")
+        self.status_message = message
+        self.status_color = (255, 120, 120) if error else (100, 255, 100)
+        self.mark_dirty()
+
+    def is_idle(self):
+        # 저장 중에는 진행 표시를 갱신해야 하므로 잠들지 않습니다.
+        return self.save_job is None
 
     def update(self, delta_time):
-        # 별도의 업데이트는 없습니다.
-        pass
+        # 저장 중이면 진행 표시 영역만 다시 그립니다.
+        if self.save_job is not None:
+            self.mark_dirty(self._status_rect())
+
+    def _status_rect(self):
+        # 진행 표시와 결과 메시지가 그려지는 영역입니다.
+        panel = pygame.Rect(40, 40, self.game.width - 80, self.game.height - 80)
+        return pygame.Rect(panel.x + 16, panel.y + 50 + len(self.slots) * 30, panel.width - 32, 24)
 
     def render(self, surface):
         surface.fill(THEME["bg"])
@@ -408,7 +477,7 @@ class SaveLoad(State):
         
         # 제목을 표시합니다.
         title_text = "저장" if self.mode == "save" else "불러오기"
-        title = self.font.render(title_text, True, THEME["text"])
+        title = render_text(self.font, title_text, THEME["text"])
         surface.blit(title, (panel.x + 16, panel.y + 12))
         
         # 슬롯 목록을 표시합니다.
@@ -416,30 +485,21 @@ class SaveLoad(State):
             y_pos = panel.y + 40 + i * 30
             color = (255, 255, 0) if i == self.selected_slot else THEME["text"]
             
-            # 슬롯 정보 표시
-            slot_text = slot
-            slot_file = f"slot{i + 1}.json"
-            slot_path = os.path.join(self.save_dir, slot_file)
-            
-            if os.path.exists(slot_path):
-                # 저장된 파일이 있으면 정보 표시
-                try:
-                    with open(slot_path, 'r', encoding='utf-8') as f:
-                        save_data = json.load(f)
-                    
-                    # 저장 시간이나 파티 정보 표시
-                    party = save_data.get("party", [])
-                    if party:
-                        slot_text += f" - {party[0]['name']} Lv.{party[0].get('level', 1)}"
-                    else:
-                        slot_text += " - 빈 슬롯"
-                        
-                except:
-                    slot_text += " - 손상된 파일"
-            else:
-                slot_text += " - 빈 슬롯"
-            
-            surface.blit(self.font.render(slot_text, True, color), (panel.x + 16, y_pos))
+            # 슬롯 정보 표시(저장 중 매 프레임 다시 그려도 파일은 읽지 않습니다)
+            slot_text = slot + self.slot_summaries[i]
+            surface.blit(render_text(self.font, slot_text, color), (panel.x + 16, y_pos))
+        
+        # 저장 진행 표시나 마지막 결과 메시지를 표시합니다.
+        status_rect = self._status_rect()
+        job = self.save_job
+        if job is not None:
+            label = render_text(self.font, f"저장 중... {int(job.progress * 100)}%", THEME["text"])
+            surface.blit(label, status_rect.topleft)
+            bar = pygame.Rect(status_rect.x + label.get_width() + 12, status_rect.y + 6, 160, 10)
+            pygame.draw.rect(surface, THEME["text_dim"], bar, 1)
+            pygame.draw.rect(surface, (100, 255, 100), (bar.x + 1, bar.y + 1, int((bar.width - 2) * job.progress), bar.height - 2))
+        elif self.status_message:
+            surface.blit(render_text(self.font, self.status_message, self.status_color), status_rect.topleft)
         
         # 조작법 안내
         controls = [
@@ -450,7 +510,7 @@ class SaveLoad(State):
         
         control_y = panel.y + panel.height - 60
         for i, control in enumerate(controls):
-            control_text = self.font.render(control, True, (150, 150, 150))
+            control_text = render_text(self.font, control, (150, 150, 150))
             surface.blit(control_text, (panel.x + 16, control_y + i * 20))
 
 
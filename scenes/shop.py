@@ -1,12 +1,16 @@
 import pygame
 
 from core.state import State
-from ui.ui import get_font, THEME, draw_panel, draw_text_panel
-from .battle import Item
+from ui.ui import get_font, THEME, draw_panel, draw_text_panel, render_text
 
 
 class Shop(State):
     # 상점 및 인벤토리 관리 화면입니다.
+
+    # 입력이 있을 때 패널 영역만 다시 그립니다.
+    redraw_every_frame = False
+    # 아래 화면 위에 겹쳐 그립니다.
+    is_overlay = True
     
     def __init__(self, game):
         super().__init__(game)
@@ -29,9 +33,26 @@ class Shop(State):
         # UI 설정입니다.
         self.panel_width = 400
         self.panel_height = 300
+
+        # 공통 액션 표입니다. B로 나가고 Tab으로 상점/인벤토리를 전환합니다.
+        common = {"shop": self.game.pop_state, "switch": self._toggle_mode}
+        self.shop_actions = dict(common, **{
+            "left": lambda: self._change_page(-1),
+            "right": lambda: self._change_page(1),
+            "up": lambda: self._move_shop_item(-1),
+            "down": lambda: self._move_shop_item(1),
+            "confirm": self._purchase_item,
+        })
+        self.inventory_actions = dict(common, **{
+            "left": lambda: self._change_tab(-1),
+            "right": lambda: self._change_tab(1),
+            "up": lambda: self._move_inventory_item(-1),
+            "down": lambda: self._move_inventory_item(1),
+        })
         
     def _create_shop_items(self):
         # 상점 아이템 초기 목록을 생성합니다.
+        from .battle import Item
         consumables = [
             Item("포션", "consumable", 50, "HP 30 회복", hp_bonus=30),
             Item("에너지 포션", "consumable", 40, "에너지 20 회복", energy_bonus=20),
@@ -51,56 +72,41 @@ class Shop(State):
             "weapons": weapons
         }
     
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            # ESC 키 제거 - B 키로 나가기
-            if event.key == pygame.K_b:
-                self.game.pop_state()
-            elif event.key == pygame.K_TAB:
-                # 상점과 인벤토리 모드를 전환합니다.
-                if hasattr(self, 'is_inventory_mode'):
-                    self.is_inventory_mode = not self.is_inventory_mode
-                else:
-                    self.is_inventory_mode = False
-            elif self._is_shop_mode():
-                self._handle_shop_events(event)
-            else:
-                self._handle_inventory_events(event)
+    def current_actions(self):
+        return self.shop_actions if self._is_shop_mode() else self.inventory_actions
+
+    def handle_action(self, action, event):
+        self.mark_dirty(self._panel_rect())
+        super().handle_action(action, event)
+
+    def _toggle_mode(self):
+        # 상점과 인벤토리 모드를 전환합니다.
+        if hasattr(self, 'is_inventory_mode'):
+            self.is_inventory_mode = not self.is_inventory_mode
+        else:
+            self.is_inventory_mode = False
     
     def _is_shop_mode(self):
         # 현재 화면이 상점인지 여부를 반환합니다.
         return not getattr(self, 'is_inventory_mode', False)
     
-    def _handle_shop_events(self, event):
-        # 상점 모드에서 입력을 처리합니다.
-        if event.key == pygame.K_LEFT:
-            self.current_page = (self.current_page - 1) % len(self.pages)
-            self.selected_item = 0
-        elif event.key == pygame.K_RIGHT:
-            self.current_page = (self.current_page + 1) % len(self.pages)
-            self.selected_item = 0
-        elif event.key == pygame.K_UP:
-            current_items = self._get_current_shop_items()
-            self.selected_item = max(0, self.selected_item - 1)
-        elif event.key == pygame.K_DOWN:
-            current_items = self._get_current_shop_items()
-            self.selected_item = min(len(current_items) - 1, self.selected_item + 1)
-        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-            self._purchase_item()
-    
-    def _handle_inventory_events(self, event):
-        # 인벤토리 모드에서 입력을 처리합니다.
-        if event.key == pygame.K_LEFT:
-            self.tab_index = (self.tab_index - 1) % len(self.tabs)
-            self.item_index = 0
-        elif event.key == pygame.K_RIGHT:
-            self.tab_index = (self.tab_index + 1) % len(self.tabs)
-            self.item_index = 0
-        elif event.key == pygame.K_UP:
-            self.item_index = max(0, self.item_index - 1)
-        elif event.key == pygame.K_DOWN:
-            items = self._get_current_inventory_items()
-            self.item_index = min(len(items) - 1, self.item_index + 1)
+    def _change_page(self, step):
+        # 상점 페이지를 넘깁니다.
+        self.current_page = (self.current_page + step) % len(self.pages)
+        self.selected_item = 0
+
+    def _move_shop_item(self, step):
+        current_items = self._get_current_shop_items()
+        self.selected_item = max(0, min(len(current_items) - 1, self.selected_item + step))
+
+    def _change_tab(self, step):
+        # 인벤토리 탭을 바꿉니다.
+        self.tab_index = (self.tab_index + step) % len(self.tabs)
+        self.item_index = 0
+
+    def _move_inventory_item(self, step):
+        items = self._get_current_inventory_items()
+        self.item_index = max(0, min(len(items) - 1, self.item_index + step))
     
     def _get_current_shop_items(self):
         # 현재 페이지의 상점 아이템 목록을 반환합니다.
@@ -151,6 +157,7 @@ class Shop(State):
                 self.game.inventory.append(item)
             else:
                 # 기존 딕셔너리 형태를 리스트로 승격합니다.
+                from .battle import Item
                 upgraded = []
                 for name in self.game.inventory.get("equipment", []):
                     upgraded.append(Item(name, "weapon", 0, ""))
@@ -161,6 +168,9 @@ class Shop(State):
                 self.game.inventory = upgraded
                 self.game.inventory.append(item)
             
+            # 아래 화면의 골드 표시가 바뀌었으므로 스냅샷을 다시 만듭니다.
+            self.game.invalidate_underlay()
+            
             # 구매 성공 메시지를 출력합니다.
             self._show_message(f"{item.name} 구매 완료!")
         else:
@@ -171,10 +181,23 @@ class Shop(State):
         # 간단한 메시지를 콘솔에 출력합니다.
         print(f"상점: {message}")
     
+    def is_idle(self):
+        # 입력을 기다리는 동안에는 할 일이 없습니다.
+        return True
+
     def update(self, delta_time):
         # 상점에서는 별도의 업데이트가 필요하지 않습니다.
         pass
     
+    def _panel_rect(self):
+        # 상점/인벤토리 공용 메인 패널 영역입니다.
+        return pygame.Rect(
+            (self.game.width - self.panel_width) // 2,
+            (self.game.height - self.panel_height) // 2,
+            self.panel_width,
+            self.panel_height
+        )
+
     def render(self, surface):
         if self._is_shop_mode():
             self._render_shop(surface)
@@ -183,26 +206,22 @@ class Shop(State):
     
     def _render_shop(self, surface):
         # 상점 화면을 렌더링합니다.
-        surface.fill(THEME["bg"])
+        if not self.game.draw_underlay(self, surface):
+            surface.fill(THEME["bg"])
         
         # 메인 패널을 표시합니다.
-        panel = pygame.Rect(
-            (self.game.width - self.panel_width) // 2,
-            (self.game.height - self.panel_height) // 2,
-            self.panel_width,
-            self.panel_height
-        )
+        panel = self._panel_rect()
         draw_panel(surface, panel)
         
         # 제목을 표시합니다.
-        title = self.font.render("상점", True, (255, 255, 100))
+        title = render_text(self.font, "상점", (255, 255, 100))
         surface.blit(title, (panel.x + 20, panel.y + 20))
         
         # 페이지 탭을 표시합니다.
         tab_y = panel.y + 50
         for i, page in enumerate(self.pages):
             color = (255, 255, 0) if i == self.current_page else THEME["text"]
-            tab_text = self.font.render(f"[{page}]", True, color)
+            tab_text = render_text(self.font, f"[{page}]", color)
             tab_x = panel.x + 20 + i * 120
             surface.blit(tab_text, (tab_x, tab_y))
         
@@ -211,7 +230,7 @@ class Shop(State):
         item_y = tab_y + 40
         
         if not items:
-            no_items = self.font.render("아이템이 없습니다.", True, THEME["text"])
+            no_items = render_text(self.font, "아이템이 없습니다.", THEME["text"])
             surface.blit(no_items, (panel.x + 20, item_y))
             return
         
@@ -224,7 +243,7 @@ class Shop(State):
             if item.effect:
                 item_text += f" ({item.effect})"
             
-            text_surface = self.font.render(item_text, True, color)
+            text_surface = render_text(self.font, item_text, color)
             surface.blit(text_surface, (panel.x + 20, item_y + i * 25))
         
         # 조작법 안내를 표시합니다.
@@ -238,31 +257,27 @@ class Shop(State):
         
         control_y = panel.y + panel.height - 80
         for i, control in enumerate(controls):
-            control_text = self.small_font.render(control, True, (150, 150, 150))
+            control_text = render_text(self.small_font, control, (150, 150, 150))
             surface.blit(control_text, (panel.x + 20, control_y + i * 18))
     
     def _render_inventory(self, surface):
         # 인벤토리 화면을 렌더링합니다.
-        surface.fill(THEME["bg"])
+        if not self.game.draw_underlay(self, surface):
+            surface.fill(THEME["bg"])
         
         # 메인 패널을 표시합니다.
-        panel = pygame.Rect(
-            (self.game.width - self.panel_width) // 2,
-            (self.game.height - self.panel_height) // 2,
-            self.panel_width,
-            self.panel_height
-        )
+        panel = self._panel_rect()
         draw_panel(surface, panel)
         
         # 제목을 표시합니다.
-        title = self.font.render("인벤토리", True, (255, 255, 100))
+        title = render_text(self.font, "인벤토리", (255, 255, 100))
         surface.blit(title, (panel.x + 20, panel.y + 20))
         
         # 탭을 표시합니다.
         tab_y = panel.y + 50
         for i, tab in enumerate(self.tabs):
             color = (255, 255, 0) if i == self.tab_index else THEME["text"]
-            tab_text = self.font.render(f"[{tab}]", True, color)
+            tab_text = render_text(self.font, f"[{tab}]", color)
             tab_x = panel.x + 20 + i * 80
             surface.blit(tab_text, (tab_x, tab_y))
         
@@ -271,12 +286,12 @@ class Shop(State):
         item_y = tab_y + 40
         
         if not items:
-            no_items = self.font.render("아이템이 없습니다.", True, THEME["text"])
+            no_items = render_text(self.font, "아이템이 없습니다.", THEME["text"])
             surface.blit(no_items, (panel.x + 20, item_y))
         else:
             for i, item_name in enumerate(items):
                 color = (255, 255, 0) if i == self.item_index else THEME["text"]
-                item_text = self.font.render(item_name, True, color)
+                item_text = render_text(self.font, item_name, color)
                 surface.blit(item_text, (panel.x + 20, item_y + i * 22))
         
         # 조작법 안내를 표시합니다.
@@ -289,5 +304,5 @@ class Shop(State):
         
         control_y = panel.y + panel.height - 80
         for i, control in enumerate(controls):
-            control_text = self.small_font.render(control, True, (150, 150, 150))
+            control_text = render_text(self.small_font, control, (150, 150, 150))
             surface.blit(control_text, (panel.x + 20, control_y + i * 18))
@@ -1,12 +1,14 @@
 import pygame
 
 from core.state import State
-from ui.ui import get_font, THEME, draw_panel, draw_text_panel
-from .battle import Combatant
+from ui.ui import get_font, THEME, draw_panel, draw_text_panel, render_text
 
 
 class TitleScreen(State):
     # 타이틀 화면: 시작, 불러오기, 종료와 게임오버를 함께 관리합니다.
+
+    # 입력이 있을 때만 다시 그립니다.
+    redraw_every_frame = False
     
     def __init__(self, game):
         super().__init__(game)
@@ -33,37 +35,44 @@ class TitleScreen(State):
             "다시 도전하시겠습니까?"
         ]
 
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if self.mode == 0:  # 메인 타이틀
-                self._handle_title_events(event)
-            else:  # 게임오버
-                self._handle_game_over_events(event)
+        # 모드별 액션 표입니다.
+        self.title_actions = {
+            "up": lambda: self._move_title(-1),
+            "down": lambda: self._move_title(1),
+            "confirm": self._activate_title,
+            "cancel": self._quit,
+        }
+        self.game_over_actions = {
+            "left": lambda: self._move_game_over(-1),
+            "right": lambda: self._move_game_over(1),
+            "confirm": self._activate_game_over,
+            "cancel": self._quit,
+        }
 
-    def _handle_title_events(self, event):
-        # 메인 타이틀 입력을 처리합니다.
-        if event.key in (pygame.K_UP, pygame.K_w):
-            self.selected_index = (self.selected_index - 1) % len(self.title_items)
-        elif event.key in (pygame.K_DOWN, pygame.K_s):
-            self.selected_index = (self.selected_index + 1) % len(self.title_items)
-        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-            self._activate_title()
-        elif event.key == pygame.K_ESCAPE:
-            self.game.is_running = False
+    def current_actions(self):
+        return self.title_actions if self.mode == 0 else self.game_over_actions
 
-    def _handle_game_over_events(self, event):
-        # 게임오버 화면 입력을 처리합니다.
-        if event.key in (pygame.K_LEFT, pygame.K_a):
-            self.game_over_selected_index = (self.game_over_selected_index - 1) % len(self.game_over_items)
-        elif event.key in (pygame.K_RIGHT, pygame.K_d):
-            self.game_over_selected_index = (self.game_over_selected_index + 1) % len(self.game_over_items)
-        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-            self._activate_game_over()
-        elif event.key == pygame.K_ESCAPE:
-            self.game.is_running = False
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+    def handle_action(self, action, event):
+        self.mark_dirty()
+        super().handle_action(action, event)
+
+    def handle_event(self, event):
+        # 게임오버 화면의 버튼은 마우스로도 누를 수 있습니다.
+        if self.mode == 1 and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.mark_dirty()
             self._handle_game_over_mouse_click(event.pos)
 
+    def _move_title(self, step):
+        # 메인 타이틀 선택을 옮깁니다.
+        self.selected_index = (self.selected_index + step) % len(self.title_items)
+
+    def _move_game_over(self, step):
+        # 게임오버 버튼 선택을 옮깁니다.
+        self.game_over_selected_index = (self.game_over_selected_index + step) % len(self.game_over_items)
+
+    def _quit(self):
+        self.game.is_running = False
+
     def _handle_game_over_mouse_click(self, pos):
         # 게임오버 화면의 마우스 클릭을 처리합니다.
         # 버튼 영역 계산
@@ -120,8 +129,7 @@ class TitleScreen(State):
         # 새 게임을 시작합니다.
         self._reset_game_state()
         # 새로 시작하기에서는 오프닝부터 시작
-        from .intro import Intro
-        self.game.push_state(Intro(self.game))
+        self.game.push_scene("intro")
 
     def _restart_game(self):
         # 게임을 처음부터 다시 시작합니다.
@@ -131,8 +139,7 @@ class TitleScreen(State):
     def _load_game(self):
         # 저장된 게임을 불러옵니다.
         try:
-            from .quests import SaveLoad
-            self.game.push_state(SaveLoad(self.game))
+            self.game.push_scene("save_load")
         except ImportError:
             # 저장/로드 시스템이 없는 경우 기본 재시작합니다.
             self._restart_game()
@@ -144,7 +151,8 @@ class TitleScreen(State):
         self.game.gems = 0
         self.game.inventory = []
         
-        # 파티를 초기화합니다.
+        # 파티를 초기화합니다(전투 모듈은 새 게임 시작할 때 처음 불러옵니다).
+        from .battle import Combatant
         default_party = [
             Combatant("겨울이", max_hp=60, atk=10, speed=140, is_enemy=False, gold=0, level=1),
             Combatant("가을이", max_hp=40, atk=7, speed=120, is_enemy=False, gold=0, level=1),
@@ -158,19 +166,30 @@ class TitleScreen(State):
         # 오버월드 적 정보를 초기화합니다.
         if hasattr(self.game, "overworld_enemies"):
             delattr(self.game, "overworld_enemies")
-        if hasattr(self.game, "defeated_enemy_index"):
-            delattr(self.game, "defeated_enemy_index")
+        if hasattr(self.game, "defeated_enemy_id"):
+            delattr(self.game, "defeated_enemy_id")
+        if hasattr(self.game, "respawns"):
+            delattr(self.game, "respawns")
+        # 월드 시드와 타일 변경분도 초기화합니다. 새 게임은 새 월드에서 시작합니다.
+        if hasattr(self.game, "world_seed"):
+            delattr(self.game, "world_seed")
+        if hasattr(self.game, "world_deltas"):
+            delattr(self.game, "world_deltas")
 
     def _go_to_overworld(self):
         # 오버월드로 이동합니다.
-        from .overworld import Overworld
         self.game.state_stack.clear()  # 모든 상태 제거
-        self.game.push_state(Overworld(self.game))
+        self.game.push_scene("overworld")
 
     def set_game_over_mode(self):
         # 게임오버 모드로 전환합니다.
         self.mode = 1
         self.game_over_selected_index = 0
+        self.mark_dirty()
+
+    def is_idle(self):
+        # 입력을 기다리는 동안에는 할 일이 없습니다.
+        return True
 
     def update(self, delta_time):
         # 별도의 업데이트는 필요하지 않습니다.
@@ -188,14 +207,14 @@ class TitleScreen(State):
         
         # 게임 제목을 표시합니다.
         title_text = "네모의 꿈"
-        title_surface = self.font.render(title_text, True, (255, 255, 100))
+        title_surface = render_text(self.font, title_text, (255, 255, 100))
         title_rect = title_surface.get_rect(center=(self.game.width // 2, self.game.height // 3))
         surface.blit(title_surface, title_rect)
         
         # 메뉴 항목을 표시합니다.
         for i, item in enumerate(self.title_items):
             color = (255, 255, 0) if i == self.selected_index else (200, 200, 200)
-            item_surface = self.small_font.render(item, True, color)
+            item_surface = render_text(self.small_font, item, color)
             item_rect = item_surface.get_rect(center=(self.game.width // 2, self.game.height // 2 + i * 40))
             surface.blit(item_surface, item_rect)
         
@@ -208,7 +227,7 @@ class TitleScreen(State):
         
         control_y = self.game.height - 80
         for i, control in enumerate(controls):
-            control_text = self.small_font.render(control, True, (150, 150, 150))
+            control_text = render_text(self.small_font, control, (150, 150, 150))
             surface.blit(control_text, (20, control_y + i * 20))
 
     def _render_game_over(self, surface):
@@ -233,9 +252,9 @@ class TitleScreen(State):
         for i, message in enumerate(self.game_over_messages):
             if message:  # 빈 문자열이 아닌 경우만 표시
                 if i == 0:  # "게임 오버"는 큰 글씨로
-                    text_surface = self.font.render(message, True, (255, 100, 100))
+                    text_surface = render_text(self.font, message, (255, 100, 100))
                 else:
-                    text_surface = self.small_font.render(message, True, (200, 200, 200))
+                    text_surface = render_text(self.small_font, message, (200, 200, 200))
                 
                 text_rect = text_surface.get_rect(center=(center_x, start_y + i * 40))
                 surface.blit(text_surface, text_rect)
@@ -257,10 +276,9 @@ class TitleScreen(State):
         )
         
         restart_color = (255, 200, 100) if self.game_over_selected_index == 0 else (150, 150, 150)
-        pygame.draw.rect(surface, restart_color, restart_btn, border_radius=8)
-        pygame.draw.rect(surface, (255, 255, 255), restart_btn, 2, border_radius=8)
+        draw_panel(surface, restart_btn, restart_color, (255, 255, 255), 2, shadow=False, radius=8)
         
-        restart_text = self.small_font.render("다시 도전", True, (50, 50, 50))
+        restart_text = render_text(self.small_font, "다시 도전", (50, 50, 50))
         restart_text_rect = restart_text.get_rect(center=restart_btn.center)
         surface.blit(restart_text, restart_text_rect)
         
@@ -273,10 +291,9 @@ class TitleScreen(State):
         )
         
         load_color = (255, 200, 100) if self.game_over_selected_index == 1 else (150, 150, 150)
-        pygame.draw.rect(surface, load_color, load_btn, border_radius=8)
-        pygame.draw.rect(surface, (255, 255, 255), load_btn, 2, border_radius=8)
+        draw_panel(surface, load_btn, load_color, (255, 255, 255), 2, shadow=False, radius=8)
         
-        load_text = self.small_font.render("로드", True, (50, 50, 50))
+        load_text = render_text(self.small_font, "로드", (50, 50, 50))
         load_text_rect = load_text.get_rect(center=load_btn.center)
         surface.blit(load_text, load_text_rect)
 
@@ -290,7 +307,7 @@ class TitleScreen(State):
         
         control_y = self.game.height - 80
         for i, control in enumerate(controls):
-            control_text = self.small_font.render(control, True, (150, 150, 150))
+            control_text = render_text(self.small_font, control, (150, 150, 150))
             surface.blit(control_text, (20, control_y + i * 20))
 
 
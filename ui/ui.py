@@ -1,3 +1,8 @@
+import json
+import os
+import time
+from collections import OrderedDict
+
 import pygame
 
 
@@ -11,63 +16,437 @@ THEME = {
     "text_dim": (200, 200, 200),
 }
 
+# 숫자가 자주 바뀌는 HUD 글자 색임. 글리프 아틀라스로 그림
+HUD_COLORS = {
+    "name": (255, 255, 100),
+    "hp": (255, 100, 100),
+    "ep": (100, 150, 255),
+    "exp": (100, 255, 100),
+    "gold": (255, 215, 0),
+    "gems": (100, 200, 255),
+    "enemy_hp": (220, 180, 180),
+    "timer": (200, 200, 200),
+    "timer_soon": (255, 200, 100),
+}
+
+# 미리 래스터화할 글자임(ASCII 전체 + HUD 문구에 쓰이는 한글)
+PREWARM_CHARS = "".join(chr(c) for c in range(32, 127)) + "골드보석보유금액개초"
+# 첫 프레임 뒤 미리 채워 둘 (글꼴 크기, 색) 조합임(오버월드 14, 전투 16)
+HUD_GLYPH_STYLES = tuple((14, color) for color in HUD_COLORS.values()) + tuple(
+    (16, HUD_COLORS[key]) for key in ("hp", "ep", "enemy_hp", "gold", "gems"))
+
 
 _font_cache = {}  # 폰트 캐시임
 
+# 한글 폰트 우선으로 찾을 글꼴 이름 목록임
+FONT_CANDIDATES = (
+    "Malgun Gothic", "맑은 고딕", "NanumGothic", "Nanum Gothic",
+    "Apple SD Gothic Neo", "Noto Sans CJK KR", "Noto Sans Korean",
+    "Arial Unicode MS", "Arial", "DejaVu Sans",
+)
+# 찾은 폰트 경로를 저장해 두는 파일임(폰트 폴더가 바뀌면 다시 탐색함)
+FONT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "saves", "font_cache.json")
+FONT_CACHE_VERSION = 1
+_font_path = None  # (경로,) 형태. 경로가 None이면 pygame 기본 폰트 씀
+_font_discovery = {"ms": 0.0, "source": None}
+
+
+class SurfaceCache:
+    # 총 픽셀 메모리 한도 안에서 최근에 쓴 서피스만 남기는 LRU 캐시임
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0  # 현재 보관 중인 픽셀 메모리(바이트)임
+        self._items = OrderedDict()  # 키 → (서피스, 바이트), 뒤쪽이 최근 사용
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        # 있으면 최근 사용으로 옮기고 반환함. 없으면 None 반환함
+        entry = self._items.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, surface):
+        size = surface.get_pitch() * surface.get_height()
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        if size > self.max_bytes:
+            return surface  # 한도보다 큰 서피스는 보관하지 않음
+        self._items[key] = (surface, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self._items.popitem(last=False)
+            self.bytes -= evicted
+            self.evictions += 1
+        return surface
+
+    def discard(self, key):
+        entry = self._items.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def clear(self):
+        self._items.clear()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def stats(self):
+        # 적중/실패 횟수, 적중률, 항목 수, 메모리 사용량 반환함
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._items),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# 렌더링한 글자 서피스 캐시임. 반환된 서피스는 공유되므로 수정하면 안 됨
+_text_cache = SurfaceCache(8 * 1024 * 1024)
+
+
+def render_text(font, text, color, antialias=True):
+    # font.render 대신 씀. 같은 (폰트, 글자, 안티앨리어싱, 색) 조합은 한 번만 래스터화함
+    color = tuple(color)
+    key = (font, text, antialias, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        surface = _text_cache.put(key, font.render(text, antialias, color))
+    return surface
+
+
+def text_cache_stats():
+    return _text_cache.stats()
+
+
+class GlyphAtlas:
+    # 한 (폰트, 색, 안티앨리어싱) 조합의 글자를 한 장 서피스에 모아 둔 아틀라스임
+    # 문자열은 글자 영역을 Surface.blits로 이어 붙여 그리므로 숫자가 바뀌어도 래스터화 없음
+    # 글자 간격은 정수 advance라 긴 문자열은 font.render보다 1~2px 짧을 수 있음(HUD 용도로 충분함)
+
+    def __init__(self, font, color, antialias=True, width=512):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.line_height = font.get_height()
+        self.surface = pygame.Surface((width, self.line_height * 4), pygame.SRCALPHA)
+        self.glyphs = {}  # 글자 → (아틀라스 안 영역, 다음 글자까지 간격)
+        self._x = 0
+        self._y = 0
+
+    def _add(self, ch):
+        glyph = self.font.render(ch, self.antialias, self.color)
+        w, h = glyph.get_size()
+        if self._x + w > self.surface.get_width():
+            self._x = 0
+            self._y += self.line_height
+        if self._y + h > self.surface.get_height():
+            # 자리 모자라면 높이 두 배로 늘리고 기존 글자 옮겨 담음
+            grown = pygame.Surface((self.surface.get_width(), self.surface.get_height() * 2), pygame.SRCALPHA)
+            grown.blit(self.surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.surface = grown
+        area = pygame.Rect(self._x, self._y, w, h)
+        # 투명한 자리에 그대로 복사함(알파 합성하면 가장자리가 어두워짐)
+        self.surface.blit(glyph, area, special_flags=pygame.BLEND_RGBA_MAX)
+        self._x += w + 1
+        metrics = self.font.metrics(ch)
+        advance = metrics[0][4] if metrics and metrics[0] else w
+        entry = self.glyphs[ch] = (area, advance)
+        return entry
+
+    def prewarm(self, chars):
+        for ch in chars:
+            if ch not in self.glyphs:
+                self._add(ch)
+
+    def size(self, text):
+        glyphs = self.glyphs
+        width = 0
+        for ch in text:
+            entry = glyphs.get(ch) or self._add(ch)
+            width += entry[1]
+        return width, self.line_height
+
+    def draw(self, surface, text, pos, special_flags=0):
+        # 문자열을 pos(좌상단)에 그리고 그린 영역 반환함
+        # 투명 서피스에 미리 그려 둘 때는 special_flags=BLEND_RGBA_MAX로 그대로 복사함
+        x, y = pos
+        glyphs = self.glyphs
+        atlas = self.surface
+        sequence = []
+        for ch in text:
+            entry = glyphs.get(ch) or self._add(ch)
+            sequence.append((atlas, (x, y), entry[0], special_flags))
+            x += entry[1]
+        # 글자 추가로 아틀라스가 커졌을 수 있으므로 마지막 서피스로 맞춤
+        if sequence and sequence[0][0] is not self.surface:
+            sequence = [(self.surface, dest, area, flags) for _, dest, area, flags in sequence]
+        surface.blits(sequence, doreturn=False)
+        return pygame.Rect(pos[0], pos[1], x - pos[0], self.line_height)
+
+
+_glyph_atlases = {}  # (폰트, 색, 안티앨리어싱) → GlyphAtlas
+
+
+def get_glyph_atlas(font, color, antialias=True):
+    key = (font, tuple(color), antialias)
+    atlas = _glyph_atlases.get(key)
+    if atlas is None:
+        atlas = _glyph_atlases[key] = GlyphAtlas(font, tuple(color), antialias)
+    return atlas
+
+
+def draw_glyph_text(surface, font, text, pos, color, antialias=True):
+    # 숫자처럼 자주 바뀌는 글자용. 글자 단위 아틀라스에서 이어 붙여 그림
+    return get_glyph_atlas(font, color, antialias).draw(surface, text, pos)
+
+
+def prewarm_glyphs(styles=HUD_GLYPH_STYLES, chars=PREWARM_CHARS):
+    # (글꼴 크기, 색) 조합별로 자주 쓰는 글자를 미리 아틀라스에 넣어 둠
+    for size, color in styles:
+        get_glyph_atlas(get_font(size), color).prewarm(chars)
+
+
+def _font_dirs():
+    # 운영체제별 폰트 폴더 목록임(존재하는 것만)
+    home = os.path.expanduser("~")
+    dirs = [
+        os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+        os.path.join(os.environ.get("LOCALAPPDATA", ""), "Microsoft", "Windows", "Fonts"),
+        "/Library/Fonts", "/System/Library/Fonts", os.path.join(home, "Library", "Fonts"),
+        "/usr/share/fonts", "/usr/local/share/fonts",
+        os.path.join(home, ".fonts"), os.path.join(home, ".local", "share", "fonts"),
+    ]
+    return [d for d in dirs if os.path.isdir(d)]
+
+
+def _font_dirs_signature():
+    # 폰트 폴더별 수정 시각임. 폰트를 설치/삭제하면 바뀌어 캐시가 무효화됨
+    signature = {}
+    for d in _font_dirs():
+        try:
+            signature[d] = os.stat(d).st_mtime_ns
+        except OSError:
+            pass
+    return signature
+
+
+def _load_font_cache(signature):
+    try:
+        with open(FONT_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != FONT_CACHE_VERSION or data.get("dirs") != signature:
+        return None
+    path = data.get("path")
+    if path is not None and not os.path.isfile(path):
+        return None
+    return (path,)
+
+
+def _save_font_cache(signature, path):
+    # 캐시 저장 실패해도 다음 실행 때 다시 탐색할 뿐이므로 무시함
+    try:
+        os.makedirs(os.path.dirname(FONT_CACHE_PATH), exist_ok=True)
+        tmp_path = FONT_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": FONT_CACHE_VERSION, "dirs": signature, "path": path}, f, ensure_ascii=False)
+        os.replace(tmp_path, FONT_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _discover_font_path():
+    # 후보 글꼴 중 처음 찾은 파일 경로 반환함. match_font는 fc-list를 부를 수 있어 느림
+    for name in FONT_CANDIDATES:
+        try:
+            fpath = pygame.font.match_font(name)
+        except Exception:
+            fpath = None
+        if fpath:
+            return fpath
+    return pygame.font.match_font("arial")
+
+
+def get_font_path():
+    # 폰트 경로는 프로세스당 한 번, 디스크 캐시가 유효하면 탐색 없이 정함
+    global _font_path
+    if _font_path is None:
+        started = time.perf_counter()
+        signature = _font_dirs_signature()
+        _font_path = _load_font_cache(signature)
+        if _font_path is not None:
+            _font_discovery["source"] = "cache"
+        else:
+            _font_path = (_discover_font_path(),)
+            _save_font_cache(signature, _font_path[0])
+            _font_discovery["source"] = "scan"
+        _font_discovery["ms"] = (time.perf_counter() - started) * 1000.0
+    return _font_path[0]
+
+
+def font_discovery_stats():
+    # (탐색에 걸린 ms, "cache" 또는 "scan") 반환함
+    return _font_discovery["ms"], _font_discovery["source"]
+
 
 def get_font(size):
-    # 지정한 크기의 폰트 반환함(캐시 사용). 한글 폰트 우선 탐색함
+    # 지정한 크기의 폰트 반환함(캐시 사용). 경로는 한 번만 찾고 크기별로 바로 불러옴
     if size in _font_cache:
         return _font_cache[size]
-    candidates = [
-        "Malgun Gothic", "맑은 고딕", "NanumGothic", "Nanum Gothic",
-        "Apple SD Gothic Neo", "Noto Sans CJK KR", "Noto Sans Korean",
-        "Arial Unicode MS", "Arial", "DejaVu Sans",
-    ]
     font = None
-    for name in candidates:
+    path = get_font_path()
+    if path:
         try:
-            fpath = pygame.font.match_font(name)
-            if fpath:
-                font = pygame.font.Font(fpath, size)
-                break
+            font = pygame.font.Font(path, size)
         except Exception:
-            pass
+            font = None
     if font is None:
-        font = pygame.font.SysFont("arial", size)
+        font = pygame.font.Font(None, size)
     _font_cache[size] = font
     return font
 
 
-def draw_panel(surface, rect, fill=None, border=None, border_width=2, shadow=True):
-    # 기본 패널 그림(옵션: 그림자)
-    fill = fill if fill is not None else THEME["panel"]
-    border = border if border is not None else THEME["panel_border"]
-    if shadow:
-        shadow_rect = rect.move(3, 3)
-        pygame.draw.rect(surface, (0, 0, 0), shadow_rect, border_radius=6)
-    pygame.draw.rect(surface, fill, rect, border_radius=6)
-    pygame.draw.rect(surface, border, rect, border_width, border_radius=6)
+_shape_cache = SurfaceCache(4 * 1024 * 1024)  # 크기/색별로 미리 그린 패널·게이지 서피스임
+_SHAPE_COLORKEY = (255, 0, 255)  # 패널/게이지 바깥 투명 영역 표시용 색임(테마에 쓰지 않음)
+_slice_templates = {}  # (채움색, 테두리색, 테두리 두께, 반지름) → (9분할 원본, 모서리 크기)
+
+
+def _slice_template(fill, border, border_width, radius):
+    # 모서리 둘과 가운데 1px만 있는 작은 원본을 한 번 그려 둠
+    key = (fill, border, border_width, radius)
+    entry = _slice_templates.get(key)
+    if entry is None:
+        corner = max(radius, border_width)
+        size = corner * 2 + 1
+        template = pygame.Surface((size, size), pygame.SRCALPHA)
+        _draw_round_rect(template, template.get_rect(), fill, border, border_width, radius)
+        entry = _slice_templates[key] = (template, corner)
+    return entry
+
+
+def _draw_round_rect(surface, rect, fill, border, border_width, radius):
+    if fill is not None:
+        pygame.draw.rect(surface, fill, rect, border_radius=radius)
+    if border is not None and border_width > 0:
+        pygame.draw.rect(surface, border, rect, border_width, border_radius=radius)
+
+
+def _nine_slice(w, h, fill, border=None, border_width=0, radius=0):
+    # 모서리는 그대로 복사하고 변과 가운데만 늘려 w×h 서피스 만듦
+    template, corner = _slice_template(fill, border, border_width, radius)
+    canvas = pygame.Surface((w, h), pygame.SRCALPHA)
+    if w < template.get_width() or h < template.get_height():
+        # 모서리보다 작은 크기는 그냥 직접 그림
+        _draw_round_rect(canvas, canvas.get_rect(), fill, border, border_width, radius)
+        return canvas
+    cols = ((0, corner, 0, corner), (corner, 1, corner, w - corner * 2), (corner + 1, corner, w - corner, corner))
+    rows = ((0, corner, 0, corner), (corner, 1, corner, h - corner * 2), (corner + 1, corner, h - corner, corner))
+    for sx, sw, dx, dw in cols:
+        for sy, sh, dy, dh in rows:
+            if dw <= 0 or dh <= 0:
+                continue
+            piece = template.subsurface((sx, sy, sw, sh))
+            if (sw, sh) != (dw, dh):
+                piece = pygame.transform.scale(piece, (dw, dh))
+            canvas.blit(piece, (dx, dy))
+    return canvas
+
+
+def _cached_shape(key, build):
+    shape = _shape_cache.get(key)
+    if shape is None:
+        # 둥근 모서리에 안티앨리어싱이 없어 완전 투명/불투명뿐이므로
+        # 픽셀 알파 대신 컬러키+RLE로 바꿔 둠(알파 합성 blit보다 훨씬 빠름)
+        drawn = build()
+        shape = pygame.Surface(drawn.get_size())
+        shape.fill(_SHAPE_COLORKEY)
+        shape.blit(drawn, (0, 0))
+        shape.set_colorkey(_SHAPE_COLORKEY, pygame.RLEACCEL)
+        _shape_cache.put(key, shape)
+    return shape
+
+
+def panel_surface(w, h, fill=None, border=None, border_width=2, shadow=True, radius=6):
+    # 크기/색별로 한 번 만든 패널 서피스 반환함(그림자 있으면 3px 더 큼)
+    fill = tuple(fill if fill is not None else THEME["panel"])
+    border = tuple(border if border is not None else THEME["panel_border"])
 
+    def build():
+        body = _nine_slice(w, h, fill, border, border_width, radius)
+        if not shadow:
+            return body
+        panel = pygame.Surface((w + 3, h + 3), pygame.SRCALPHA)
+        panel.blit(_nine_slice(w, h, (0, 0, 0), radius=radius), (3, 3))
+        panel.blit(body, (0, 0))
+        return panel
 
-def draw_gauge(surface, x, y, w, h, ratio, fill_color=None, back_color=(60, 60, 60), border_color=(20, 20, 20)):
-    # 게이지 바 그림(ratio 0~1 범위)
-    fill_color = fill_color if fill_color is not None else THEME["accent"]
-    pygame.draw.rect(surface, back_color, pygame.Rect(x, y, w, h), border_radius=3)
+    return _cached_shape(("panel", w, h, fill, border, border_width, shadow, radius), build)
+
+
+def draw_panel(surface, rect, fill=None, border=None, border_width=2, shadow=True, radius=6):
+    # 기본 패널 그림(옵션: 그림자). 크기/색별로 한 번 만든 서피스를 blit 한 번으로 그림
+    if rect.width <= 0 or rect.height <= 0:
+        return
+    surface.blit(panel_surface(rect.width, rect.height, fill, border, border_width, shadow, radius), rect.topleft)
+
+
+def draw_gauge(surface, x, y, w, h, ratio, fill_color=None, back_color=(60, 60, 60), border_color=(20, 20, 20), radius=3):
+    # 게이지 바 그림(ratio 0~1 범위). 빈/가득 찬 상태는 blit 한 번, 중간 값은 띠를 잘라 붙임
+    fill_color = tuple(fill_color if fill_color is not None else THEME["accent"])
+    back_color = tuple(back_color)
+    border_color = tuple(border_color)
+    if w <= 0 or h <= 0:
+        return
     fill_w = int(max(0.0, min(1.0, ratio)) * w)
-    if fill_w > 0:
-        pygame.draw.rect(surface, fill_color, pygame.Rect(x, y, fill_w, h), border_radius=3)
-    pygame.draw.rect(surface, border_color, pygame.Rect(x, y, w, h), 1, border_radius=3)
+    style = (w, h, fill_color, back_color, border_color, radius)
+    if fill_w <= 0:
+        empty = _cached_shape(("gauge_empty",) + style,
+                              lambda: _nine_slice(w, h, back_color, border_color, 1, radius))
+        surface.blit(empty, (x, y))
+        return
+    if fill_w >= w:
+        full = _cached_shape(("gauge_full",) + style,
+                             lambda: _nine_slice(w, h, fill_color, border_color, 1, radius))
+        surface.blit(full, (x, y))
+        return
+    back = _cached_shape(("gauge_back",) + style, lambda: _nine_slice(w, h, back_color, radius=radius))
+    surface.blit(back, (x, y))
+    if fill_w > radius * 2:
+        # 가득 찬 띠의 왼쪽 부분과 오른쪽 둥근 끝을 이어 붙여 fill_w 길이로 만듦
+        strip = _cached_shape(("gauge_fill",) + style, lambda: _nine_slice(w, h, fill_color, radius=radius))
+        surface.blits((
+            (strip, (x, y), pygame.Rect(0, 0, fill_w - radius, h)),
+            (strip, (x + fill_w - radius, y), pygame.Rect(w - radius, 0, radius, h)),
+        ), doreturn=False)
+    else:
+        pygame.draw.rect(surface, fill_color, pygame.Rect(x, y, fill_w, h), border_radius=radius)
+    outline = _cached_shape(("gauge_outline",) + style, lambda: _nine_slice(w, h, None, border_color, 1, radius))
+    surface.blit(outline, (x, y))
 
 
 def measure_text_lines(font, lines):
-    # 여러 줄 텍스트 총 크기 계산함
+    # 여러 줄 텍스트 총 크기 계산함(렌더링 없이 font.size로만 잼)
     max_w = 0
     total_h = 0
     for line in lines:
-        surf = font.render(line, True, (255, 255, 255))
-        max_w = max(max_w, surf.get_width())
-        total_h += surf.get_height()
+        w, h = font.size(line)
+        max_w = max(max_w, w)
+        total_h += h
     return max_w, total_h
 
 
@@ -76,62 +455,134 @@ def draw_text_panel(surface, lines, pos, font, padding=10, margin=0):
     w, h = measure_text_lines(font, lines)
     rect = pygame.Rect(pos[0], pos[1], w + padding * 2, h + padding * 2)
     draw_panel(surface, rect, shadow=False)
-    y = rect.y + padding
-    for line in lines:
-        surf = font.render(line, True, THEME["text"])
-        surface.blit(surf, (rect.x + padding, y))
-        y += surf.get_height()
+    blit_text(surface, "\n".join(lines), (rect.x + padding, rect.y + padding), font, THEME["text"])
     return rect
 
 
+# 줄 맨 앞에 오면 안 되는 닫는 문장부호임(앞 글자에 붙여서 끊음)
+_NO_LINE_START = frozenset(".,!?:;)]}…·~%」』〉》’”")
+
+_word_width_cache = {}  # (폰트, 단어) → 픽셀 너비
+_WORD_WIDTH_CACHE_SIZE = 8192
+_layout_cache = OrderedDict()  # (폰트, 텍스트, 최대 너비) → 줄 목록
+_LAYOUT_CACHE_SIZE = 256
+
+
+def _text_width(font, text):
+    # 단어 너비는 렌더링 없이 font.size로 재고 캐시함
+    key = (font, text)
+    width = _word_width_cache.get(key)
+    if width is None:
+        if len(_word_width_cache) >= _WORD_WIDTH_CACHE_SIZE:
+            _word_width_cache.clear()
+        width = _word_width_cache[key] = font.size(text)[0]
+    return width
+
+
+def _split_long_word(font, word, max_width):
+    # 한 줄보다 긴 단어는 음절(글자) 단위로 끊음. 닫는 문장부호는 줄 맨 앞에 두지 않음
+    pieces = []
+    piece = ""
+    width = 0
+    for ch in word:
+        ch_width = _text_width(font, ch)
+        if piece and width + ch_width > max_width and ch not in _NO_LINE_START:
+            pieces.append(piece)
+            piece = ""
+            width = 0
+        piece += ch
+        width += ch_width
+    pieces.append(piece)
+    return pieces
+
+
+def _wrap_line(font, line, max_width):
+    # 공백(어절) 기준으로 채우고 단어 너비 합으로 판단하므로 줄 길이에 선형임
+    space_width = _text_width(font, " ")
+    lines = []
+    current = ""
+    width = 0
+    for word in line.split(" "):
+        word_width = _text_width(font, word)
+        if current == "":
+            if word_width <= max_width:
+                current = word
+                width = word_width
+                continue
+        elif width + space_width + word_width <= max_width:
+            current += " " + word
+            width += space_width + word_width
+            continue
+        if current != "":
+            lines.append(current)
+        if word_width > max_width:
+            pieces = _split_long_word(font, word, max_width)
+            lines.extend(pieces[:-1])
+            word = pieces[-1]
+            word_width = _text_width(font, word)
+        current = word
+        width = word_width
+    if current != "":
+        lines.append(current)
+    return lines
+
+
+def layout_text(font, text, max_width=None):
+    # 텍스트를 줄 목록으로 나눔. (폰트, 텍스트, 너비)마다 한 번만 계산함
+    if max_width is None:
+        return text.split("\n")
+    key = (font, text, max_width)
+    lines = _layout_cache.get(key)
+    if lines is not None:
+        _layout_cache.move_to_end(key)
+        return lines
+    lines = []
+    for raw_line in text.split("\n"):
+        lines.extend(_wrap_line(font, raw_line, max_width))
+    lines = _layout_cache[key] = tuple(lines)
+    if len(_layout_cache) > _LAYOUT_CACHE_SIZE:
+        _layout_cache.popitem(last=False)
+    return lines
+
+
+def _render_text_block(font, lines, color, line_spacing, max_width, align):
+    # 줄 목록을 투명 서피스 한 장에 그림
+    sizes = [font.size(line) for line in lines]
+    block_w = max_width if max_width is not None else max((w for w, _ in sizes), default=0)
+    block_h = max(0, sum(h for _, h in sizes) + line_spacing * (len(lines) - 1))
+    block = pygame.Surface((block_w, block_h), pygame.SRCALPHA)
+    y = 0
+    for line, (w, h) in zip(lines, sizes):
+        if align == "center":
+            lx = block_w // 2 - w // 2
+        elif align == "right":
+            lx = block_w - w
+        else:
+            lx = 0
+        # 줄끼리 겹치지 않으므로 알파 합성 대신 그대로 복사함
+        block.blit(font.render(line, True, color), (lx, y), special_flags=pygame.BLEND_RGBA_MAX)
+        y += h + line_spacing
+    return block
+
+
 def blit_text(surface, text, pos, font, color=None, line_spacing=0, max_width=None, align="left"):
     # 여러 줄(\n)과 단어 단위 줄바꿈 지원하여 텍스트 그림
+    # 줄바꿈 결과와 완성된 블록 서피스를 캐시하므로 같은 문단은 blit 한 번으로 그림
     if color is None:
         color = THEME["text"]
-    x, y = pos
-    for raw_line in text.split("\n"):
-        if max_width is None:
-            line_surface = font.render(raw_line, True, color)
-            line_rect = line_surface.get_rect()
-            if align == "center":
-                line_rect.midtop = (x, y)
-            elif align == "right":
-                line_rect.topright = (x, y)
-            else:
-                line_rect.topleft = (x, y)
-            surface.blit(line_surface, line_rect)
-            y += line_surface.get_height() + line_spacing
-            continue
-        # max_width가 있으면 단어 단위로 줄바꿈
-        words = raw_line.split(" ")
-        current_line = ""
-        for word in words:
-            test_line = word if current_line == "" else current_line + " " + word
-            test_surface = font.render(test_line, True, color)
-            if test_surface.get_width() <= max_width:
-                current_line = test_line
-            else:
-                if current_line != "":
-                    line_surface = font.render(current_line, True, color)
-                    line_rect = line_surface.get_rect()
-                    if align == "center":
-                        line_rect.midtop = (x + max_width // 2, y)
-                    elif align == "right":
-                        line_rect.topright = (x + max_width, y)
-                    else:
-                        line_rect.topleft = (x, y)
-                    surface.blit(line_surface, line_rect)
-                    y += line_surface.get_height() + line_spacing
-                current_line = word
-        if current_line != "":
-            line_surface = font.render(current_line, True, color)
-            line_rect = line_surface.get_rect()
-            if align == "center":
-                line_rect.midtop = (x + max_width // 2, y)
-            elif align == "right":
-                line_rect.topright = (x + max_width, y)
-            else:
-                line_rect.topleft = (x, y)
-            surface.blit(line_surface, line_rect)
-            y += line_surface.get_height() + line_spacing
-    return y - pos[1]
+    lines = layout_text(font, text, max_width)
+    key = ("block", font, text, tuple(color), line_spacing, max_width, align)
+    block = _text_cache.get(key)
+    if block is None:
+        block = _render_text_block(font, lines, color, line_spacing, max_width, align)
+        _text_cache.put(key, block)
+    block_rect = block.get_rect()
+    if max_width is None and align == "center":
+        block_rect.midtop = pos
+    elif max_width is None and align == "right":
+        block_rect.topright = pos
+    else:
+        block_rect.topleft = pos
+    surface.blit(block, block_rect)
+    # 마지막 줄 뒤 줄 간격까지 포함한 높이 반환함(기존과 같음)
+    return block.get_height() + line_spacing if lines else 0
@@ -0,0 +1,164 @@
+import pygame
+
+from ui.ui import THEME, draw_gauge, get_glyph_atlas, panel_surface, render_text
+
+# 아직 한 번도 그리지 않았음을 나타내는 값임(바인딩 반환값이 None일 수도 있어 따로 둠)
+_UNSET = object()
+
+
+class Widget:
+    # 유지형(retained) UI 트리 노드임. rect는 부모 기준 위치이고 자식을 가질 수 있음
+    # bind는 인자 없는 함수로, 반환값이 바뀔 때만 render로 서피스를 다시 만듦
+
+    def __init__(self, rect=(0, 0, 0, 0), bind=None, on_click=None, show=None):
+        self.rect = pygame.Rect(rect)
+        self.bind = bind
+        self.on_click = on_click  # 클릭 시 호출할 함수(없으면 클릭 통과)
+        self.show = show  # 보일지 정하는 함수(없으면 항상 보임)
+        self.parent = None
+        self.children = []
+        self.surface = None
+        self._state = _UNSET
+
+    def add(self, child):
+        child.parent = self
+        self.children.append(child)
+        return child
+
+    def is_visible(self):
+        return self.show is None or self.show()
+
+    def invalidate(self):
+        # 바인딩 값과 상관없이 다음에 그릴 때 다시 만듦
+        self._state = _UNSET
+
+    def refresh(self):
+        # 바인딩 값이 바뀌었으면 서피스 다시 만들고 True 반환함
+        state = self.bind() if self.bind is not None else None
+        if state == self._state:
+            return False
+        self._state = state
+        self.surface = self.render(state)
+        return True
+
+    def render(self, state):
+        # 서브클래스가 자기 서피스를 만들어 반환함(없으면 자식만 그림)
+        return None
+
+    def draw(self, surface, origin=(0, 0)):
+        if not self.is_visible():
+            return
+        x = origin[0] + self.rect.x
+        y = origin[1] + self.rect.y
+        self.refresh()
+        if self.surface is not None:
+            surface.blit(self.surface, (x, y))
+        for child in self.children:
+            child.draw(surface, (x, y))
+
+    def hit_test(self, pos, origin=(0, 0)):
+        # 나중에 그려진(위에 있는) 자식부터 확인해 클릭을 받을 가장 깊은 위젯 반환함
+        if not self.is_visible():
+            return None
+        rect = self.rect.move(origin)
+        for child in reversed(self.children):
+            hit = child.hit_test(pos, rect.topleft)
+            if hit is not None:
+                return hit
+        if self.on_click is not None and rect.collidepoint(pos):
+            return self
+        return None
+
+    def click(self, pos):
+        # 클릭 처리했으면 True 반환함
+        hit = self.hit_test(pos)
+        if hit is None:
+            return False
+        hit.on_click()
+        return True
+
+
+class Panel(Widget):
+    # 패널 배경임. bind가 (너비, 높이)를 돌려주면 내용에 맞춰 크기가 바뀜
+
+    def __init__(self, rect, fill=None, border=None, border_width=2, shadow=False, radius=6, **kwargs):
+        super().__init__(rect, **kwargs)
+        self.style = (fill, border, border_width, shadow, radius)
+
+    def render(self, state):
+        if state is not None:
+            self.rect.size = state
+        if self.rect.width <= 0 or self.rect.height <= 0:
+            return None
+        return panel_surface(self.rect.width, self.rect.height, *self.style)
+
+
+class Label(Widget):
+    # 한 줄 텍스트임. bind는 문자열이나 (문자열, 색)을 돌려줌
+    # glyphs=True면 글리프 아틀라스로 조립해 숫자가 바뀌어도 글꼴 래스터화 없음
+
+    def __init__(self, pos, font, text="", color=None, glyphs=False, **kwargs):
+        super().__init__((pos[0], pos[1], 0, 0), **kwargs)
+        self.font = font
+        self.text = text
+        self.color = color if color is not None else THEME["text"]
+        self.glyphs = glyphs
+
+    def render(self, state):
+        text, color = self.text, self.color
+        if isinstance(state, tuple):
+            text, color = state
+        elif state is not None:
+            text = state
+        if self.glyphs:
+            atlas = get_glyph_atlas(self.font, color)
+            surf = pygame.Surface(atlas.size(text), pygame.SRCALPHA)
+            atlas.draw(surf, text, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            surf = render_text(self.font, text, color)
+        self.rect.size = surf.get_size()
+        return surf
+
+
+class Gauge(Widget):
+    # 게이지 바임. bind는 0~1 비율을 돌려주고 채움 픽셀 수가 바뀔 때만 다시 그림
+
+    def __init__(self, rect, bind, fill_color=None, back_color=(60, 60, 60), border_color=(20, 20, 20),
+                 radius=3, **kwargs):
+        super().__init__(rect, **kwargs)
+        self.ratio = bind
+        self.bind = self._fill_width
+        self.colors = (fill_color, back_color, border_color)
+        self.radius = radius
+
+    def _fill_width(self):
+        return int(max(0.0, min(1.0, self.ratio())) * self.rect.width)
+
+    def render(self, state):
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        fill_color, back_color, border_color = self.colors
+        # 0.5 더해서 비율로 되돌릴 때 부동소수 오차로 1px 줄어들지 않게 함
+        ratio = (state + 0.5) / max(1, self.rect.width)
+        draw_gauge(surf, 0, 0, self.rect.width, self.rect.height, ratio,
+                   fill_color, back_color, border_color, self.radius)
+        return surf
+
+
+class ListView(Widget):
+    # 세로 목록임. bind가 돌려준 항목 목록이 바뀔 때만 build_row(인덱스, 항목)로 행 위젯을 다시 만듦
+    # 각 행의 rect는 목록 안 위치로 쓰이고, 행 높이만큼 차례로 쌓음
+
+    def __init__(self, rect, bind, build_row, spacing=0, **kwargs):
+        super().__init__(rect, bind=bind, **kwargs)
+        self.build_row = build_row
+        self.spacing = spacing
+
+    def render(self, state):
+        self.children = []
+        y = 0
+        for index, item in enumerate(state or ()):
+            row = self.add(self.build_row(index, item))
+            row.rect.y = y
+            y += row.rect.height + self.spacing
+        self.rect.height = max(0, y - self.spacing)
+        return None
@@ -0,0 +1,274 @@
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # numpy 없으면 열을 리스트로 두고 파이썬 반복문으로 처리함
+    np = None
+
+from world.spatial import CellIndex, SpatialHash
+
+# 적 한 명을 이루는 열 이름과 numpy 자료형임. 위치/크기는 Rect처럼 정수, 이동 방향은 실수임
+# prev_x/prev_y는 마지막 이동 전 위치(렌더링 보간 기준)임
+_COLUMNS = (
+    ("ids", "int64"), ("x", "int64"), ("y", "int64"), ("w", "int64"), ("h", "int64"),
+    ("dx", "float64"), ("dy", "float64"), ("types", "int64"), ("prev_x", "int64"), ("prev_y", "int64"),
+)
+
+
+class EnemyRegistry:
+    # 오버월드 적 목록임. 적마다 바뀌지 않는 ID를 주고 값은 열마다 배열 하나에 담음(struct-of-arrays)
+    # 이동/벽 반사/겹침 질의는 모든 적을 배열 연산 한 번으로 처리하고, Rect는 그릴 적처럼 필요한 적만 만듦
+    # 열 순서는 제거할 때 마지막 적을 빈자리로 옮기는(swap-remove) 방식이라 바뀔 수 있으므로
+    # 바깥(전투, 리젠 예약, 저장)에서는 항상 ID로 적을 가리킴
+    # 겹침/근접 질의는 격자 색인으로 주변 칸의 적만 골라 판정함. numpy면 열에서 맞추는 CellIndex, 아니면 SpatialHash임
+
+    def __init__(self, capacity=16, cell_size=32):
+        self.count = 0
+        self.index_of = {}  # ID -> 열 위치임
+        self.next_id = 0
+        # numpy 배열은 capacity만큼 미리 잡아 두고 앞쪽 count개만 씀. 리스트는 길이가 곧 count임
+        self.columns = {name: np.zeros(capacity, dtype) if np is not None else [] for name, dtype in _COLUMNS}
+        # SpatialHash는 적 ID마다 Rect를 들고 움직일 때마다 바로 고침
+        # grid_dirty는 적을 추가/제거해 CellIndex를 질의 전에 다시 만들어야 한다는 표시임
+        self.grid = CellIndex(cell_size) if np is not None else SpatialHash(cell_size)
+        self.grid_dirty = False
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, enemy_id):
+        return enemy_id in self.index_of
+
+    def column(self, name):
+        # 살아 있는 적 count개의 열 반환함(numpy면 복사 없는 뷰임)
+        values = self.columns[name]
+        return values[:self.count] if np is not None else values
+
+    @property
+    def ids(self):
+        return self.column("ids")
+
+    @property
+    def types(self):
+        return self.column("types")
+
+    def _grow(self):
+        # numpy 열 용량을 두 배로 늘림
+        for name, values in self.columns.items():
+            grown = np.zeros(max(16, 2 * len(values)), values.dtype)
+            grown[:len(values)] = values
+            self.columns[name] = grown
+
+    def add(self, rect, direction, enemy_type, enemy_id=None):
+        # 적 추가하고 ID 반환함. enemy_id를 주면(리젠, 불러오기) 그 ID를 그대로 씀
+        if enemy_id is None:
+            enemy_id = self.next_id
+        elif enemy_id in self.index_of:
+            raise ValueError(f"이미 있는 적 ID임: {enemy_id}")
+        rect = pygame.Rect(rect)
+        row = (enemy_id, rect.x, rect.y, rect.width, rect.height, float(direction[0]), float(direction[1]),
+               enemy_type, rect.x, rect.y)
+        index = self.count
+        if np is None:
+            for (name, _), value in zip(_COLUMNS, row):
+                self.columns[name].append(value)
+        else:
+            if index == len(self.columns["ids"]):
+                self._grow()
+            for (name, _), value in zip(_COLUMNS, row):
+                self.columns[name][index] = value
+        self.next_id = max(self.next_id, enemy_id + 1)
+        self.index_of[enemy_id] = index
+        self.count += 1
+        if np is None:
+            self.grid.insert(enemy_id, rect)
+        else:
+            self.grid_dirty = True
+        return enemy_id
+
+    def remove(self, enemy_id):
+        # 적 제거하고 (Rect, 방향, 타입) 반환함. 마지막 적을 빈자리로 옮겨 O(1)임
+        index = self.index_of.pop(enemy_id)
+        columns = self.columns
+        removed = (self._rect_at(index), pygame.Vector2(float(columns["dx"][index]), float(columns["dy"][index])),
+                   int(columns["types"][index]))
+        last = self.count - 1
+        if index != last:
+            for values in columns.values():
+                values[index] = values[last]
+            self.index_of[int(columns["ids"][index])] = index
+        if np is None:
+            for values in columns.values():
+                values.pop()
+        self.count = last
+        if np is None:
+            self.grid.remove(enemy_id)
+        else:
+            self.grid_dirty = True
+        return removed
+
+    def _rect_at(self, index):
+        columns = self.columns
+        return pygame.Rect(int(columns["x"][index]), int(columns["y"][index]),
+                           int(columns["w"][index]), int(columns["h"][index]))
+
+    def rect(self, enemy_id):
+        # 적 위치를 새 Rect로 만들어 반환함. 고쳐도 적에게 반영되지 않으므로 움직일 때는 shift 사용함
+        return self._rect_at(self.index_of[enemy_id])
+
+    def shift(self, enemy_id, dx, dy):
+        # 적을 (dx, dy) 픽셀 순간 이동시킴(보간 기준 위치는 그대로 둠)
+        index = self.index_of[enemy_id]
+        self.columns["x"][index] += dx
+        self.columns["y"][index] += dy
+        if np is None:
+            self.grid.move(enemy_id, self._rect_at(index))
+        elif not self.grid_dirty:
+            self.grid.update(self.column("x"), self.column("y"))
+
+    def type_of(self, enemy_id):
+        return int(self.columns["types"][self.index_of[enemy_id]])
+
+    def step(self, delta_time, speed, tilemap):
+        # 모든 적을 방향대로 움직임. 적끼리는 막지 않고, 축별로 이동 후 위치가 벽에 걸리면 그 축은 멈추고 방향만 뒤집음
+        # 이동 전 위치는 prev_x/prev_y에 남김. tilemap은 boxes_collide(numpy 배열 질의)를 지원해야 함
+        if np is None:
+            self._step_py(delta_time, speed, tilemap)
+            return
+        x, y, w, h = (self.column(name) for name in ("x", "y", "w", "h"))
+        dx, dy = self.column("dx"), self.column("dy")
+        self.column("prev_x")[:] = x
+        self.column("prev_y")[:] = y
+        # int()처럼 0 쪽으로 잘라 픽셀 단위로 움직임
+        move_x = (dx * speed * delta_time).astype(np.int64)
+        move_y = (dy * speed * delta_time).astype(np.int64)
+        moved = x + move_x
+        hit = tilemap.boxes_collide(moved, y, w, h)
+        dx[hit] *= -1
+        np.copyto(x, moved, where=~hit)
+        moved = y + move_y
+        hit = tilemap.boxes_collide(x, moved, w, h)
+        dy[hit] *= -1
+        np.copyto(y, moved, where=~hit)
+        self._update_grid()
+
+    def _step_py(self, delta_time, speed, tilemap):
+        # numpy가 없을 때의 step임(적마다 Rect 만들어 rect_collides로 확인함)
+        columns = self.columns
+        x, y, dx, dy = columns["x"], columns["y"], columns["dx"], columns["dy"]
+        moved_rects = []
+        for index in range(self.count):
+            columns["prev_x"][index] = x[index]
+            columns["prev_y"][index] = y[index]
+            move_x = int(dx[index] * speed * delta_time)
+            move_y = int(dy[index] * speed * delta_time)
+            rect = self._rect_at(index)
+            moved = rect.move(move_x, 0)
+            if tilemap.rect_collides(moved):
+                dx[index] *= -1
+            else:
+                rect = moved
+            moved = rect.move(0, move_y)
+            if tilemap.rect_collides(moved):
+                dy[index] *= -1
+            else:
+                rect = moved
+            x[index], y[index] = rect.x, rect.y
+            moved_rects.append((columns["ids"][index], rect))
+        if np is None:
+            self.grid.move_many(moved_rects)
+        else:
+            self._update_grid()  # numpy가 있어도 이 경로를 재는 벤치(bench/enemies.py)용임
+
+    def _sync_grid(self):
+        self.grid.sync(*(self.column(name) for name in ("x", "y", "w", "h")))
+        self.grid_dirty = False
+
+    def _update_grid(self):
+        # 이동 뒤 CellIndex를 맞춤. 추가/제거가 밀려 있으면 다시 만들고, 아니면 칸이 바뀐 적만 옮김
+        if self.grid_dirty:
+            self._sync_grid()
+        else:
+            self.grid.update(self.column("x"), self.column("y"))
+
+    def _candidates(self, rect):
+        # CellIndex에서 rect와 겹칠 수 있는 적의 열 위치 배열을 고름(numpy 전용)
+        if self.grid_dirty:
+            self._sync_grid()
+        return self.grid.candidates(rect)
+
+    def _overlapping(self, rect):
+        # rect와 겹치는(colliderect) 적의 열 위치 목록임(numpy면 정수 배열)
+        if np is None:
+            return [self.index_of[enemy_id] for enemy_id in self.grid.query_rect(rect)]
+        indices = self._candidates(rect)
+        x, y, w, h = (self.columns[name][indices] for name in ("x", "y", "w", "h"))
+        return indices[(x < rect.right) & (rect.left < x + w) & (y < rect.bottom) & (rect.top < y + h)]
+
+    def _gather(self, names, indices):
+        # 열 위치 목록에 해당하는 값을 열마다 파이썬 리스트로 모아 반환함(numpy면 열마다 한 번에 꺼냄)
+        if np is None:
+            return [[self.columns[name][index] for index in indices] for name in names]
+        return [self.columns[name][indices].tolist() for name in names]
+
+    def query_rect(self, rect):
+        # rect와 겹치는 적 ID 집합 반환함
+        return set(self._gather(("ids",), self._overlapping(pygame.Rect(rect)))[0])
+
+    def nearest(self, point, radius):
+        # 중심이 point에서 radius 안(경계 포함)인 적 중 가장 가까운 적 ID 반환함. 거리가 같으면 작은 ID, 없으면 None임
+        if np is None:
+            return self.grid.nearest(point, radius)
+        px, py = point
+        limit = radius * radius
+        reach = int(radius) + 1
+        indices = self._candidates(pygame.Rect(int(px) - reach, int(py) - reach, 2 * reach + 1, 2 * reach + 1))
+        ids, x, y, w, h = (self.columns[name][indices] for name in ("ids", "x", "y", "w", "h"))
+        dist = (x + w // 2 - px) ** 2 + (y + h // 2 - py) ** 2
+        inside = np.flatnonzero(dist <= limit)
+        if not len(inside):
+            return None
+        return int(ids[inside[np.lexsort((ids[inside], dist[inside]))[0]]])
+
+    def visible(self, view):
+        # view와 겹치는 적만 (ID, Rect, 이동 전 위치, 타입)으로 만들어 ID 순서대로 반환함(그리기용)
+        columns = self._gather(("ids", "x", "y", "w", "h", "prev_x", "prev_y", "types"),
+                               self._overlapping(pygame.Rect(view)))
+        rows = [(enemy_id, pygame.Rect(x, y, w, h), (prev_x, prev_y), enemy_type)
+                for enemy_id, x, y, w, h, prev_x, prev_y, enemy_type in zip(*columns)]
+        rows.sort(key=lambda row: row[0])
+        return rows
+
+    def to_data(self):
+        # 저장용 원시값 사본임. 예전 저장 형식(x, y, width, height)에 ID/타입/방향을 더함
+        columns = [list(self.column(name)) if np is None else self.column(name).tolist()
+                   for name in ("ids", "x", "y", "w", "h", "types", "dx", "dy")]
+        return {
+            "next_id": self.next_id,
+            "enemies": tuple({
+                "id": enemy_id,
+                "x": x,
+                "y": y,
+                "width": width,
+                "height": height,
+                "type": enemy_type,
+                "dir": (dx, dy),
+            } for enemy_id, x, y, width, height, enemy_type, dx, dy in zip(*columns)),
+        }
+
+    @classmethod
+    def from_data(cls, data):
+        # to_data 결과로 되돌림. 예전 저장(사각형 목록)은 목록 위치로 ID/타입/방향을 정함
+        registry = cls()
+        if isinstance(data, dict):
+            enemies = data.get("enemies", ())
+            registry.next_id = data.get("next_id", 0)
+        else:
+            enemies = data or ()
+        for index, enemy in enumerate(enemies):
+            if not isinstance(enemy, dict) or "x" not in enemy:
+                continue
+            rect = (enemy["x"], enemy["y"], enemy["width"], enemy["height"])
+            direction = enemy.get("dir", (1 if index % 2 == 0 else -1, 0))
+            registry.add(rect, direction, enemy.get("type", index % 8), enemy.get("id"))
+        return registry
@@ -0,0 +1,204 @@
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # numpy 없으면 CellIndex는 못 쓰고 SpatialHash만 씀
+    np = None
+
+_ROW_STRIDE = 1 << 32  # 칸 번호 = 칸 y * _ROW_STRIDE + 칸 x. 같은 줄의 칸은 번호가 연속임
+
+
+class SpatialHash:
+    # 균일 격자 공간 해시임. 키마다 사각형 하나를 왼쪽 위 꼭짓점이 속한 칸(cell_size 픽셀) 하나에 등록함
+    # 사각형은 그 칸 밖으로 삐져나갈 수 있으므로 질의할 때 지금까지 본 가장 큰 너비/높이만큼 왼쪽 위로 넓혀 찾음
+    # 움직일 때는 꼭짓점 칸이 바뀐 경우에만 칸을 옮기므로 대부분의 이동은 사각형 교체뿐임
+    # 넘겨받은 Rect는 복사하지 않고 그대로 들고 있으므로, 바꾸거나 교체한 뒤에는 move로 알려야 함
+
+    def __init__(self, cell_size=32):
+        self.cell_size = cell_size
+        self.cells = {}  # (칸 x, 칸 y) -> 키 집합임
+        self.items = {}  # 키 -> [사각형, 칸]임
+        self.reach_w = 0  # 등록된 적 있는 사각형 중 가장 큰 너비/높이임
+        self.reach_h = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def _relink(self, key, old_cell, new_cell):
+        cells = self.cells
+        if old_cell is not None:
+            bucket = cells[old_cell]
+            bucket.discard(key)
+            if not bucket:
+                del cells[old_cell]
+        bucket = cells.get(new_cell)
+        if bucket is None:
+            cells[new_cell] = bucket = set()
+        bucket.add(key)
+
+    def insert(self, key, rect):
+        if not isinstance(rect, pygame.Rect):
+            rect = pygame.Rect(rect)
+        entry = self.items.get(key)
+        cell = (rect.x // self.cell_size, rect.y // self.cell_size)
+        self.reach_w = max(self.reach_w, rect.w)
+        self.reach_h = max(self.reach_h, rect.h)
+        if entry is None:
+            self.items[key] = [rect, cell]
+            self._relink(key, None, cell)
+            return
+        entry[0] = rect
+        if cell != entry[1]:
+            self._relink(key, entry[1], cell)
+            entry[1] = cell
+
+    def move(self, key, rect):
+        # 키의 사각형 갱신함(없으면 새로 등록함)
+        self.insert(key, rect)
+
+    def move_many(self, pairs):
+        # (키, Rect) 여러 개를 한 번에 갱신함. 매 틱 전체 적 갱신용이라 크기가 커진 경우만 insert로 넘김
+        items = self.items
+        cs = self.cell_size
+        for key, rect in pairs:
+            entry = items.get(key)
+            if entry is None or rect.w > self.reach_w or rect.h > self.reach_h:
+                self.insert(key, rect)
+                continue
+            entry[0] = rect
+            cell = (rect.x // cs, rect.y // cs)
+            if cell != entry[1]:
+                self._relink(key, entry[1], cell)
+                entry[1] = cell
+
+    def remove(self, key):
+        entry = self.items.pop(key, None)
+        if entry is not None:
+            bucket = self.cells[entry[1]]
+            bucket.discard(key)
+            if not bucket:
+                del self.cells[entry[1]]
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+        self.reach_w = 0
+        self.reach_h = 0
+
+    def rebuild(self, pairs):
+        # (키, 사각형) 목록으로 처음부터 다시 채움(키 번호가 한꺼번에 바뀔 때 사용)
+        self.clear()
+        for key, rect in pairs:
+            self.insert(key, rect)
+
+    def _candidates(self, rect):
+        # rect와 겹칠 수 있는 사각형의 키 집합임(꼭짓점 칸 범위를 가장 큰 크기만큼 넓혀 모음)
+        cs = self.cell_size
+        x0 = (rect.left - self.reach_w) // cs
+        y0 = (rect.top - self.reach_h) // cs
+        x1 = (rect.right - 1) // cs
+        y1 = (rect.bottom - 1) // cs
+        cells = self.cells
+        found = set()
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            # 질의 범위가 등록된 칸 수보다 넓으면 칸을 하나씩 보는 대신 등록된 칸을 훑음
+            for (cx, cy), bucket in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    found |= bucket
+            return found
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
+
+    def query_rect(self, rect):
+        # rect와 겹치는(colliderect) 키 집합 반환함
+        if not isinstance(rect, pygame.Rect):
+            rect = pygame.Rect(rect)
+        items = self.items
+        return {key for key in self._candidates(rect) if items[key][0].colliderect(rect)}
+
+    def query_radius(self, point, radius):
+        # 사각형 중심이 point에서 radius 안(경계 포함)인 키를 (거리 제곱, 키) 목록으로 가까운 순서대로 반환함
+        px, py = point
+        r = int(radius) + 1
+        bounds = pygame.Rect(int(px) - r, int(py) - r, 2 * r + 1, 2 * r + 1)
+        limit = radius * radius
+        hits = []
+        for key in self._candidates(bounds):
+            cx, cy = self.items[key][0].center
+            dist = (cx - px) ** 2 + (cy - py) ** 2
+            if dist <= limit:
+                hits.append((dist, key))
+        hits.sort()
+        return hits
+
+    def nearest(self, point, radius):
+        # radius 안에서 중심이 가장 가까운 키 반환함. 거리가 같으면 작은 키, 없으면 None임
+        hits = self.query_radius(point, radius)
+        return hits[0][1] if hits else None
+
+
+class CellIndex:
+    # SpatialHash의 numpy 배열판임. 열 배열(struct-of-arrays)로 된 사각형들의 꼭짓점 칸 번호를 np.floor_divide로 한꺼번에 구해
+    # 칸 번호 순으로 정렬해 둠. 질의는 칸 줄마다 searchsorted로 구간을 잘라 후보 행 위치만 모으고, 정확한 판정은 부른 쪽이 함
+    # 행 위치는 sync에 넘긴 배열 기준임. 행이 늘고 줄면 sync로 다시 만들고, 위치만 바뀌면 update로 칸이 바뀐 행만 옮김
+
+    def __init__(self, cell_size=32):
+        self.cell_size = cell_size
+        self.row_keys = np.zeros(0, np.int64)  # 행마다 등록된 칸 번호임
+        self.keys = np.zeros(0, np.int64)  # 정렬된 칸 번호임
+        self.order = np.zeros(0, np.int64)  # keys 순서대로 늘어놓은 행 위치임
+        self.reach_w = 0  # 등록된 사각형 중 가장 큰 너비/높이임
+        self.reach_h = 0
+
+    def __len__(self):
+        return len(self.order)
+
+    def _cell_keys(self, x, y):
+        cs = self.cell_size
+        return np.floor_divide(y, cs) * _ROW_STRIDE + np.floor_divide(x, cs)
+
+    def sync(self, x, y, w, h):
+        # 행 배열로 색인을 처음부터 다시 만듦(행이 늘거나 줄었을 때)
+        self.row_keys = self._cell_keys(x, y)
+        self.order = np.argsort(self.row_keys, kind="stable")
+        self.keys = self.row_keys[self.order]
+        self.reach_w = int(w.max()) if len(w) else 0
+        self.reach_h = int(h.max()) if len(h) else 0
+
+    def update(self, x, y):
+        # 행은 그대로이고 위치만 바뀐 뒤 부름. 칸이 바뀐 행만 정렬 배열에서 빼서 새 칸 자리에 끼워 넣음
+        keys = self._cell_keys(x, y)
+        changed = np.flatnonzero(keys != self.row_keys)
+        if not len(changed):
+            return
+        self.row_keys[changed] = keys[changed]
+        moving = np.zeros(len(keys), dtype=bool)
+        moving[changed] = True
+        stay = ~moving[self.order]
+        order, sorted_keys = self.order[stay], self.keys[stay]
+        changed = changed[np.argsort(keys[changed], kind="stable")]
+        slots = np.searchsorted(sorted_keys, keys[changed], "right")
+        self.order = np.insert(order, slots, changed)
+        self.keys = np.insert(sorted_keys, slots, keys[changed])
+
+    def candidates(self, rect):
+        # rect와 겹칠 수 있는 행 위치 배열임(꼭짓점 칸 범위를 가장 큰 크기만큼 왼쪽 위로 넓혀 모음)
+        cs = self.cell_size
+        x0 = (rect.left - self.reach_w) // cs
+        y0 = (rect.top - self.reach_h) // cs
+        x1 = (rect.right - 1) // cs
+        y1 = (rect.bottom - 1) // cs
+        rows = np.arange(y0, y1 + 1, dtype=np.int64) * _ROW_STRIDE
+        starts = np.searchsorted(self.keys, rows + x0, "left").tolist()
+        ends = np.searchsorted(self.keys, rows + x1, "right").tolist()
+        spans = [self.order[start:end] for start, end in zip(starts, ends) if start < end]
+        if not spans:
+            return self.order[:0]
+        return spans[0] if len(spans) == 1 else np.concatenate(spans)
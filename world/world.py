@@ -1,5 +1,24 @@
 import pygame
 import random
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:  # numpy 없으면 순수 파이썬 경로로 동작함
+    np = None
+
+from ui.ui import SurfaceCache
+
+SOLID_TILES = frozenset({1})  # 이동을 막는 타일 값(벽)임
+CHUNK_TILES = 8  # 미리 그려 두는 청크 한 변의 타일 수임
+CHUNK_CACHE_BYTES = 6 * 1024 * 1024  # 맵 하나가 보관하는 청크 서피스 메모리 한도임
+CHUNK_COLORKEY = (255, 0, 255)  # 청크에서 타일 사이 빈 틈 표시용 색임(타일 색에 쓰지 않음)
+WORLD_RESIDENT_CHUNKS = 8  # 스트리밍 월드가 메모리에 들고 있는 생성 청크 최대 수임
+
+# 월드 생성기의 지형 확률표임. (누적 확률 경계, 구간별 타일 값)이고 마지막 값은 나머지 확률임
+HORIZONTAL_TERRAIN = ((0.05, 0.10, 0.15), (1, 4, 5, 0))  # 벽 5%, 흙 5%, 물 5%, 풀 80%
+FOREST_TERRAIN = ((0.15, 0.25, 0.30), (1, 4, 5, 0))  # 나무 15%, 흙 10%, 연못 5%, 풀 70%
+DUNGEON_TERRAIN = ((0.25, 0.35), (1, 4, 0))  # 벽 25%, 흙 10%, 바닥 65%
 
 
 class Camera:
@@ -30,12 +49,29 @@ class Camera:
 
 class TileMap:
     # 타일맵: 타일 충돌/타일 값 확인/렌더링 담당함
-    
-    def __init__(self, tiles, tile_size=32):
-        self.tiles = tiles
+    # 타일 값은 행 우선 순서의 bytearray 한 줄에 담고, 벽 여부는 누적합 표(summed-area table)로 O(1) 확인함
+
+    def __init__(self, tiles, tile_size=32, chunk_tiles=CHUNK_TILES, chunk_budget=CHUNK_CACHE_BYTES, drawable=True):
         self.tile_size = tile_size
         self.rows = len(tiles)
-        self.cols = len(tiles[0]) if tiles else 0
+        self.cols = len(tiles[0]) if self.rows else 0
+        if np is not None and isinstance(tiles, np.ndarray):
+            # 생성기가 돌려준 (행, 열) 배열은 한 번에 복사함
+            self.cells = bytearray(np.ascontiguousarray(tiles, dtype=np.uint8))
+        else:
+            self.cells = bytearray(self.rows * self.cols)
+            for row, values in enumerate(tiles):
+                if len(values) != self.cols:
+                    raise ValueError(f"{row}번째 행 길이가 {len(values)}임({self.cols}이어야 함)")
+                self.cells[row * self.cols:(row + 1) * self.cols] = bytes(values)
+        # 기존 tiles[row][col] 읽기 코드용 행별 뷰임. 타일 바꿀 때는 set_tile 사용함
+        view = memoryview(self.cells)
+        self.tiles = [view[row * self.cols:(row + 1) * self.cols] for row in range(self.rows)]
+        # numpy 있으면 같은 메모리를 (행, 열) 배열로도 봄
+        self.grid = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.rows, self.cols) if np is not None else None
+        self.solid = None  # 벽 마스크임(1이면 벽)
+        self._sat = None  # (rows+1)*(cols+1) 누적합을 평평하게 편 리스트임
+        self._sat_array = None  # 배치 질의용 numpy 누적합 배열임
         
         # 타일 타입별 색상 정의
         self.tile_colors = {
@@ -46,19 +82,81 @@ class TileMap:
             4: (150, 100, 50),   # 흙
             5: (100, 100, 150),  # 물
         }
-    
+        # 청크로 미리 그리는 레이어들임. 기본 타일 레이어가 첫 번째이고 씬이 오버레이를 더 붙일 수 있음
+        # drawable=False면(스트리밍 월드의 청크처럼 직접 그리지 않는 맵) 기본 레이어와 서피스 캐시를 만들지 않음
+        self.layers = []
+        self.base_layer = None
+        if drawable:
+            self.base_layer = ChunkLayer(self, self._draw_base_tile, chunk_tiles=chunk_tiles, budget=chunk_budget)
+
+    def tile_at(self, row, col):
+        return self.cells[row * self.cols + col]
+
+    def set_tile(self, row, col, value):
+        # 타일 바꾸고 벽 마스크/누적합은 다음 충돌 질의 때 다시 만듦
+        self.cells[row * self.cols + col] = value
+        self._sat = None
+        self._sat_array = None
+        for layer in self.layers:
+            layer.invalidate_tile(row, col)
+
+    def _build_solid_tables(self):
+        # 벽 마스크와 누적합 표 만듦. sat[r][c]는 (0,0)~(r-1,c-1) 범위 벽 개수임
+        rows, cols = self.rows, self.cols
+        if np is not None:
+            self.solid = np.isin(self.grid, sorted(SOLID_TILES)).astype(np.uint8)
+            sat = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+            sat[1:, 1:] = self.solid.cumsum(axis=0, dtype=np.int32).cumsum(axis=1, dtype=np.int32)
+            self._sat_array = sat
+            self._sat = sat.ravel().tolist()
+            return
+        self.solid = bytearray(1 if value in SOLID_TILES else 0 for value in self.cells)
+        width = cols + 1
+        sat = [0] * ((rows + 1) * width)
+        for row in range(rows):
+            running = 0
+            base = row * cols
+            for col in range(cols):
+                running += self.solid[base + col]
+                sat[(row + 1) * width + col + 1] = sat[row * width + col + 1] + running
+        self._sat = sat
+
+    def count_solid(self, start_row, start_col, end_row, end_col):
+        # 타일 범위(끝 포함) 안 벽 개수 반환함. 범위가 비면 0임
+        if start_row > end_row or start_col > end_col:
+            return 0
+        if self._sat is None:
+            self._build_solid_tables()
+        sat = self._sat
+        width = self.cols + 1
+        top = start_row * width
+        bottom = (end_row + 1) * width
+        return sat[bottom + end_col + 1] - sat[top + end_col + 1] - sat[bottom + start_col] + sat[top + start_col]
+
     def rect_collides(self, rect):
-        # 사각형 포함 모든 타일 확인함
+        # 사각형이 걸친 타일 중 벽 있는지 누적합으로 확인함
         start_col = max(0, rect.left // self.tile_size)
         end_col = min(self.cols - 1, rect.right // self.tile_size)
         start_row = max(0, rect.top // self.tile_size)
         end_row = min(self.rows - 1, rect.bottom // self.tile_size)
-        
-        for row in range(start_row, end_row + 1):
-            for col in range(start_col, end_col + 1):
-                if self.tiles[row][col] == 1:  # 벽
-                    return True
-        return False
+        return self.count_solid(start_row, start_col, end_row, end_col) > 0
+
+    def rects_collide(self, rects):
+        # 여러 사각형(Rect 또는 (x, y, w, h))의 충돌 여부를 한 번에 계산해 bool 리스트로 반환함
+        if np is None:
+            return [self.rect_collides(pygame.Rect(rect)) for rect in rects]
+        boxes = np.asarray([tuple(rect) for rect in rects], dtype=np.int64).reshape(-1, 4)
+        return self.boxes_collide(boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]).tolist()
+
+    def solid_table(self):
+        # 배치 충돌 질의용 numpy 누적합 배열 반환함(numpy 있을 때만 씀)
+        if self._sat_array is None:
+            self._build_solid_tables()
+        return self._sat_array
+
+    def boxes_collide(self, x, y, w, h):
+        # 사각형 열(x, y, 너비, 높이 정수 배열)의 충돌 여부를 bool 배열로 반환함(numpy 전용)
+        return _boxes_hit(self.solid_table(), self.rows, self.cols, self.tile_size, x, y, w, h)
     
     def rect_on_tile_value(self, rect, tile_value):
         center_x = rect.centerx // self.tile_size
@@ -66,103 +164,437 @@ class TileMap:
         
         if (0 <= center_y < self.rows and 
             0 <= center_x < self.cols):
-            return self.tiles[center_y][center_x] == tile_value
+            return self.tile_at(center_y, center_x) == tile_value
         return False
     
+    def invalidate_chunks(self):
+        # 색 표 등 그리기 설정이 바뀌면 미리 그린 청크를 모두 버림
+        for layer in self.layers:
+            layer.clear()
+
+    def _draw_base_tile(self, chunk, tile_value, tile_rect):
+        # 사각형 타일로 렌더링
+        tile_color = self.tile_colors.get(tile_value, (0, 0, 0))
+        inner = tile_rect.inflate(-2, -2)
+        pygame.draw.rect(chunk, tile_color, inner)
+        # 벽(1)인 경우 테두리 표시
+        if tile_value == 1:
+            pygame.draw.rect(chunk, (50, 50, 50), inner, 1)
+
     def draw(self, surface, offset=None):
-        if offset is None:
-            offset = pygame.Vector2(0, 0)
-        
-        # 화면에 보이는 타일만 그림
-        start_col = max(0, int(offset.x // self.tile_size))
-        end_col = min(self.cols, int((offset.x + surface.get_width()) // self.tile_size) + 1)
-        start_row = max(0, int(offset.y // self.tile_size))
-        end_row = min(self.rows, int((offset.y + surface.get_height()) // self.tile_size) + 1)
-        
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                tile_value = self.tiles[row][col]
-                tile_color = self.tile_colors.get(tile_value, (0, 0, 0))
-                
-                # 타일 위치 계산함
-                tile_x = col * self.tile_size - int(offset.x)
-                tile_y = row * self.tile_size - int(offset.y)
-                
-                # 화면 밖 타일은 그리지 않음
-                if (tile_x + self.tile_size > 0 and tile_x < surface.get_width() and
-                    tile_y + self.tile_size > 0 and tile_y < surface.get_height()):
-                    # 사각형 타일로 렌더링
-                    tile_rect = pygame.Rect(tile_x + 1, tile_y + 1, self.tile_size - 2, self.tile_size - 2)
-                    pygame.draw.rect(surface, tile_color, tile_rect)
-                    # 벽(1)인 경우 테두리 표시
-                    if tile_value == 1:
-                        pygame.draw.rect(surface, (50, 50, 50), tile_rect, 1)
+        # 화면에 보이는 청크만 미리 그려 둔 서피스로 blit함(타일 수와 상관없이 청크 몇 개만 그림)
+        if self.base_layer is not None:
+            self.base_layer.draw(surface, offset)
 
 
-def generate_horizontal_world(chunks=6, width=20, height=10, seed=None):
-    # 수평으로 확장되는 월드 생성함(seed 있으면 항상 같은 맵 생성)
-    rng = random.Random(seed) if seed is not None else random
-    world = []
+class ChunkLayer:
+    # 타일맵을 청크(chunk_tiles×chunk_tiles 타일) 단위로 미리 그려 두는 레이어임
+    # draw_tile(청크 서피스, 타일 값, 청크 안 타일 영역)으로 타일 하나를 그리고,
+    # decorate(청크 서피스, 청크의 월드 영역)가 있으면 타일 위에 덧그림
+    # 청크는 메모리 한도 안에서 LRU로 보관하고 타일이 바뀌면 그 청크만 다시 그림
+
+    def __init__(self, tilemap, draw_tile, alpha=False, decorate=None,
+                 chunk_tiles=CHUNK_TILES, budget=CHUNK_CACHE_BYTES):
+        self.tilemap = tilemap
+        self.draw_tile = draw_tile
+        self.alpha = alpha  # True면 반투명 SRCALPHA 청크, False면 컬러키로 빈 곳 뚫은 불투명 청크임
+        self.decorate = decorate
+        self.chunk_tiles = chunk_tiles
+        self.chunks = SurfaceCache(budget)
+        tilemap.layers.append(self)
+
+    def clear(self):
+        self.chunks.clear()
+
+    def invalidate_tile(self, row, col):
+        self.chunks.discard((row // self.chunk_tiles, col // self.chunk_tiles))
+
+    def chunk_surface(self, chunk_row, chunk_col):
+        key = (chunk_row, chunk_col)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks.put(key, self._bake(chunk_row, chunk_col))
+        return chunk
+
+    def _bake(self, chunk_row, chunk_col):
+        tilemap = self.tilemap
+        ts = tilemap.tile_size
+        row0 = chunk_row * self.chunk_tiles
+        col0 = chunk_col * self.chunk_tiles
+        rows = min(self.chunk_tiles, tilemap.rows - row0)
+        cols = self.chunk_tiles if tilemap.cols is None else min(self.chunk_tiles, tilemap.cols - col0)
+        if self.alpha:
+            chunk = pygame.Surface((cols * ts, rows * ts), pygame.SRCALPHA)
+        else:
+            chunk = pygame.Surface((cols * ts, rows * ts))
+            chunk.fill(CHUNK_COLORKEY)
+        tile_at = tilemap.tile_at
+        for r in range(rows):
+            for c in range(cols):
+                self.draw_tile(chunk, tile_at(row0 + r, col0 + c), pygame.Rect(c * ts, r * ts, ts, ts))
+        if self.decorate is not None:
+            self.decorate(chunk, pygame.Rect(col0 * ts, row0 * ts, cols * ts, rows * ts))
+        if not self.alpha:
+            chunk.set_colorkey(CHUNK_COLORKEY, pygame.RLEACCEL)
+        return chunk
+
+    def draw(self, surface, offset=None):
+        # 화면과 겹치는 청크만 Surface.blits 한 번으로 그림. cols가 None이면 가로로 끝없는 맵임
+        tilemap = self.tilemap
+        if not tilemap.rows or tilemap.cols == 0:
+            return
+        span = self.chunk_tiles * tilemap.tile_size
+        ox = int(offset.x) if offset is not None else 0
+        oy = int(offset.y) if offset is not None else 0
+        start_chunk_col = max(0, ox // span)
+        end_chunk_col = (ox + surface.get_width() - 1) // span
+        if tilemap.cols is not None:
+            end_chunk_col = min((tilemap.cols - 1) // self.chunk_tiles, end_chunk_col)
+        start_chunk_row = max(0, oy // span)
+        end_chunk_row = min((tilemap.rows - 1) // self.chunk_tiles, (oy + surface.get_height() - 1) // span)
+
+        sequence = []
+        for chunk_row in range(start_chunk_row, end_chunk_row + 1):
+            for chunk_col in range(start_chunk_col, end_chunk_col + 1):
+                chunk = self.chunk_surface(chunk_row, chunk_col)
+                sequence.append((chunk, (chunk_col * span - ox, chunk_row * span - oy)))
+        surface.blits(sequence, doreturn=False)
+
+
+def _boxes_hit(sat, rows, cols, tile_size, x, y, w, h, row_base=0):
+    # 누적합 표로 사각형 열의 벽 충돌을 한 번에 계산함. 걸친 타일 범위는 rect_collides와 같음
+    # 여러 표를 세로로 이어 붙인 배열이면 row_base(사각형별 표 시작 행)로 각자의 표를 가리킴
+    start_col = np.maximum(0, x // tile_size)
+    end_col = np.minimum(cols - 1, (x + w) // tile_size)
+    start_row = np.maximum(0, y // tile_size)
+    end_row = np.minimum(rows - 1, (y + h) // tile_size)
+    valid = (start_col <= end_col) & (start_row <= end_row)
+    # 맵 밖 범위는 valid로 걸러내므로 인덱스만 안전하게 자름(np.clip은 작은 배열에서 느려 한쪽씩 자름)
+    c0 = np.minimum(start_col, cols)
+    c1 = np.maximum(end_col + 1, 0)
+    r0 = np.minimum(start_row, rows) + row_base
+    r1 = np.maximum(end_row + 1, 0) + row_base
+    counts = sat[r1, c1] - sat[r0, c1] - sat[r1, c0] + sat[r0, c0]
+    return valid & (counts > 0)
+
+
+class StreamingTileMap:
+    # 가로로 끝없는 타일맵임. 열을 chunk_cols개씩 청크로 나눠 generate_chunk(청크 번호)로 필요할 때 생성함
+    # 카메라 근처 청크는 남기고 나머지는 오래 안 쓴 순서로 버림. 바꾼 타일은 청크별 변경분(deltas)에 남겨
+    # 청크를 다시 생성할 때 덮어씀. 충돌/타일 값 질의는 TileMap과 같은 인터페이스임
+
+    def __init__(self, generate_chunk, chunk_cols, rows, tile_size=32, deltas=None,
+                 max_resident=WORLD_RESIDENT_CHUNKS):
+        self.generate_chunk = generate_chunk
+        self.chunk_cols = chunk_cols
+        self.rows = rows
+        self.cols = None  # 가로 끝 없음
+        self.tile_size = tile_size
+        self.span = chunk_cols * tile_size  # 청크 하나의 가로 픽셀 수임
+        # {청크 번호: {청크 안 칸 번호(row * chunk_cols + col): 타일 값}}임. 저장할 때 그대로 씀
+        self.deltas = deltas if deltas is not None else {}
+        self.max_resident = max_resident
+        self.resident = OrderedDict()  # 청크 번호 -> TileMap(최근 쓴 것이 뒤)임
+        self.pinned = range(0)  # 카메라 근처라 버리지 않는 청크 번호 범위임
+        # 청크별 벽 누적합 표를 청크 번호 순서로 (rows + 1)행씩 세로로 이어 붙인 배열임(numpy 전용)
+        # 청크 하나에 1KB 남짓이라 청크를 버려도 남겨 두어, 화면 밖을 돌아다니는 적의 충돌 질의가
+        # 청크를 다시 생성하지 않고 여러 청크에 걸친 사각형도 한 번에 질의함
+        self.solid_stack = None
+        self.solid_ready = None  # 청크 번호별로 solid_stack에 표가 채워졌는지임
+        self.layers = []
+        self.generated = 0
+        self.evicted = 0
+
+    def chunk(self, index):
+        # 청크 TileMap 반환함. 없으면 생성하고 변경분 덮어씀
+        tilemap = self.resident.get(index)
+        if tilemap is not None:
+            self.resident.move_to_end(index)
+            return tilemap
+        tiles = self.generate_chunk(index)
+        if len(tiles) != self.rows or any(len(row) != self.chunk_cols for row in tiles):
+            raise ValueError(f"{index}번 청크 크기가 {self.rows}x{self.chunk_cols}가 아님")
+        # 청크 맵은 충돌/타일 값 질의에만 쓰고 그리기는 StreamingTileMap의 레이어가 하므로 그리기 준비는 건너뜀
+        tilemap = TileMap(tiles, self.tile_size, drawable=False)
+        for offset, value in self.deltas.get(index, {}).items():
+            tilemap.cells[offset] = value
+        self.resident[index] = tilemap
+        self.generated += 1
+        self._evict()
+        return tilemap
+
+    def _evict(self):
+        # 한도 넘으면 카메라 근처가 아닌 청크부터 오래된 순서로 버림(변경분은 deltas에 남아 있음)
+        if len(self.resident) <= self.max_resident:
+            return
+        for index in list(self.resident):
+            if len(self.resident) <= self.max_resident:
+                break
+            if index not in self.pinned:
+                del self.resident[index]
+                self.evicted += 1
+
+    def focus(self, left, right):
+        # 화면 x 범위(픽셀) 양옆 한 청크까지 미리 생성해 두고 버리지 않게 고정함
+        first = max(0, left // self.span - 1)
+        last = max(first, right // self.span + 1)
+        self.pinned = range(first, last + 1)
+        for index in self.pinned:
+            self.chunk(index)
+        self._evict()
+
+    def tile_at(self, row, col):
+        index, local = divmod(col, self.chunk_cols)
+        return self.chunk(index).tile_at(row, local)
+
+    def set_tile(self, row, col, value):
+        # 청크 타일 바꾸고 변경분에 기록해 청크를 버렸다 다시 만들어도 유지함
+        index, local = divmod(col, self.chunk_cols)
+        self.chunk(index).set_tile(row, local, value)
+        self.deltas.setdefault(index, {})[row * self.chunk_cols + local] = value
+        if self.solid_ready is not None and index < len(self.solid_ready):
+            self.solid_ready[index] = False
+        for layer in self.layers:
+            layer.invalidate_tile(row, col)
+
+    def _chunk_range(self, rect):
+        # 사각형이 걸친 타일 열이 속한 청크 번호 범위임(왼쪽 바깥은 맵 밖이라 뺌)
+        return range(max(0, rect.left // self.span), rect.right // self.span + 1)
+
+    def rect_collides(self, rect):
+        for index in self._chunk_range(rect):
+            if self.chunk(index).rect_collides(rect.move(-index * self.span, 0)):
+                return True
+        return False
+
+    def rects_collide(self, rects):
+        # 청크별로 사각형을 모아 각 청크의 배치 질의 한 번씩으로 계산함
+        rects = [pygame.Rect(rect) for rect in rects]
+        hits = [False] * len(rects)
+        groups = {}
+        for idx, rect in enumerate(rects):
+            for index in self._chunk_range(rect):
+                groups.setdefault(index, []).append(idx)
+        for index, members in groups.items():
+            shift = -index * self.span
+            results = self.chunk(index).rects_collide([rects[idx].move(shift, 0) for idx in members])
+            for idx, hit in zip(members, results):
+                if hit:
+                    hits[idx] = True
+        return hits
+
+    def _fill_solid(self, indices):
+        # 청크 번호 배열 중 아직 표가 없는 청크만 생성해 solid_stack에 채움
+        height = self.rows + 1
+        top = int(indices.max()) + 1
+        if self.solid_ready is None or top > len(self.solid_ready):
+            size = max(top, 2 * len(self.solid_ready) if self.solid_ready is not None else 8)
+            stack = np.zeros((size * height, self.chunk_cols + 1), dtype=np.int32)
+            ready = np.zeros(size, dtype=bool)
+            if self.solid_ready is not None:
+                stack[:len(self.solid_stack)] = self.solid_stack
+                ready[:len(self.solid_ready)] = self.solid_ready
+            self.solid_stack, self.solid_ready = stack, ready
+        missing = indices[~self.solid_ready[indices]]
+        if not len(missing):
+            return
+        for index in np.unique(missing).tolist():
+            self.solid_stack[index * height:(index + 1) * height] = self.chunk(index).solid_table()
+            self.solid_ready[index] = True
+
+    def boxes_collide(self, x, y, w, h):
+        # 사각형 열(정수 배열)의 충돌 여부를 bool 배열로 반환함(numpy 전용)
+        # 사각형마다 걸친 청크를 왼쪽부터 한 칸씩 넘기며, 모든 사각형을 이어 붙인 표에 한 번에 질의함
+        hits = np.zeros(len(x), dtype=bool)
+        index = np.maximum(0, x // self.span)
+        last = (x + w) // self.span
+        members = np.flatnonzero(index <= last)
+        while len(members):
+            chunk_ids = index[members]
+            self._fill_solid(chunk_ids)
+            hits[members] |= _boxes_hit(self.solid_stack, self.rows, self.chunk_cols, self.tile_size,
+                                        x[members] - chunk_ids * self.span, y[members], w[members], h[members],
+                                        chunk_ids * (self.rows + 1))
+            # 이미 벽에 걸린 사각형은 다음 청크를 볼 필요 없음
+            index[members] += 1
+            members = members[(index[members] <= last[members]) & ~hits[members]]
+        return hits
+
+    def rect_on_tile_value(self, rect, tile_value):
+        row = rect.centery // self.tile_size
+        col = rect.centerx // self.tile_size
+        if 0 <= row < self.rows and col >= 0:
+            return self.tile_at(row, col) == tile_value
+        return False
+
+    @staticmethod
+    def export_deltas(deltas):
+        # 변경분을 JSON에 바로 쓸 수 있는 ((청크 번호, ((칸 번호, 값), ...)), ...) 튜플로 복사함
+        return tuple((index, tuple(sorted(cells.items()))) for index, cells in sorted(deltas.items()))
+
+    @staticmethod
+    def import_deltas(data):
+        # export_deltas 결과를 deltas 사전으로 되돌림
+        return {int(index): {int(offset): int(value) for offset, value in cells} for index, cells in data or ()}
+
+    def stats(self):
+        return {
+            "resident": len(self.resident),
+            "generated": self.generated,
+            "evicted": self.evicted,
+            "edited_chunks": len(self.deltas),
+            "solid_tables": int(self.solid_ready.sum()) if self.solid_ready is not None else 0,
+        }
+
+
+# 월드 생성기는 numpy 있으면 칸마다 난수를 뽑는 대신 배열 한 번에 만든 (행, 열) uint8 배열을 반환하고,
+# 없으면 같은 확률표로 행 목록을 만드는 순수 파이썬 경로를 씀. 같은 seed면 항상 같은 맵이지만
+# 두 경로는 난수 생성기가 달라 맵 자체는 다름(타일 분포만 같음)
+
+def _pick_terrain(rand, terrain):
+    # 0~1 난수 배열을 확률표 구간에 맞는 타일 값 배열로 바꿈(rand < 경계[i]인 첫 구간 값임)
+    # 큰 경계부터 덮어써서 임시 배열은 칸당 1바이트 마스크 하나만 씀
+    edges, values = terrain
+    tiles = np.full(rand.shape, values[-1], dtype=np.uint8)
+    for edge, value in reversed(tuple(zip(edges, values))):
+        tiles[rand < edge] = value
+    return tiles
+
+
+def _pick_tile(rand, terrain):
+    # _pick_terrain의 난수 하나짜리 파이썬 버전임
+    edges, values = terrain
+    for edge, value in zip(edges, values):
+        if rand < edge:
+            return value
+    return values[-1]
+
+
+def _python_stream(rng, count):
+    # rng(random.Random 또는 random 모듈)로 random()을 count번 부른 것과 같은 float64 배열을 한 번에 뽑음
+    # 둘 다 MT19937이고 Generator.random()의 53비트 실수 변환도 random.random()과 같아서, rng 상태를 옮겨
+    # 뽑으면 numpy 유무와 상관없이 같은 seed면 같은 맵임. 뽑은 만큼 rng 상태도 진행시킴(입력 기록/재생용)
+    version, internal, gauss = rng.getstate()
+    bit_generator = np.random.MT19937()
+    bit_generator.state = {"bit_generator": "MT19937",
+                           "state": {"key": np.array(internal[:-1], dtype=np.uint32), "pos": internal[-1]}}
+    values = np.random.Generator(bit_generator).random(count)
+    state = bit_generator.state["state"]
+    rng.setstate((version, tuple(state["key"].tolist()) + (int(state["pos"]),), gauss))
+    return values
+
+
+def _chunk_rng(seed, chunk_index):
+    # (시드, 청크 번호)마다 따로 난수 생성기 만듦. 어느 순서로 방문해도 같은 청크는 같은 지형임
+    return random.Random(f"{seed}:{chunk_index}")
+
+
+def _clear_village(chunk, width, height):
+    # 짝수 청크 가운데에만 마을 배치하고 주변 8칸은 풀로 정리함
+    village_col = width // 2
+    village_row = height // 2
+    if not (0 < village_col < width - 1 and 0 < village_row < height - 1):
+        return
+    for dr in [-1, 0, 1]:
+        for dc in [-1, 0, 1]:
+            r, c = village_row + dr, village_col + dc
+            if 0 < r < height - 1 and 0 < c < width - 1:
+                chunk[r][c] = 0  # 풀로 정리
+    chunk[village_row][village_col] = 2  # 마을
+
+
+def generate_horizontal_chunk(chunk_index, width=20, height=10, seed=0):
+    # 수평 월드의 청크 하나(width열) 생성함. 결과는 (seed, chunk_index)로만 정해짐
+    # StreamingTileMap용이라 numpy 있으면 (행, 열) uint8 배열 그대로 돌려줌(값은 파이썬 경로와 같음)
+    if np is None:
+        return _generate_horizontal_chunk_py(chunk_index, width, height, seed)
+    middle = height // 2
+    # 파이썬 경로가 난수를 쓰는 칸(상하 경계, 0번 청크 왼쪽 끝, 중앙 길 행 뺀 나머지)에 같은 순서로 난수 채움
+    draws = np.ones((height, width), dtype=bool)
+    draws[0] = False
+    draws[-1] = False
+    if chunk_index == 0:
+        draws[:, 0] = False
+    draws[middle] = False
+    rand = np.zeros((height, width))
+    rand[draws] = _python_stream(_chunk_rng(seed, chunk_index), int(draws.sum()))
+    chunk = _pick_terrain(rand, HORIZONTAL_TERRAIN)
+    # 길 주변 행은 30% 확률로 벽, 중앙 행은 길임
+    for row in (middle - 1, middle + 1):
+        if 0 <= row < height:
+            chunk[row] = rand[row] < 0.3
+    chunk[middle] = 3
+    # 상하 경계와 월드 왼쪽 끝 경계는 벽임
+    chunk[0] = 1
+    chunk[-1] = 1
+    if chunk_index == 0:
+        chunk[:, 0] = 1
+    if chunk_index % 2 == 0:
+        _clear_village(chunk, width, height)
+    return chunk
+
+
+def _generate_horizontal_chunk_py(chunk_index, width=20, height=10, seed=0):
+    rng = _chunk_rng(seed, chunk_index)
+    chunk = []
     
     # 기본 지형 생성함
     for row in range(height):
-        world_row = []
-        for col in range(width * chunks):
+        chunk_row = []
+        for col in range(width):
             if row == 0 or row == height - 1:  # 상하 경계
-                world_row.append(1)  # 벽
-            elif col == 0 or col == width * chunks - 1:  # 좌우 경계
-                world_row.append(1)  # 벽
+                chunk_row.append(1)  # 벽
+            elif chunk_index == 0 and col == 0:  # 왼쪽 끝 경계
+                chunk_row.append(1)  # 벽
+            elif row == height // 2:  # 중앙 행은 길
+                chunk_row.append(3)  # 길
+            elif row == height // 2 - 1 or row == height // 2 + 1:  # 길 주변
+                chunk_row.append(1 if rng.random() < 0.3 else 0)  # 가끔 벽, 나머지는 풀
             else:
-                # 지형 타입 결정함
-                if row == height // 2:  # 중앙 행은 길
-                    world_row.append(3)  # 길
-                elif row == height // 2 - 1 or row == height // 2 + 1:  # 길 주변
-                    if rng.random() < 0.3:
-                        world_row.append(1)  # 가끔 벽
-                    else:
-                        world_row.append(0)  # 풀
-                else:
-                    # 일반 지형임
-                    rand = rng.random()
-                    if rand < 0.05:
-                        world_row.append(1)  # 5% 확률로 벽
-                    elif rand < 0.1:
-                        world_row.append(4)  # 5% 확률로 흙
-                    elif rand < 0.15:
-                        world_row.append(5)  # 5% 확률로 물
-                    else:
-                        world_row.append(0)  # 80% 확률로 풀
-        
-        world.append(world_row)
-    
-    # 마을 배치함
-    for chunk in range(chunks):
-        chunk_start = chunk * width
-        chunk_end = (chunk + 1) * width
-        
-        # 각 청크에 마을 배치함
-        if chunk % 2 == 0:  # 짝수 청크에만 마을
-            village_col = chunk_start + width // 2
-            village_row = height // 2
-            
-            if (0 < village_col < len(world[0]) - 1 and 
-                0 < village_row < len(world) - 1):
-                world[village_row][village_col] = 2  # 마을
-                
-                # 마을 주변 정리함
-                for dr in [-1, 0, 1]:
-                    for dc in [-1, 0, 1]:
-                        r, c = village_row + dr, village_col + dc
-                        if (0 < r < len(world) - 1 and 
-                            0 < c < len(world[0]) - 1 and
-                            world[r][c] != 2):  # 마을이 아닌 경우
-                            world[r][c] = 0  # 풀로 정리
+                chunk_row.append(_pick_tile(rng.random(), HORIZONTAL_TERRAIN))  # 일반 지형임
+        chunk.append(chunk_row)
     
+    if chunk_index % 2 == 0:
+        _clear_village(chunk, width, height)
+    return chunk
+
+
+def generate_horizontal_world(chunks=6, width=20, height=10, seed=None):
+    # 청크를 이어 붙인 유한 수평 월드 생성함(seed 있으면 항상 같은 맵 생성)
+    # 같은 seed의 StreamingTileMap과 청크 내용이 같고 오른쪽 끝에만 경계 벽이 더 있음
+    if seed is None:
+        seed = random.getrandbits(32)
+    parts = [generate_horizontal_chunk(chunk, width, height, seed) for chunk in range(chunks)]
+    if np is not None:
+        world = np.hstack(parts)
+        world[:, -1] = 1  # 오른쪽 끝 경계 벽
+        return world.tolist()
+    world = [[value for part in parts for value in part[row]] for row in range(height)]
+    for row in world:
+        row[-1] = 1  # 오른쪽 끝 경계 벽
+    return world
+
+
+def _walled_terrain(rng, width, height, terrain):
+    # 가장자리는 벽이고 안쪽 칸은 행 순서대로 난수 하나씩 써서 지형 고름(파이썬 경로와 같은 순서임)
+    world = np.ones((height, width), dtype=np.uint8)
+    inner_h, inner_w = max(0, height - 2), max(0, width - 2)
+    if inner_h and inner_w:
+        rand = _python_stream(rng, inner_h * inner_w).reshape(inner_h, inner_w)
+        world[1:-1, 1:-1] = _pick_terrain(rand, terrain)
     return world
 
 
 def generate_forest_world(width=30, height=20, seed=None):
-    # 숲 테마 월드를 생성합니다(seed 지원).
+    # 숲 테마 월드를 생성합니다(seed 지원). numpy가 있어도 결과와 난수 사용은 파이썬 경로와 같습니다.
+    if np is None:
+        return _generate_forest_world_py(width, height, seed)
+    world = _walled_terrain(random.Random(seed) if seed is not None else random, width, height, FOREST_TERRAIN)
+    world[height // 2, 1:width - 1] = 3  # 중앙 길
+    return world.tolist()
+
+
+def _generate_forest_world_py(width=30, height=20, seed=None):
     rng = random.Random(seed) if seed is not None else random
     world = []
     
@@ -172,15 +604,7 @@ def generate_forest_world(width=30, height=20, seed=None):
             if row == 0 or row == height - 1 or col == 0 or col == width - 1:
                 world_row.append(1)  # 경계 벽
             else:
-                rand = rng.random()
-                if rand < 0.15:
-                    world_row.append(1)  # 15% 확률로 나무(벽)
-                elif rand < 0.25:
-                    world_row.append(4)  # 10% 확률로 흙
-                elif rand < 0.30:
-                    world_row.append(5)  # 5% 확률로 연못
-                else:
-                    world_row.append(0)  # 70% 확률로 풀
+                world_row.append(_pick_tile(rng.random(), FOREST_TERRAIN))  # 나무/흙/연못/풀
         
         world.append(world_row)
     
@@ -193,7 +617,18 @@ def generate_forest_world(width=30, height=20, seed=None):
 
 
 def generate_dungeon_world(width=25, height=25, seed=None):
-    # 던전 테마 월드를 생성합니다(seed 지원).
+    # 던전 테마 월드를 생성합니다(seed 지원). numpy가 있어도 결과와 난수 사용은 파이썬 경로와 같습니다.
+    if np is None:
+        return _generate_dungeon_world_py(width, height, seed)
+    world = _walled_terrain(random.Random(seed) if seed is not None else random, width, height, DUNGEON_TERRAIN)
+    # 중앙 7x7을 외벽 안쪽까지만 바닥으로 비웁니다.
+    center_row, center_col = height // 2, width // 2
+    world[max(1, center_row - 3):min(height - 1, center_row + 4),
+          max(1, center_col - 3):min(width - 1, center_col + 4)] = 0
+    return world.tolist()
+
+
+def _generate_dungeon_world_py(width=25, height=25, seed=None):
     rng = random.Random(seed) if seed is not None else random
     world = []
     
@@ -203,13 +638,7 @@ def generate_dungeon_world(width=25, height=25, seed=None):
             if row == 0 or row == height - 1 or col == 0 or col == width - 1:
                 world_row.append(1)  # 외벽
             else:
-                rand = rng.random()
-                if rand < 0.25:
-                    world_row.append(1)  # 25% 확률로 벽
-                elif rand < 0.35:
-                    world_row.append(4)  # 10% 확률로 흙
-                else:
-                    world_row.append(0)  # 65% 확률로 바닥
+                world_row.append(_pick_tile(rng.random(), DUNGEON_TERRAIN))  # 벽/흙/바닥
         
         world.append(world_row)
     